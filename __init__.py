@@ -1,10 +1,20 @@
 if "bpy" not in locals():
+    from .utils import change_tracker, folder_watch, hash_index, normal_maps
     from . import ui
     from . import operators
     from . import icons
 else:
     import imp
 
+    # Stop the timers, threads and workers of the previous module instances, unregister() normally has already
+    folder_watch.stop()
+    hash_index.shutdown()
+    normal_maps.shutdown()
+    # Before the operators, so that they pick up the reloaded modules
+    imp.reload(change_tracker)
+    imp.reload(folder_watch)
+    imp.reload(hash_index)
+    imp.reload(normal_maps)
     imp.reload(ui)
     imp.reload(operators)
     imp.reload(icons)
@@ -39,6 +49,20 @@ class HATProperties(bpy.types.PropertyGroup):
     latest_tests: bpy.props.StringProperty(
         name="Latest Tests", description="The results of the latest tests run on this asset", options={"HIDDEN"}
     )
+    latest_tests_revision: bpy.props.IntProperty(
+        name="Latest Tests Revision",
+        description="Incremented whenever the latest tests change, so they're only decoded once",
+        options={"HIDDEN"},
+    )
+    timings_sort: bpy.props.EnumProperty(
+        name="Sort Timings",
+        description="How to sort the check timings",
+        default="TIME",
+        items=(
+            ("TIME", "Slowest First", "Show the slowest checks at the top"),
+            ("NAME", "Name", "Sort checks alphabetically"),
+        ),
+    )
 
 
 # Remember what shading type each space used to restore after saving
@@ -91,11 +115,20 @@ def register():
     bpy.types.Scene.hat_props = bpy.props.PointerProperty(type=HATProperties)
     bpy.app.handlers.save_pre.append(pre_save_handler)
     bpy.app.handlers.save_post.append(post_save_handler)
+    bpy.app.handlers.depsgraph_update_post.append(change_tracker.depsgraph_update_handler)
+    bpy.app.handlers.load_post.append(change_tracker.load_post_handler)
+    bpy.app.handlers.load_post.append(operators.check.load_post_handler)
 
 
 def unregister():
+    normal_maps.shutdown()
+    hash_index.shutdown()
+    folder_watch.stop()
     bpy.app.handlers.save_pre.remove(pre_save_handler)
     bpy.app.handlers.save_post.remove(post_save_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(change_tracker.depsgraph_update_handler)
+    bpy.app.handlers.load_post.remove(change_tracker.load_post_handler)
+    bpy.app.handlers.load_post.remove(operators.check.load_post_handler)
 
     icons.previews_unregister()
 
@@ -0,0 +1,176 @@
+"""
+Generate synthetic model assets of controlled size, to benchmark HAT's checks against (see run_benchmarks.py).
+
+Usage:
+    blender -b --factory-startup --python benchmarks/generate_assets.py -- OUTPUT_DIR [--scale small|medium|large]
+        [--objects N] [--materials M] [--nodes K] [--images I] [--orphans O] [--lods L] [--image-size PX]
+
+Each asset is written as OUTPUT_DIR/slug/slug.blend with its images in slug/textures/, i.e. a library that
+hat_batch.py and run_benchmarks.py can both read. The parameters used are stored next to it in slug/benchmark.json.
+Orphans can't be saved (Blender drops datablocks without users when writing), so run_benchmarks.py recreates them
+after loading the file.
+"""
+
+import argparse
+import bpy
+import bmesh
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hat_batch  # noqa: E402
+
+SCALES = {
+    "small": {"objects": 10, "materials": 5, "nodes": 10, "images": 5, "orphans": 0, "lods": 0},
+    "medium": {"objects": 200, "materials": 40, "nodes": 20, "images": 30, "orphans": 50, "lods": 2},
+    "large": {"objects": 2000, "materials": 200, "nodes": 40, "images": 100, "orphans": 500, "lods": 4},
+}
+
+# Node types added to each material on top of the image nodes, cycled through until it has the requested count
+FILLER_NODES = [
+    "ShaderNodeMapping",
+    "ShaderNodeTexCoord",
+    "ShaderNodeSeparateColor",
+    "ShaderNodeNormalMap",
+    "ShaderNodeBump",
+    "ShaderNodeRGBCurve",
+]
+
+MAP_NAMES = ["diff", "rough", "nor_gl", "metal", "ao", "disp"]
+
+
+def clear_file():
+    """Remove the startup scene's contents. Reloading factory settings instead would unregister the add-on."""
+    ids = []
+    for attr in ("objects", "meshes", "materials", "images", "collections", "node_groups", "cameras", "lights"):
+        ids += getattr(bpy.data, attr)
+    ids += bpy.data.worlds
+    bpy.data.batch_remove(ids)
+
+
+def make_mesh(name, segments=16, rings=8):
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=0.5, calc_uvs=True)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def make_images(slug, count, size, textures_dir):
+    images = []
+    for i in range(count):
+        map_name = MAP_NAMES[i % len(MAP_NAMES)]
+        suffix = "" if i < len(MAP_NAMES) else f"_{i // len(MAP_NAMES)}"
+        filename = f"{slug}{suffix}_{map_name}.png"
+        image = bpy.data.images.new(filename, size, size, alpha=False)
+        image.generated_color = ((i * 0.13) % 1, 0.5, 0.5, 1)
+        image.filepath_raw = os.path.join(textures_dir, filename)
+        image.file_format = "PNG"
+        image.save()
+        image.filepath = "//textures/" + filename
+        if map_name != "diff":
+            image.colorspace_settings.name = "Non-Color"
+        images.append(image)
+    return images
+
+
+def make_material(name, images, node_count):
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+    for i, image in enumerate(images):
+        node = nodes.new("ShaderNodeTexImage")
+        node.image = image
+        node.location = (-400, -300 * i)
+        if i == 0:
+            links.new(node.outputs["Color"], bsdf.inputs["Base Color"])
+    for i in range(max(0, node_count - len(nodes))):
+        node = nodes.new(FILLER_NODES[i % len(FILLER_NODES)])
+        node.location = (-800, -200 * i)
+    return mat
+
+
+def add_orphans(count):
+    """Add datablocks without users, spread over a few types"""
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            bpy.data.meshes.new(f"orphan_mesh_{i}")
+        elif kind == 1:
+            bpy.data.materials.new(f"orphan_material_{i}")
+        else:
+            bpy.data.node_groups.new(f"orphan_group_{i}", "ShaderNodeTree")
+
+
+def generate(output_dir, slug, params):
+    """Build an asset with the given parameters and save it as output_dir/slug/slug.blend"""
+    clear_file()
+    asset_dir = os.path.join(output_dir, slug)
+    textures_dir = os.path.join(asset_dir, "textures")
+    os.makedirs(textures_dir, exist_ok=True)
+
+    scene = bpy.context.scene
+    scene.hat_props.asset_type = "model"
+
+    images = make_images(slug, params["images"], params["image_size"], textures_dir)
+    images_per_material = min(len(images), 4)
+    materials = []
+    for i in range(params["materials"]):
+        start = (i * images_per_material) % len(images) if images else 0
+        used = (images[start:] + images)[:images_per_material]
+        materials.append(make_material(f"{slug}_{i}", used, params["nodes"]))
+
+    lod_count = params["lods"] + 1
+    for lod in range(lod_count):
+        collection_name = f"{slug}_LOD{lod}" if params["lods"] else slug
+        collection = bpy.data.collections.new(collection_name)
+        scene.collection.children.link(collection)
+        segments = max(4, 32 >> lod)
+        mesh_cache = {}
+        for i in range(params["objects"]):
+            # Share meshes between a few objects, like instanced scatter in real assets
+            mesh_key = i % 50
+            if mesh_key not in mesh_cache:
+                mesh_cache[mesh_key] = make_mesh(f"{slug}_LOD{lod}_{mesh_key}", segments, max(3, segments // 2))
+            obj = bpy.data.objects.new(f"{slug}_{i}_LOD{lod}", mesh_cache[mesh_key])
+            if materials:
+                obj.data.materials.clear()
+                obj.data.materials.append(materials[i % len(materials)])
+            collection.objects.link(obj)
+
+    blend_file = os.path.join(asset_dir, slug + ".blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_file, compress=False)
+    with open(os.path.join(asset_dir, "benchmark.json"), "w", encoding="utf-8") as f:
+        json.dump(params, f, indent=2)
+    print(f"Generated {blend_file}")
+    return blend_file
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="generate_assets.py", description="Generate synthetic assets for benchmarks")
+    parser.add_argument("output", help="Folder to write the generated library to")
+    parser.add_argument("--scale", choices=SCALES, action="append", help="Preset sizes to generate, default all")
+    parser.add_argument("--slug", default=None, help="Slug of the generated asset, default bench_SCALE")
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"Override the preset {name} count")
+    parser.add_argument("--image-size", type=int, default=256, help="Width and height of generated images")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv)
+    hat_batch.import_addon(register=True)
+    for scale in args.scale or list(SCALES):
+        params = dict(SCALES[scale], image_size=args.image_size)
+        for name in SCALES["small"]:
+            if getattr(args, name) is not None:
+                params[name] = getattr(args, name)
+        generate(os.path.abspath(args.output), args.slug or f"bench_{scale}", params)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:])
@@ -0,0 +1,180 @@
+"""
+Time every HAT check module, the full check run, GLTF export and the change slug search on a library of assets.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/run_benchmarks.py -- LIBRARY [--repeat N] [--output bench.json]
+        [--check NAME ...] [--skip-export] [--compare previous.json]
+
+LIBRARY is any folder of slug/slug.blend assets, e.g. one made by generate_assets.py. Results are written as JSON,
+keyed by asset and timed operation, so the output of two add-on versions can be compared with --compare.
+"""
+
+import argparse
+import bpy
+import importlib
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import hat_batch  # noqa: E402
+import generate_assets  # noqa: E402
+
+ADDON_NAME = hat_batch.ADDON_NAME
+
+
+def addon_module(name):
+    return importlib.import_module(f"{ADDON_NAME}.{name}")
+
+
+def measure(fn, repeat):
+    """Call fn `repeat` times, returning min/median/all run times in seconds"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {"min": min(runs), "median": statistics.median(runs), "runs": runs}
+
+
+def scene_stats():
+    return {
+        "objects": len(bpy.data.objects),
+        "meshes": len(bpy.data.meshes),
+        "materials": len(bpy.data.materials),
+        "nodes": sum(len(m.node_tree.nodes) for m in bpy.data.materials if m.node_tree),
+        "images": len(bpy.data.images),
+        "collections": len(bpy.data.collections),
+    }
+
+
+def open_asset(blend_file):
+    bpy.ops.wm.open_mainfile(filepath=blend_file, load_ui=False)
+    params_file = os.path.join(os.path.dirname(blend_file), "benchmark.json")
+    params = {}
+    if os.path.exists(params_file):
+        with open(params_file, "r", encoding="utf-8") as f:
+            params = json.load(f)
+        generate_assets.add_orphans(params.get("orphans", 0))
+    return params
+
+
+def benchmark_checks(slug, repeat, only=None):
+    """Time each check on its own, with the shared scene index and file snapshot built once, like a real run"""
+    check_module = addon_module("operators.check")
+    scene_index = addon_module("utils.scene_index")
+    fs_snapshot = addon_module("utils.fs_snapshot")
+    asset_type = bpy.context.scene.hat_props.asset_type
+
+    timings = {}
+    timings["scene_index"] = measure(scene_index.build, repeat)
+    index = scene_index.build()
+    image_paths = [bpy.path.abspath(img.filepath) for img in index.images if img.filepath]
+    timings["fs_snapshot"] = measure(lambda: fs_snapshot.build(image_paths), repeat)
+    fs_snapshot.build(image_paths)
+    try:
+        for name, check in check_module.get_checks().items():
+            if (only and name not in only) or not check.applies_to(asset_type):
+                continue
+            timings[f"checks/{check.module_path}"] = measure(lambda: check.check(slug), repeat)
+    finally:
+        scene_index.clear()
+        fs_snapshot.clear()
+
+    timings["run_checks"] = measure(lambda: check_module.run_checks(slug, skip=("unsaved",)), repeat)
+    return timings
+
+
+def benchmark_change_slug(slug, repeat):
+    """Time the search for everything a slug change would touch, without renaming anything"""
+    change_slug = addon_module("operators.change_slug")
+    return measure(lambda: change_slug.change_texture_slug(None, slug, slug + "_renamed", dry_run=True), repeat)
+
+
+def benchmark_export_gltf(blend_file):
+    """Time a GLTF export of a throwaway copy of the asset folder, so the library itself isn't modified"""
+    tmp_dir = tempfile.mkdtemp(prefix="hat_bench_")
+    try:
+        asset_dir = os.path.dirname(blend_file)
+        copy_dir = os.path.join(tmp_dir, os.path.basename(asset_dir))
+        shutil.copytree(asset_dir, copy_dir)
+        open_asset(os.path.join(copy_dir, os.path.basename(blend_file)))
+        return measure(lambda: bpy.ops.hat.export_gltf(), 1)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def compare(previous_file, current):
+    """Print how the median of every timing changed since a previous benchmark run"""
+    with open(previous_file, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+    before = {(a["slug"], key): t["median"] for a in previous["assets"] for key, t in a["timings"].items()}
+    print(f"\nCompared to {previous['addon_version']} ({previous_file}):")
+    for asset in current["assets"]:
+        for key, timing in asset["timings"].items():
+            old = before.get((asset["slug"], key))
+            if old is None:
+                continue
+            ratio = timing["median"] / old if old else float("inf")
+            print(
+                f"{asset['slug']:<20} {key:<45} {old * 1000:>10.2f} ms -> {timing['median'] * 1000:>10.2f} ms"
+                f"  x{ratio:.2f}"
+            )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="run_benchmarks.py", description="Benchmark HAT's checks")
+    parser.add_argument("library", help="Library root folder containing slug/slug.blend assets")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times each operation is timed")
+    parser.add_argument("--output", default=None, help="JSON file to write results to, default stdout")
+    parser.add_argument("--check", action="append", help="Only time these checks (by name)")
+    parser.add_argument("--skip-export", action="store_true", help="Don't time the GLTF export")
+    parser.add_argument("--compare", default=None, help="Previous benchmark JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv)
+    hat_batch.import_addon(register=True)
+    result_cache = addon_module("utils.result_cache")
+    filename_utils = addon_module("utils.filename_utils")
+
+    results = {
+        "addon_version": result_cache.addon_version(),
+        "blender_version": bpy.app.version_string,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": args.repeat,
+        "assets": [],
+    }
+    for blend_file in hat_batch.find_assets(args.library):
+        params = open_asset(blend_file)
+        slug = filename_utils.get_slug()
+        print(f"Benchmarking {slug}", file=sys.stderr)
+        timings = benchmark_checks(slug, args.repeat, args.check)
+        timings["change_slug"] = benchmark_change_slug(slug, args.repeat)
+        asset = {"slug": slug, "file": blend_file, "params": params, "stats": scene_stats(), "timings": timings}
+        if not args.skip_export:
+            try:
+                timings["export_gltf"] = benchmark_export_gltf(blend_file)
+            except Exception as e:
+                asset["export_error"] = f"{type(e).__name__}: {e}"
+        results["assets"].append(asset)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:])
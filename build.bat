@@ -1,6 +1,7 @@
 @echo off
 rm index.json
 python build_readme_checklist.py
+python build_check_registry.py
 blender --factory-startup --command extension build
 blender --factory-startup --command extension server-generate --repo-dir=.
 
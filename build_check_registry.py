@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Script to generate operators/checks/registry.json, the list of checks HAT loads at runtime, from the check modules in
+the operators/checks folder. Like build_readme_checklist.py, the modules are parsed rather than imported, so this
+doesn't need Blender.
+
+Check modules can declare these module level constants, which must be literals:
+    ID_TYPES: Set of ID types (e.g. {"MATERIAL"}) the check reads, see utils/change_tracker.py
+    CACHEABLE: False if results must never be reused, see utils/result_cache.py
+    ASSET_TYPES: Tuple of asset types the check applies to, e.g. ("model",)
+"""
+
+import ast
+import json
+import os
+from build_readme_checklist import get_check_function_docstring
+
+CHECKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "operators", "checks")
+REGISTRY_FILE = os.path.join(CHECKS_DIR, "registry.json")
+
+
+def get_module_constants(file_path, names=("ID_TYPES", "CACHEABLE", "ASSET_TYPES")):
+    """
+    Extract the values of literal module level constants.
+
+    Args:
+        file_path (str): Path to the Python file
+        names (tuple): Constant names to look for
+
+    Returns:
+        dict: {name: value} for the constants that were found
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in names:
+                if isinstance(node.value, ast.Call) and getattr(node.value.func, "id", None) == "set":
+                    constants[name] = set()  # literal_eval doesn't do set()
+                else:
+                    constants[name] = ast.literal_eval(node.value)
+    return constants
+
+
+def generate_registry():
+    """
+    Collect metadata of all check modules.
+
+    Returns:
+        list: One dict per check, sorted by module path
+    """
+    registry = []
+    for root, dirs, files in os.walk(CHECKS_DIR):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for filename in files:
+            if not filename.endswith(".py") or filename == "__init__.py":
+                continue
+            file_path = os.path.join(root, filename)
+            rel_path = os.path.relpath(file_path, CHECKS_DIR)
+            module_path = rel_path[:-3].replace(os.sep, ".")
+            category = rel_path.split(os.sep)[0] if os.sep in rel_path else "general"
+
+            constants = get_module_constants(file_path)
+            docstring = get_check_function_docstring(file_path)
+            id_types = constants.get("ID_TYPES")
+            asset_types = constants.get("ASSET_TYPES")
+            registry.append(
+                {
+                    "name": filename[:-3],
+                    "module": module_path,
+                    "category": category,
+                    "doc": docstring.strip().split("\n")[0].strip() if docstring else "",
+                    "asset_types": list(asset_types) if asset_types is not None else None,
+                    "id_types": sorted(id_types) if id_types is not None else None,
+                    "cacheable": constants.get("CACHEABLE", True),
+                }
+            )
+
+    registry.sort(key=lambda c: c["module"])
+    return registry
+
+
+def update_registry():
+    registry = generate_registry()
+    with open(REGISTRY_FILE, "w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=2)
+        f.write("\n")
+    print(f"{os.path.relpath(REGISTRY_FILE)} updated with {len(registry)} checks")
+
+
+if __name__ == "__main__":
+    update_registry()
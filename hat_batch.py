@@ -0,0 +1,287 @@
+"""
+Run HAT checks on every asset in a library, headless.
+
+Usage:
+    blender -b --factory-startup --python hat_batch.py -- LIBRARY_ROOT [--workers N] [--output results.jsonl]
+    blender -b --factory-startup --python hat_batch.py -- LIBRARY_ROOT --duplicates [--output duplicates.jsonl]
+    blender -b --factory-startup --python hat_batch.py -- LIBRARY_ROOT --export [--formats gltf fbx] [--force]
+    blender -b --factory-startup --python hat_batch.py -- LIBRARY_ROOT --variants [--resolutions 1 2] [--formats jpg]
+
+Every `slug/slug.blend` found under LIBRARY_ROOT is checked by a pool of background Blender worker processes, and
+the results are written as one JSON object per line (to stdout if no --output is given). Assets whose results are all
+still valid in their sidecar cache (see utils/result_cache.py) are reported without loading them at all. Checks marked
+`CACHEABLE = False` describe this Blender session rather than the asset, so they are skipped.
+
+With --duplicates, the textures of all assets are hashed instead (see utils/hash_index.py), and every set of identical
+files in the library is written as one JSON object per line.
+
+With --export, every asset is exported to the upload formats instead (see utils/export_pipeline.py). Formats whose
+inputs haven't changed since they were last exported are skipped without opening the blend file, so after fixing one
+asset only that one is exported again.
+
+With --variants, the lower resolution and web format variants of every asset's textures are written to its _variants
+folder instead (see utils/texture_variants.py). Variants newer than their source are skipped.
+
+The same script is also the entry point of those worker processes (`-- --worker`), see utils/blender_pool.py.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_NAME = "polyhaven_hat"
+
+# Folders inside the library that never contain assets
+SKIP_DIRS = {"_upload", "_variants", "__pycache__", ".git"}
+
+
+def import_addon(register=False):
+    """Import the add-on as a package from this folder, so this script works whether or not it's installed"""
+    if ADDON_NAME in sys.modules:
+        return sys.modules[ADDON_NAME]
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, os.path.join(ADDON_DIR, "__init__.py"), submodule_search_locations=[ADDON_DIR]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = addon
+    spec.loader.exec_module(addon)
+    if register:
+        addon.register()
+    return addon
+
+
+def find_assets(library_root):
+    """Find every slug/slug.blend under the library root"""
+    blend_files = []
+    for root, dirs, files in os.walk(library_root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        blend_name = os.path.basename(root) + ".blend"
+        if blend_name in files:
+            blend_files.append(os.path.join(root, blend_name))
+            dirs[:] = []  # Asset folders don't contain other assets
+    return blend_files
+
+
+def worker_main():
+    """Answer task requests from a BlenderPool, one JSON request per line on stdin"""
+    addon = import_addon(register=True)
+    worker_tasks = importlib.import_module(ADDON_NAME + ".utils.worker_tasks")
+    blender_pool = importlib.import_module(ADDON_NAME + ".utils.blender_pool")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        try:
+            response = {"result": worker_tasks.TASKS[request["task"]](**request["args"])}
+        except Exception as e:
+            traceback.print_exc()
+            response = {"error": f"{type(e).__name__}: {e}"}
+        print(blender_pool.RESULT_PREFIX + json.dumps(response), flush=True)
+
+    addon.unregister()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="hat_batch.py", description="Run HAT checks on every asset in a library")
+    parser.add_argument("library", help="Library root folder containing slug/slug.blend assets")
+    parser.add_argument("--workers", type=int, default=None, help="Number of Blender worker processes")
+    parser.add_argument("--blender", default=None, help="Blender executable for the workers")
+    parser.add_argument("--output", default=None, help="JSON lines file to write results to, default stdout")
+    parser.add_argument("--duplicates", action="store_true", help="Find identical texture files instead of checking")
+    parser.add_argument("--export", action="store_true", help="Export assets instead of checking them")
+    parser.add_argument("--variants", action="store_true", help="Write texture resolution/format variants instead")
+    parser.add_argument("--formats", nargs="+", default=None, help="Formats to export or write variants in")
+    parser.add_argument("--resolutions", nargs="+", type=int, default=None, help="Variant resolutions, in k")
+    parser.add_argument("--force", action="store_true", help="Export even when the outputs are up to date")
+    return parser.parse_args(argv)
+
+
+def find_duplicates(args):
+    """Write every set of identical texture files in the library as one JSON line"""
+    hash_index = importlib.import_module(ADDON_NAME + ".utils.hash_index")
+
+    start_time = time.perf_counter()
+    paths = hash_index.find_textures(args.library)
+    print(f"Found {len(paths)} textures in {args.library}", file=sys.stderr)
+    with hash_index.HashIndex() as index:
+        hashes = index.hashes(paths)
+    duplicates = hash_index.group_duplicates(hashes)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for size, group in duplicates:
+            out.write(json.dumps({"size": size, "wasted": size * (len(group) - 1), "files": group}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    wasted = sum(size * (len(group) - 1) for size, group in duplicates)
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"Found {len(duplicates)} sets of identical files ({wasted / 1024 ** 2:.1f} MB wasted) in {elapsed:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def export_assets(args):
+    """Export every asset whose outputs are outdated, writing one JSON line per asset"""
+    blender_pool = importlib.import_module(ADDON_NAME + ".utils.blender_pool")
+    export_pipeline = importlib.import_module(ADDON_NAME + ".utils.export_pipeline")
+
+    args.formats = args.formats or list(export_pipeline.FORMATS)
+    unknown = set(args.formats) - set(export_pipeline.FORMATS)
+    if unknown:
+        print(f"Unknown formats: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    blend_files = find_assets(args.library)
+    print(f"Found {len(blend_files)} assets in {args.library}", file=sys.stderr)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start_time = time.perf_counter()
+    failed = 0
+    try:
+        to_export = []
+        for blend_file in blend_files:
+            formats = list(args.formats) if args.force else export_pipeline.outdated(blend_file, args.formats)
+            if formats:
+                to_export.append({"blend_file": blend_file, "formats": formats, "force": True})
+            else:
+                out.write(json.dumps({"file": blend_file, "formats": {f: "unchanged" for f in args.formats}}) + "\n")
+        print(f"{len(blend_files) - len(to_export)} assets unchanged since they were last exported", file=sys.stderr)
+
+        if to_export:
+            with blender_pool.BlenderPool(workers=args.workers, blender=args.blender) as pool:
+                for i, (kwargs, result) in enumerate(pool.map("export_file", to_export)):
+                    if isinstance(result, Exception):
+                        failed += 1
+                        line = {"file": kwargs["blend_file"], "error": str(result)}
+                    else:
+                        failed += any(status.startswith("failed") for status in result.values())
+                        line = {"file": kwargs["blend_file"], "formats": result}
+                    out.write(json.dumps(line) + "\n")
+                    out.flush()
+                    print(f"[{i + 1}/{len(to_export)}] {kwargs['blend_file']}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"Exported {len(to_export)} of {len(blend_files)} assets in {elapsed:.1f}s ({failed} failed)",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+def make_variants(args):
+    """Write the missing or outdated texture variants of every asset, one JSON line per texture"""
+    blender_pool = importlib.import_module(ADDON_NAME + ".utils.blender_pool")
+    texture_variants = importlib.import_module(ADDON_NAME + ".utils.texture_variants")
+
+    formats = args.formats or ["png", "jpg"]
+    unknown = set(formats) - set(texture_variants.FORMATS)
+    if unknown:
+        print(f"Unknown formats: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    resolutions = args.resolutions or texture_variants.RESOLUTIONS
+
+    blend_files = find_assets(args.library)
+    jobs = []
+    for blend_file in blend_files:
+        asset_dir = os.path.dirname(blend_file)
+        for job in texture_variants.plan(asset_dir, resolutions, formats):
+            jobs.append(dict(job, slug=os.path.basename(asset_dir)))
+    print(f"{len(jobs)} textures in {len(blend_files)} assets have missing or outdated variants", file=sys.stderr)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start_time = time.perf_counter()
+    failed = 0
+    try:
+        if jobs:
+            with blender_pool.BlenderPool(workers=args.workers, blender=args.blender) as pool:
+                for i, (kwargs, result) in enumerate(pool.map("make_texture_variants", jobs)):
+                    if isinstance(result, Exception):
+                        failed += 1
+                        line = {"file": kwargs["source"], "error": str(result)}
+                    else:
+                        line = {"file": kwargs["source"], "variants": result}
+                    out.write(json.dumps(line) + "\n")
+                    out.flush()
+                    print(f"[{i + 1}/{len(jobs)}] {kwargs['source']}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Wrote variants of {len(jobs)} textures in {elapsed:.1f}s ({failed} failed)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv):
+    args = parse_args(argv)
+    import_addon()
+    if args.duplicates:
+        return find_duplicates(args)
+    if args.export:
+        return export_assets(args)
+    if args.variants:
+        return make_variants(args)
+    blender_pool = importlib.import_module(ADDON_NAME + ".utils.blender_pool")
+    result_cache = importlib.import_module(ADDON_NAME + ".utils.result_cache")
+    worker_tasks = importlib.import_module(ADDON_NAME + ".utils.worker_tasks")
+    checks = importlib.import_module(ADDON_NAME + ".operators.check").get_checks()
+
+    skip = [name for name, check in checks.items() if not check.cacheable]
+
+    blend_files = find_assets(args.library)
+    print(f"Found {len(blend_files)} assets in {args.library}", file=sys.stderr)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start_time = time.perf_counter()
+    failed = 0
+    try:
+        to_check = []
+        for blend_file in blend_files:
+            asset_type, cached = result_cache.lookup(blend_file, checks)
+            expected = {name for name, check in checks.items() if name not in skip and check.applies_to(asset_type)}
+            if cached and set(cached) == expected:
+                slug = os.path.basename(os.path.dirname(blend_file))
+                result = worker_tasks.check_file_result(blend_file, slug, asset_type, cached)
+                out.write(json.dumps(dict(result, cached=True)) + "\n")
+            else:
+                to_check.append({"blend_file": blend_file, "skip": skip})
+        print(f"{len(blend_files) - len(to_check)} assets unchanged since they were last checked", file=sys.stderr)
+
+        if to_check:
+            with blender_pool.BlenderPool(workers=args.workers, blender=args.blender) as pool:
+                for i, (kwargs, result) in enumerate(pool.map("check_file", to_check)):
+                    if isinstance(result, Exception):
+                        failed += 1
+                        result = {"file": kwargs["blend_file"], "error": str(result)}
+                    out.write(json.dumps(result) + "\n")
+                    out.flush()
+                    print(f"[{i + 1}/{len(to_check)}] {kwargs['blend_file']}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Checked {len(blend_files)} assets in {elapsed:.1f}s ({failed} failed)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    if argv[:1] == ["--worker"]:
+        worker_main()
+    else:
+        sys.exit(main(argv))
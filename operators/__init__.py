@@ -7,7 +7,9 @@ if "bpy" not in locals():
     from . import fix_img_db_name
     from . import open_folder
     from . import refresh
+    from . import refresh_folder_structure
     from . import scrub_datablocks
+    from . import select_datablock
 else:
     import importlib
 
@@ -19,16 +21,21 @@ else:
     importlib.reload(fix_img_db_name)
     importlib.reload(open_folder)
     importlib.reload(refresh)
+    importlib.reload(refresh_folder_structure)
     importlib.reload(scrub_datablocks)
+    importlib.reload(select_datablock)
 
 classes = [
     change_slug.HAT_OT_change_slug,
     check.HAT_OT_check,
+    check.HAT_OT_show_results,
     clear_assets.HAT_OT_clear_assets,
     delete_world.HAT_OT_delete_world,
     export_gltf.HAT_OT_export_gltf,
     fix_img_db_name.HAT_OT_fix_img_db_name,
     open_folder.HAT_OT_open_folder,
     refresh.HAT_OT_refresh,
+    refresh_folder_structure.HAT_OT_refresh_folder_structure,
     scrub_datablocks.HAT_OT_scrub_datablocks,
+    select_datablock.HAT_OT_select_datablock,
 ]
@@ -4,6 +4,7 @@ import time
 from bpy.props import StringProperty
 from bpy.types import Operator
 from pathlib import Path
+from ..utils import fs_snapshot, id_collections
 from ..utils.filename_utils import get_slug
 from .. import icons
 
@@ -11,105 +12,17 @@ log = logging.getLogger(__name__)
 
 
 def find_datablocks_with_slug(slug):
-    """Find all datablocks that start with the slug - generic future-proof version"""
+    """Find all datablocks whose name starts with the slug"""
     log.debug(f"Starting search for datablocks with slug: '{slug}'")
-    start_time = time.time()
-    max_search_time = 10.0  # Maximum 10 seconds to prevent hanging
+    start_time = time.perf_counter()
     affected_datablocks = []
 
-    # Dynamically discover all data types in bpy.data that are iterable containers
-    # This approach is future-proof and doesn't hardcode specific types
-    discovered_data_types = []
-
-    for attr_name in dir(bpy.data):
-        # Skip private attributes and known non-data attributes
-        skip_attrs = [
-            "bl_rna",
-            "rna_type",
-            "is_dirty",
-            "is_saved",
-            "use_autopack",
-            "filepath",
-            "version",
-            "is_library_dirty",  # Known non-iterable data attributes
-        ]
-        if attr_name.startswith("_") or attr_name in skip_attrs:
-            continue
-
-        try:
-            attr_value = getattr(bpy.data, attr_name)
-            # Check if it's an iterable container (but not string/bytes)
-            if (
-                hasattr(attr_value, "__iter__")
-                and not isinstance(attr_value, (str, bytes))
-                and not callable(attr_value)
-            ):
-                discovered_data_types.append(attr_name)
-        except (AttributeError, TypeError):
-            continue
-
-    log.debug(f"Discovered {len(discovered_data_types)} data types: {discovered_data_types}")
-
-    for data_type in discovered_data_types:
-        # Check time limit
-        if time.time() - start_time > max_search_time:
-            log.debug(f"Time limit exceeded ({max_search_time}s), stopping search")
-            break
-
-        try:
-            container = getattr(bpy.data, data_type)
-            log.debug(f"Searching bpy.data.{data_type}")
-
-            # Additional safety check - make sure container is actually iterable and has items
-            if not hasattr(container, "__iter__"):
-                continue
-
-            # Check if container has length - if it's empty, skip it
-            try:
-                container_len = len(container)
-                if container_len == 0:
-                    continue
-                log.debug(f"{data_type} has {container_len} items")
-            except (TypeError, AttributeError):
-                # Some containers might not support len(), that's ok
-                pass
-
-            # Safety limits to prevent infinite loops
-            item_count = 0
-            max_items_per_container = 10000  # Reasonable limit for even large scenes
+    for data_type, item in id_collections.iter_datablocks():
+        if item.name.startswith(slug):
+            log.debug(f"Found datablock: {data_type}.{item.name}")
+            affected_datablocks.append({"type": data_type, "name": item.name, "object": item})
 
-            try:
-                for item in container:
-                    item_count += 1
-                    if item_count > max_items_per_container:
-                        log.debug(f"Hit safety limit of {max_items_per_container} items in {data_type}")
-                        break
-
-                    # Additional time check inside loop for very large containers
-                    if item_count % 1000 == 0 and time.time() - start_time > max_search_time:
-                        log.debug(f"Time limit exceeded during {data_type} search")
-                        break
-
-                    # Check if item has a name attribute and starts with slug
-                    if hasattr(item, "name") and hasattr(item.name, "startswith"):
-                        try:
-                            if item.name.startswith(slug):
-                                log.debug(f"Found datablock: {data_type}.{item.name}")
-                                affected_datablocks.append({"type": data_type, "name": item.name, "object": item})
-                        except (AttributeError, TypeError):
-                            # Some objects might have non-string names or other issues
-                            continue
-
-            except (TypeError, AttributeError):
-                # Container might not be properly iterable
-                log.debug(f"Container {data_type} is not properly iterable")
-                continue
-
-        except Exception as e:
-            log.debug(f"Error accessing bpy.data.{data_type}: {e}")
-            continue
-
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     log.debug(
         f"Search completed in {elapsed_time:.2f}s. " f"Found {len(affected_datablocks)} datablocks with slug '{slug}'"
     )
@@ -130,22 +43,19 @@ def find_texture_files_with_slug(slug):
     blend_path = Path(blend_filepath)
     textures_dir = blend_path.parent / "textures"
 
-    if not textures_dir.exists():
+    snapshot = fs_snapshot.get()
+    if not snapshot.exists(textures_dir):
         log.debug(f"No textures folder found at {textures_dir}")
         return affected_files
 
-    if not textures_dir.is_dir():
-        log.debug(f"{textures_dir} exists but is not a directory")
-        return affected_files
-
     log.debug(f"Searching textures folder: {textures_dir}")
 
     try:
-        for filepath in textures_dir.iterdir():
+        for entry in snapshot.listdir(textures_dir):
             # Only process files (not subdirectories)
-            if filepath.is_file() and filepath.name.startswith(slug):
-                log.debug(f"Found matching texture file: {filepath.name}")
-                affected_files.append(str(filepath))
+            if entry.is_file() and entry.name.startswith(slug):
+                log.debug(f"Found matching texture file: {entry.name}")
+                affected_files.append(entry.path)
 
     except Exception as e:
         log.debug(f"Error reading textures directory: {e}")
@@ -3,75 +3,375 @@ import json
 import logging
 import os
 import sys
-from ..utils import dpi_factor
+import time
+from ..utils import change_tracker, dpi_factor, fs_snapshot, result_cache, results as result_store, scene_index
 from ..utils.filename_utils import get_slug
 from ..utils.draw_message_label import draw_message_label
 
 log = logging.getLogger(__name__)
 
 
-def discover_checks():
-    """Discover all check modules in the checks directory and its subfolders"""
-    checks_dir = os.path.join(os.path.dirname(__file__), "checks")
-    check_modules = {}
+CHECKS_DIR = os.path.join(os.path.dirname(__file__), "checks")
+REGISTRY_FILE = os.path.join(CHECKS_DIR, "registry.json")
 
-    # Walk through all subdirectories in checks
-    for root, dirs, files in os.walk(checks_dir):
-        # Skip __pycache__ directories
+
+class CheckInfo:
+    """
+    A check from the registry. The check module itself is only imported the first time the check runs, so enabling
+    HAT doesn't pay for importing every check up front.
+    """
+
+    __slots__ = ("name", "module_path", "category", "doc", "asset_types", "id_types", "cacheable", "_module")
+
+    def __init__(self, name, module, category, doc="", asset_types=None, id_types=None, cacheable=True):
+        self.name = name
+        self.module_path = module
+        self.category = category
+        self.doc = doc
+        self.asset_types = asset_types
+        self.id_types = set(id_types) if id_types is not None else None
+        self.cacheable = cacheable
+        self._module = None
+
+    @property
+    def path(self):
+        return os.path.join(CHECKS_DIR, *self.module_path.split(".")) + ".py"
+
+    @property
+    def module(self):
+        if self._module is None:
+            full_module_name = f"{__package__}.checks.{self.module_path}"
+            if full_module_name in sys.modules:
+                # The add-on is being reloaded, pick up changes to the check too
+                self._module = importlib.reload(sys.modules[full_module_name])
+            else:
+                self._module = importlib.import_module(full_module_name)
+        return self._module
+
+    def applies_to(self, asset_type):
+        return self.asset_types is None or asset_type in self.asset_types
+
+    def check(self, slug):
+        return self.module.check(slug)
+
+
+def load_registry():
+    """Load the checks listed in checks/registry.json, which is generated by build_check_registry.py"""
+    with open(REGISTRY_FILE, "r", encoding="utf-8") as f:
+        return {entry["name"]: CheckInfo(**entry) for entry in json.load(f)}
+
+
+def discover_check(module_path):
+    """Import a check module that isn't in the registry and read its metadata like build_check_registry.py does"""
+    category = module_path.split(".")[0] if "." in module_path else "general"
+    check = CheckInfo(module_path.split(".")[-1], module_path, category, cacheable=False)
+    module = check.module
+    doc = (module.check.__doc__ or "").strip()
+    check.doc = doc.split("\n")[0].strip()
+    asset_types = getattr(module, "ASSET_TYPES", None)
+    check.asset_types = list(asset_types) if asset_types is not None else None
+    id_types = getattr(module, "ID_TYPES", None)
+    check.id_types = set(id_types) if id_types is not None else None
+    return check
+
+
+def find_check_modules():
+    """Return the module paths (e.g. "materials.sss_on") of all check modules in the checks folder"""
+    module_paths = []
+    for root, dirs, files in os.walk(CHECKS_DIR):
         dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for filename in files:
+            if filename.endswith(".py") and filename != "__init__.py":
+                rel_path = os.path.relpath(os.path.join(root, filename), CHECKS_DIR)
+                module_paths.append(rel_path[:-3].replace(os.sep, "."))
+    return sorted(module_paths)
+
+
+_checks = None
+
+
+def get_checks():
+    """
+    Return {check_name: CheckInfo} for all checks, loading the registry on first use. Check modules missing from the
+    registry are imported and run anyway (uncached), so a stale registry never silently skips a check.
+    """
+    global _checks
+    if _checks is None:
+        try:
+            _checks = load_registry()
+        except (OSError, ValueError, TypeError) as e:
+            log.error(f"Failed to load check registry, run build_check_registry.py: {e}")
+            _checks = {}
+        registered = {check.module_path for check in _checks.values()}
+        missing = [module_path for module_path in find_check_modules() if module_path not in registered]
+        if missing:
+            log.warning(f"Checks missing from the check registry, run build_check_registry.py: {', '.join(missing)}")
+        for module_path in missing:
+            try:
+                check = discover_check(module_path)
+            except Exception as e:
+                log.error(f"Failed to import check {module_path}: {e}")
+                continue
+            _checks[check.name] = check
+        if missing:
+            _checks = dict(sorted(_checks.items(), key=lambda item: item[1].module_path))
+    return _checks
+
+
+# Results of the last run, reused on save for checks whose ID_TYPES didn't change since then
+previous_results = {}  # {check_name: (status, messages, targets)}
+previous_context = None  # (slug, asset_type) the previous results belong to
 
-        for file in files:
-            if file.endswith(".py") and file != "__init__.py":
-                # Get relative path from checks directory
-                rel_path = os.path.relpath(root, checks_dir)
-                if rel_path == ".":
-                    # File is in the root checks directory
-                    module_path = file[:-3]  # Remove .py extension
-                else:
-                    # File is in a subdirectory
-                    module_path = rel_path.replace(os.sep, ".") + "." + file[:-3]
 
-                check_name = file[:-3]  # Use just the filename as the check name
+def iter_checks(slug, skip=(), reuse=None, changed=None, use_cache=False):
+    """
+    Run all checks against the currently open file, one at a time.
 
-                try:
-                    if "bpy" not in locals():
-                        m = importlib.import_module(".checks." + module_path, __package__)
-                    else:
-                        full_module_name = "bl_ext.user_default.polyhaven_hat.operators.checks." + module_path
-                        m = sys.modules[full_module_name]
-                        importlib.reload(m)
-                    check_modules[check_name] = m
-                except (ImportError, KeyError) as e:
-                    log.error(f"Failed to load check module {module_path}: {e}")
+    Args:
+        slug (str): The asset slug
+        skip (iterable): Names of checks not to run
+        reuse (dict): Previous {check_name: (status, messages, targets)}, reused for checks unaffected by `changed`
+        changed (set): ID types changed since `reuse` was computed, see change_tracker.pop_changes()
+        use_cache (bool): Reuse and update the persistent result cache next to the blend file. Only valid while the
+            open file has no unsaved changes. Hashes the blend file whenever it changed on disk, so it's not worth it
+            for runs on save, where `reuse` is current anyway.
 
-    return check_modules
+    Yields:
+        tuple: (check_name, (status, messages, targets), seconds), where seconds is None for results that were
+            reused. See utils/results.py for targets.
+    """
+    results = {}
 
+    checks = get_checks()
+    cached = {}
+    asset_type = bpy.context.scene.hat_props.asset_type
+    if use_cache:
+        cached_asset_type, cached = result_cache.lookup(bpy.data.filepath, checks)
+        if cached_asset_type != asset_type:
+            cached = {}
+        log.debug(f"Reusing {len(cached)} cached results")
+
+    # Walk bpy.data once up front, all checks read from this shared index
+    index = scene_index.build()
+    # Likewise list the asset folder once and look up referenced files in parallel
+    image_paths = [bpy.path.abspath(img.filepath) for img in index.images if img.filepath]
+    snapshot = fs_snapshot.build(image_paths)
+    generation = change_tracker.generation
+    try:
+        for check_name, check in checks.items():
+            if check_name in skip or not check.applies_to(asset_type):
+                continue
+            if check_name in cached:
+                results[check_name] = cached[check_name]
+                yield check_name, results[check_name], None
+                continue
+            if reuse and check_name in reuse and not change_tracker.needs_rerun(check, changed):
+                results[check_name] = reuse[check_name]
+                yield check_name, results[check_name], None
+                continue
+
+            if generation != change_tracker.generation:
+                # Datablocks were edited in between checks (modal runs), don't hand out stale references
+                scene_index.build()
+                generation = change_tracker.generation
+            start_time = time.perf_counter()
+            results[check_name] = result_store.normalize(check.check(slug))
+            yield check_name, results[check_name], time.perf_counter() - start_time
+
+        if use_cache and len(cached) < len(results) and not bpy.data.is_dirty:
+            result_cache.store(bpy.data.filepath, asset_type, results, checks, image_paths, snapshot)
+    finally:
+        scene_index.clear()
+        fs_snapshot.clear()
+
+
+def run_checks(slug, skip=(), reuse=None, changed=None, use_cache=False, timings=None):
+    """
+    Run all checks against the currently open file, see iter_checks() for arguments.
+
+    Args:
+        timings (dict): If given, filled with {check_name: seconds}, or None for results that were reused
+
+    Returns:
+        dict: {check_name: (status, messages, targets)}
+    """
+    results = {}
+    for check_name, result, seconds in iter_checks(slug, skip, reuse, changed, use_cache):
+        results[check_name] = result
+        if timings is not None:
+            timings[check_name] = seconds
+    return results
 
-checks = discover_checks()
 
 import bpy
+from bpy.app.handlers import persistent
+
+
+@persistent
+def load_post_handler(dummy):
+    """Loading a file removes modal handlers, so any run that was in progress is gone"""
+    HAT_OT_check.is_running = False
+    previous_results.clear()
+    result_store.clear()
 
 
 class HAT_OT_check(bpy.types.Operator):
     bl_idname = "hat.check"
-    bl_label = "Test results:"
+    bl_label = "Check"
     bl_description = "Run all checks"
 
     on_save: bpy.props.BoolProperty(default=False)
 
-    tests = []  # [["STATUS", [messages]]]
+    # Seconds of checking per timer tick, the UI stays responsive in between
+    time_slice = 0.05
+
+    is_running = False
 
     @classmethod
     def poll(cls, context):
         return bpy.data.is_saved
 
+    def invoke(self, context, event):
+        global previous_context
+
+        if HAT_OT_check.is_running:
+            return {"CANCELLED"}
+
+        # Runs on save have current previous_results, only manual runs (e.g. right after loading) need the cache
+        use_cache = not bpy.data.is_dirty and not self.on_save
+        context.scene.hat_props.test_on_save = True
+
+        slug = get_slug()
+
+        changed = change_tracker.pop_changes()
+        context_key = (slug, context.scene.hat_props.asset_type)
+        if not self.on_save or context_key != previous_context:
+            # Manual runs always check everything
+            changed = None
+            previous_results.clear()
+        previous_context = context_key
+
+        # No need to check for unsaved changes while we're busy saving.
+        skip = ["unsaved"] if self.on_save else []
+
+        self.results = result_store.ResultStore()
+        self.done = 0
+        asset_type = context.scene.hat_props.asset_type
+        self.total = len([n for n, c in get_checks().items() if n not in skip and c.applies_to(asset_type)])
+        self.start_time = time.perf_counter()
+        self.run = iter_checks(slug, skip=skip, reuse=previous_results, changed=changed, use_cache=use_cache)
+
+        if context.window is None:
+            # No UI to keep responsive (e.g. running in the background), check everything now
+            self.step(context, float("inf"))
+            return {"FINISHED"}
+
+        HAT_OT_check.is_running = True
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(0.01, window=context.window)
+        wm.progress_begin(0, max(1, self.total))
+        wm.modal_handler_add(self)
+        self.update_status(context)
+        return {"RUNNING_MODAL"}
+
+    def step(self, context, budget):
+        """Run checks until the time budget is used up. Returns True once all checks are done"""
+        deadline = time.perf_counter() + budget
+        while time.perf_counter() < deadline:
+            try:
+                check_name, result, seconds = next(self.run)
+            except StopIteration:
+                self.finish(context)
+                return True
+            previous_results[check_name] = result
+            self.results.add(check_name, result, seconds)
+            self.done += 1
+        return False
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            self.run.close()
+            self.end(context)
+            self.store(context, running=False)
+            self.report({"WARNING"}, f"Checks cancelled after {self.done}/{self.total}")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        try:
+            finished = self.step(context, self.time_slice)
+        except Exception:
+            self.end(context)
+            raise
+        if finished:
+            return {"FINISHED"}
+
+        self.store(context, running=True)
+        self.update_status(context)
+        return {"RUNNING_MODAL"}
+
+    def update_status(self, context):
+        context.window_manager.progress_update(self.done)
+        context.workspace.status_text_set(f"HAT: Checking ({self.done}/{self.total}), press Esc to cancel")
+
+    def store(self, context, running):
+        """Store tests in scene prop, where the results panel picks them up"""
+        self.results.total_time = time.perf_counter() - self.start_time
+        self.results.running = running
+        self.results.progress = (self.done, self.total)
+        result_store.publish(context.scene, self.results)
+        if context.screen:
+            for area in context.screen.areas:
+                if area.type == "PROPERTIES":
+                    area.tag_redraw()
+
+    def end(self, context):
+        HAT_OT_check.is_running = False
+        if context.window is None:
+            return
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+    def finish(self, context):
+        self.end(context)
+
+        if self.results.passed():
+            self.results.add("", ("SUCCESS", ["All checks passed!"], [None]))
+        self.store(context, running=False)
+
+        if self.on_save:
+            failed_tests = list((r for r in self.results.records if r.status != "SUCCESS"))
+            if len(failed_tests) == 0:
+                # No problems, no popup.
+                return
+
+        if context.window is not None:
+            bpy.ops.hat.show_results("INVOKE_DEFAULT", on_save=self.on_save)
+
+
+class HAT_OT_show_results(bpy.types.Operator):
+    bl_idname = "hat.show_results"
+    bl_label = "Test results:"
+    bl_description = "Show the results of the latest check run"
+
+    on_save: bpy.props.BoolProperty(default=False)
+
     def draw(self, context):
+        store = result_store.get_store(context.scene)
+        if store is None:
+            return
         col = self.layout.column(align=True)
-        for status, messages in self.tests:
-            if status == "SUCCESS" and self.on_save:
+        for record in store.messages():
+            if record.status == "SUCCESS" and self.on_save:
                 continue
-            for message in messages:
-                draw_message_label(col, message, status)
+            draw_message_label(col, record.message, record.status, record.target)
+        row = col.row()
+        row.alignment = "RIGHT"
+        row.enabled = False
+        row.label(text=f"Checked in {store.total_time:.2f}s")
         if self.on_save:
             row = col.row()
             row.alignment = "RIGHT"
@@ -83,36 +383,6 @@ class HAT_OT_check(bpy.types.Operator):
             )
 
     def invoke(self, context, event):
-        self.tests = []  # Reset after rerun
-        context.scene.hat_props.test_on_save = True
-
-        slug = get_slug()
-
-        for check_name, check in checks.items():
-            if self.on_save and check_name == "unsaved":
-                # No need to check for unsaved changes while we're busy saving.
-                continue
-            self.tests.append(check.check(slug))
-
-        all_success = True
-        for status, messages in self.tests:
-            if status != "SUCCESS":
-                for message in messages:
-                    if message != "File contains unsaved changes":
-                        all_success = False
-                        break
-        if all_success:
-            self.tests.append(["SUCCESS", ["All checks passed!"]])
-
-        # Store tests in scene prop
-        context.scene.hat_props.latest_tests = json.dumps(self.tests)
-
-        if self.on_save:
-            failed_tests = list((t for t in self.tests if t[0] != "SUCCESS"))
-            if len(failed_tests) == 0:
-                # No problems, no popup.
-                return {"FINISHED"}
-
         return context.window_manager.invoke_props_dialog(self, width=round(350 * dpi_factor.dpi_factor()))
 
     def execute(self, context):
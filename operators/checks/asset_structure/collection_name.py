@@ -1,5 +1,8 @@
 import bpy
 
+ID_TYPES = {"COLLECTION"}
+ASSET_TYPES = ("model",)
+
 
 def check(slug):
     """Model collection name should match the asset slug"""
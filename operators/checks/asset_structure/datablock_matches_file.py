@@ -1,4 +1,7 @@
 import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"IMAGE"}
 
 
 def check(slug):
@@ -6,7 +9,7 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for img in bpy.data.images:
+    for img in scene_index.get().images:
         if not img.filepath:
             continue
         fn = bpy.path.basename(img.filepath)
@@ -1,5 +1,7 @@
 import bpy
 
+ID_TYPES = {"COLLECTION"}
+
 
 def check(slug):
     """Geometry nodes collections are properly structured with LOD0 or static collections"""
@@ -1,4 +1,7 @@
 import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"COLLECTION", "OBJECT"}
 
 
 def check(slug):
@@ -8,9 +11,10 @@ def check(slug):
 
     collection_lod_exists = f"{slug}_LOD0" in bpy.data.collections
 
-    for obj in bpy.data.objects:
-        if obj.name.endswith("_LOD0") and not collection_lod_exists:
-            return "ERROR", ["LOD0 collection not found for slug: " + slug]
+    if not collection_lod_exists:
+        for obj in scene_index.get().objects:
+            if obj.name.endswith("_LOD0"):
+                return "ERROR", ["LOD0 collection not found for slug: " + slug]
 
     if collection_lod_exists:
         main_collection = bpy.data.collections[slug]
@@ -1,17 +1,11 @@
-import bpy
+from ....utils import scene_index
 
 
 def check(slug):
     """No other asset contamination in the file"""
-    result = "SUCCESS"
-    messages = []
-
     # There's currently no api call for listing local assets, so we need to iterate through all datablocks...
-    for attr in dir(bpy.data):
-        collection = getattr(bpy.data, attr)
-        if hasattr(collection, "__iter__"):
-            for block in collection:
-                if hasattr(block, "asset_data") and block.asset_data:
-                    result = "ERROR"
-                    messages.append("Other asset datablocks found.")
-    return result, messages
+    for collection in scene_index.get().id_collections.values():
+        for block in collection:
+            if block.asset_data:
+                return "ERROR", ["Other asset datablocks found."]
+    return "SUCCESS", []
@@ -1,5 +1,7 @@
 import bpy
 
+ID_TYPES = {"WORLD"}
+
 
 def check(slug):
     """No world or HDRI data blocks should be present in the asset"""
@@ -1,5 +1,7 @@
 import bpy
 
+ID_TYPES = {"SCENE"}
+
 
 def check(slug):
     """File should contain only one scene and one view layer"""
@@ -1,5 +1,8 @@
 import bpy
 
+ID_TYPES = {"OBJECT", "COLLECTION"}
+ASSET_TYPES = ("texture",)
+
 
 def check(slug):
     """Texture assets should only have "Plane" and "Sphere" objects"""
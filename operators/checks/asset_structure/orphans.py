@@ -1,4 +1,5 @@
-import bpy
+from ....utils import scene_index
+from ....utils.id_collections import find_orphans
 
 
 def check(slug):
@@ -6,17 +7,12 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for data_type in dir(bpy.data):
-        if hasattr(getattr(bpy.data, data_type), "__iter__"):
-            l = list(getattr(bpy.data, data_type))
-            for item in l:
-                if not hasattr(item, "users"):
-                    continue
-                if item.users == 0:
-                    if data_type == "images" and item.name == "Render Result":
-                        continue
-                    dt_name = data_type.replace("_", " ")
-                    result = "ERROR"
-                    messages.append(f"Unused {dt_name}: {item.name}")
+    index = scene_index.get()
+    for data_type, item in find_orphans(index.id_collections, index.user_map):
+        if data_type == "images" and item.name == "Render Result":
+            continue
+        dt_name = data_type.replace("_", " ")
+        result = "ERROR"
+        messages.append(f"Unused {dt_name}: {item.name}")
 
     return result, messages
@@ -1,5 +1,5 @@
 import bpy
-import os
+from ....utils import fs_snapshot
 
 
 def check(slug):
@@ -7,8 +7,8 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    if bpy.data.filepath:
-        file_size = os.path.getsize(bpy.data.filepath)
+    file_size = fs_snapshot.get().getsize(bpy.data.filepath) if bpy.data.filepath else None
+    if file_size is not None:
 
         if bpy.context.scene.hat_props.asset_type == "texture":
             warn_file_size = 300  # kB
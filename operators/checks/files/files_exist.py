@@ -1,5 +1,5 @@
 import bpy
-import os
+from ....utils import fs_snapshot, scene_index
 
 
 def check(slug):
@@ -7,10 +7,11 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for img in bpy.data.images:
+    snapshot = fs_snapshot.get()
+    for img in scene_index.get().images:
         if not img.filepath:
             continue
-        if not os.path.exists(bpy.path.abspath(img.filepath)):
+        if not snapshot.exists(bpy.path.abspath(img.filepath)):
             result = "ERROR"
             messages.append(f"'{bpy.path.basename(img.filepath)}' does not exist")
 
@@ -1,6 +1,8 @@
 import bpy
 from ....utils.fetch_textures import fetch_textures
 
+ID_TYPES = {"IMAGE", "MATERIAL", "NODETREE"}
+
 
 def check(slug):
     """All texture paths should be relative and point to the textures folder"""
@@ -1,5 +1,8 @@
 import bpy
 
+# Depends on the state of this Blender session rather than the asset, so results must never be reused
+CACHEABLE = False
+
 
 def check(slug):
     if bpy.data.is_dirty:
@@ -0,0 +1,32 @@
+import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT"}
+
+
+def check(slug):
+    """Objects should have applied rotation"""
+    result = "SUCCESS"
+    messages = []
+
+    ignored_types = [
+        "CAMERA",
+        "LIGHT",
+        "EMPTY",
+    ]
+
+    transforms = scene_index.get().transforms
+    objects = transforms.select(transforms.unapplied_rotation() & transforms.of_type(exclude=ignored_types))
+
+    if not objects:
+        return result, messages
+
+    result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "QUESTION"
+    if len(objects) <= 5:
+        for obj in objects:
+            messages.append(f"{obj.name} rotation not applied")
+        return result, messages, objects
+    else:
+        messages.append(f"{len(objects)} objects have unapplied rotation")
+
+    return result, messages
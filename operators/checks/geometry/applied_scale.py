@@ -1,13 +1,15 @@
 import bpy
-from mathutils import Vector
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT"}
 
 
 def check(slug):
     """All objects have applied scale (1.0) to ensure no unexpected behaviour"""
     result = "SUCCESS"
     messages = []
+    targets = []
 
-    one = Vector((1, 1, 1))
     ignored_types = [
         "CAMERA",
         "LIGHT",
@@ -15,9 +17,10 @@ def check(slug):
 
     severity = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
 
-    for obj in bpy.data.objects:
-        if obj.scale != one and obj.type not in ignored_types:
-            result = severity
-            messages.append(obj.name + " scale not applied")
+    transforms = scene_index.get().transforms
+    for obj in transforms.select(transforms.unapplied_scale() & transforms.of_type(exclude=ignored_types)):
+        result = severity
+        messages.append(obj.name + " scale not applied")
+        targets.append(obj)
 
-    return result, messages
+    return result, messages, targets
@@ -0,0 +1,25 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT"}
+
+
+def check(slug):
+    """Objects should not have delta transforms, which are easily missed"""
+    result = "SUCCESS"
+    messages = []
+
+    transforms = scene_index.get().transforms
+    objects = transforms.select(transforms.delta_transforms())
+
+    if not objects:
+        return result, messages
+
+    result = "WARNING"
+    if len(objects) <= 5:
+        for obj in objects:
+            messages.append(f"{obj.name} has delta transforms")
+        return result, messages, objects
+    else:
+        messages.append(f"{len(objects)} objects have delta transforms")
+
+    return result, messages
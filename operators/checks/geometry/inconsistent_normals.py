@@ -0,0 +1,21 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH"}
+ASSET_TYPES = ("model",)
+
+
+def check(slug):
+    """Adjacent faces should have consistent normals, none should be flipped"""
+    result = "SUCCESS"
+    messages = []
+    targets = []
+
+    index = scene_index.get()
+    for mesh in index.object_meshes():
+        count = index.mesh_arrays(mesh).inconsistent_normals()
+        if count:
+            result = "WARNING"
+            messages.append(f"{mesh.name} has {count} edges between faces with inconsistent normals")
+            targets.append(mesh)
+
+    return result, messages, targets
@@ -0,0 +1,21 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH"}
+ASSET_TYPES = ("model",)
+
+
+def check(slug):
+    """Meshes should not have loose vertices that aren't part of any edge"""
+    result = "SUCCESS"
+    messages = []
+    targets = []
+
+    index = scene_index.get()
+    for mesh in index.object_meshes():
+        count = index.mesh_arrays(mesh).loose_verts()
+        if count:
+            result = "WARNING"
+            messages.append(f"{mesh.name} has {count} loose vertices")
+            targets.append(mesh)
+
+    return result, messages, targets
@@ -0,0 +1,27 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH"}
+ASSET_TYPES = ("model",)
+
+
+def check(slug):
+    """Meshes should not have non-manifold edges shared by more than two faces, or wire edges without faces"""
+    result = "SUCCESS"
+    messages = []
+    targets = []
+
+    index = scene_index.get()
+    for mesh in index.object_meshes():
+        arrays = index.mesh_arrays(mesh)
+        non_manifold = arrays.non_manifold_edges()
+        if non_manifold:
+            result = "WARNING"
+            messages.append(f"{mesh.name} has {non_manifold} edges shared by more than two faces")
+            targets.append(mesh)
+        wire = arrays.wire_edges()
+        if wire:
+            result = "WARNING"
+            messages.append(f"{mesh.name} has {wire} wire edges")
+            targets.append(mesh)
+
+    return result, messages, targets
@@ -1,5 +1,7 @@
 import bpy
-from mathutils import Vector
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT"}
 
 
 def check(slug):
@@ -7,22 +9,17 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    zero = Vector((0, 0, 0))
-
-    objects = []
-
-    for obj in bpy.data.objects:
-        if obj.type == "MESH":
-            if obj.location != zero:
-                result = "WARNING" if bpy.context.scene.hat_props.asset_type == "texture" else "QUESTION"
-                objects.append(obj)
+    transforms = scene_index.get().transforms
+    objects = transforms.select(transforms.off_origin() & transforms.of_type(include=["MESH"]))
 
     if not objects:
         return result, messages
 
+    result = "WARNING" if bpy.context.scene.hat_props.asset_type == "texture" else "QUESTION"
     if len(objects) <= 5:
         for obj in objects:
             messages.append(f"{obj.name} is not at origin")
+        return result, messages, objects
     else:
         messages.append(f"{len(objects)} objects are not at origin")
 
@@ -0,0 +1,20 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT"}
+
+
+def check(slug):
+    """Parented objects should not have a parent inverse matrix, so their transforms are what they appear to be"""
+    result = "SUCCESS"
+    messages = []
+    targets = []
+
+    transforms = scene_index.get().transforms
+    for obj in transforms.select(transforms.parent_inverse()):
+        if obj.parent is None:
+            continue  # Left over from clearing the parent, has no effect
+        result = "WARNING"
+        messages.append(f"{obj.name} has a parent inverse matrix, parent it without inverse")
+        targets.append(obj)
+
+    return result, messages, targets
@@ -1,14 +1,18 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH", "KEY"}
 
 
 def check(slug):
     """Objects should not have shape keys which may cause issues for GLTF export"""
     result = "SUCCESS"
     messages = []
+    targets = []
 
-    for obj in bpy.data.objects:
+    for obj in scene_index.get().objects:
         if hasattr(obj, "data") and hasattr(obj.data, "shape_keys") and obj.data.shape_keys:
             result = "WARNING"
             messages.append(f"Object '{obj.name}' has shape keys")
+            targets.append(obj)
 
-    return result, messages
+    return result, messages, targets
@@ -1,5 +1,7 @@
 import bpy
 
+ID_TYPES = {"SCENE"}
+
 
 def check(slug):
     """Scene unit scale is set to 1.0 and is Metric"""
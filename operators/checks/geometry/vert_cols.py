@@ -1,15 +1,18 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH"}
 
 
 def check(slug):
     """Objects should not have vertex colors which may break GLTF export"""
     result = "SUCCESS"
     messages = []
+    targets = []
 
-    for obj in bpy.data.objects:
-        if obj.type == "MESH":
-            if len(obj.data.vertex_colors) != 0:
-                result = "WARNING"
-                messages.append(obj.name + " has vertex colors, this may break GLTF export.")
+    for obj in scene_index.get().objects_of_type("MESH"):
+        if len(obj.data.vertex_colors) != 0:
+            result = "WARNING"
+            messages.append(obj.name + " has vertex colors, this may break GLTF export.")
+            targets.append(obj)
 
-    return result, messages
+    return result, messages, targets
@@ -0,0 +1,21 @@
+from ....utils import scene_index
+
+ID_TYPES = {"OBJECT", "MESH"}
+ASSET_TYPES = ("model",)
+
+
+def check(slug):
+    """Meshes should not have faces with zero area"""
+    result = "SUCCESS"
+    messages = []
+    targets = []
+
+    index = scene_index.get()
+    for mesh in index.object_meshes():
+        count = index.mesh_arrays(mesh).zero_area_faces()
+        if count:
+            result = "WARNING"
+            messages.append(f"{mesh.name} has {count} zero area faces")
+            targets.append(mesh)
+
+    return result, messages, targets
@@ -1,4 +1,6 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,16 +8,16 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    materials = list((m for m in bpy.data.materials if m.users > 0 and m.use_nodes))
-
-    for mat in materials:
-        for node in mat.node_tree.nodes:
-            if node.type == "BSDF_PRINCIPLED":
-                i = node.inputs["Specular IOR Level"]
-                if len(i.links) == 0 and not (0.4 <= i.default_value <= 0.6):
-                    result = "WARNING"
-                    messages.append(
-                        f"Material '{mat.name}' Specular IOR value on node '{node.name}' is {i.default_value}"
-                    )
+    index = scene_index.get()
+    for mat, node in index.nodes_of_type("BSDF_PRINCIPLED"):
+        if mat.users == 0:
+            continue
+        graph = index.material_graphs[mat]
+        i = node.inputs["Specular IOR Level"]
+        if len(i.links) == 0 and not (0.4 <= i.default_value <= 0.6):
+            result = "WARNING"
+            messages.append(
+                f"Material '{mat.name}' Specular IOR value on node '{graph.name(node)}' is {i.default_value}"
+            )
 
     return result, messages
@@ -1,10 +1,13 @@
 import bpy
 
+ID_TYPES = {"MATERIAL"}
+
 
 def check(slug):
     """Material names should match the asset slug"""
     result = "SUCCESS"
     messages = []
+    targets = []
 
     materials = list((m for m in bpy.data.materials if m.users > 0 and not m.is_grease_pencil))
 
@@ -13,12 +16,13 @@ def check(slug):
             if not mat.name.startswith(slug):
                 result = "WARNING"
                 messages.append(f"Material '{mat.name}' doesn't start with slug")
+                targets.append(mat)
     else:
         if len(materials) == 0:
             return "ERROR", ["No material found"]
         if len(materials) > 1:
             return "ERROR", ["More than one material present"]
         if materials[0].name != slug:
-            return "ERROR", ["Material name not the same as slug"]
+            return "ERROR", ["Material name not the same as slug"], [materials[0]]
 
-    return result, messages
+    return result, messages, targets
@@ -1,4 +1,7 @@
 import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,11 +9,9 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                if node.type == "MATH":
-                    result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
-                    messages.append(f"Material '{mat.name}' contains math node '{node.name}'")
+    index = scene_index.get()
+    for mat, node in index.nodes_of_type("MATH"):
+        result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
+        messages.append(f"Material '{mat.name}' contains math node '{index.material_graphs[mat].name(node)}'")
 
     return result, messages
@@ -1,4 +1,7 @@
 import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,12 +9,10 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                mix_types = ["MIX", "MIX_RGB", "MIX_SHADER"]
-                if node.type in mix_types:
-                    result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
-                    messages.append(f"Material '{mat.name}' contains mix node '{node.name}'")
+    mix_types = ["MIX", "MIX_RGB", "MIX_SHADER"]
+    index = scene_index.get()
+    for mat, node in index.nodes_of_type(*mix_types):
+        result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
+        messages.append(f"Material '{mat.name}' contains mix node '{index.material_graphs[mat].name(node)}'")
 
     return result, messages
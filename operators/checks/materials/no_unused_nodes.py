@@ -1,4 +1,6 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,17 +8,9 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                if node.outputs:
-                    node_is_connected = False
-                    for output in node.outputs:
-                        if output.is_linked:
-                            node_is_connected = True
-                            break
-                    if not node_is_connected:
-                        result = "ERROR"
-                        messages.append(f"Material '{mat.name}' has unused node '{node.name}'")
+    for mat, graph in scene_index.get().material_graphs.items():
+        for node in graph.unused():
+            result = "ERROR"
+            messages.append(f"Material '{mat.name}' has unused node '{graph.name(node)}'")
 
     return result, messages
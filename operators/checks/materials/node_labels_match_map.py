@@ -1,35 +1,37 @@
 import bpy
 import logging
-from ....utils.filename_utils import get_map_name
+from ....utils.filename_utils import classify_texture
+from ....utils import scene_index
 from ....utils import standard_map_names
 
 log = logging.getLogger(__name__)
 
+ID_TYPES = {"MATERIAL", "NODETREE", "IMAGE"}
+
 
 def check(slug):
     """Image node labels (if set) should match map names"""
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                if node.type == "TEX_IMAGE" and node.label:
-                    if not node.image:
-                        result = "ERROR"
-                        messages.append(f"Material '{mat.name}' has unused image node")
-                    elif not node.image.filepath:
-                        result = "ERROR"
-                        messages.append(f"'{node.image.name}' has no filepath")
-                    else:
-                        map_name = get_map_name(node.image.filepath, slug)
-                        if node.label.lower() in standard_map_names.aliases:
-                            label_map_name = standard_map_names.aliases[node.label.lower()]
-                        else:
-                            label_map_name = node.label.lower()
-                        log.debug(f"{node.label}\n\tmap_name: {map_name}\n\tlabel_map_name: {label_map_name}")
-                        if map_name != label_map_name:
-                            result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
-                            messages.append(f"{mat.name}'s image label '{node.label}' != map name '{map_name}'")
+    for mat, node in scene_index.get().nodes_of_type("TEX_IMAGE"):
+        if not node.label:
+            continue
+        if not node.image:
+            result = "ERROR"
+            messages.append(f"Material '{mat.name}' has unused image node")
+        elif not node.image.filepath:
+            result = "ERROR"
+            messages.append(f"'{node.image.name}' has no filepath")
+        else:
+            map_name = classify_texture(node.image.filepath, slug).map_name
+            if node.label.lower() in standard_map_names.aliases:
+                label_map_name = standard_map_names.aliases[node.label.lower()]
+            else:
+                label_map_name = node.label.lower()
+            log.debug(f"{node.label}\n\tmap_name: {map_name}\n\tlabel_map_name: {label_map_name}")
+            if map_name != label_map_name:
+                result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
+                messages.append(f"{mat.name}'s image label '{node.label}' != map name '{map_name}'")
 
     return result, messages
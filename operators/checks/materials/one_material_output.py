@@ -1,4 +1,6 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,11 +8,15 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            output_nodes = [node for node in mat.node_tree.nodes if node.type == "OUTPUT_MATERIAL"]
-            if len(output_nodes) != 1:
-                result = "ERROR"
-                messages.append(f"Material '{mat.name}' has {len(output_nodes)} output nodes")
+    index = scene_index.get()
+    output_counts = {mat: 0 for mat in index.node_materials}
+    for mat, node in index.nodes_of_type("OUTPUT_MATERIAL"):
+        if not index.material_graphs[mat].in_group(node):
+            output_counts[mat] += 1
+
+    for mat, count in output_counts.items():
+        if count != 1:
+            result = "ERROR"
+            messages.append(f"Material '{mat.name}' has {count} output nodes")
 
     return result, messages
@@ -1,4 +1,7 @@
 import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,13 +9,12 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                for o in node.outputs:
-                    if o.type == "SHADER":
-                        if node.type != "BSDF_PRINCIPLED":
-                            result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
-                            messages.append(f"Material '{mat.name}' contains {node.type} shader")
+    for mat, node in scene_index.get().material_nodes:
+        if node.type in ("BSDF_PRINCIPLED", "GROUP", "GROUP_INPUT"):
+            continue  # Group contents are checked themselves
+        for o in node.outputs:
+            if o.type == "SHADER":
+                result = "ERROR" if bpy.context.scene.hat_props.asset_type == "texture" else "WARNING"
+                messages.append(f"Material '{mat.name}' contains {node.type} shader")
 
     return result, messages
@@ -1,4 +1,6 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -6,12 +8,9 @@ def check(slug):
     result = "SUCCESS"
     messages = []
 
-    for mat in bpy.data.materials:
-        if mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                if node.type == "BSDF_PRINCIPLED":
-                    if node.inputs.get("Subsurface Weight") and node.inputs["Subsurface Weight"].default_value > 0:
-                        result = "WARNING"
-                        messages.append(f"Material '{mat.name}' has SSS weight > 0")
+    for mat, node in scene_index.get().nodes_of_type("BSDF_PRINCIPLED"):
+        if node.inputs.get("Subsurface Weight") and node.inputs["Subsurface Weight"].default_value > 0:
+            result = "WARNING"
+            messages.append(f"Material '{mat.name}' has SSS weight > 0")
 
     return result, messages
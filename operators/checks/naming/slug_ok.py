@@ -1,3 +1,6 @@
+ID_TYPES = set()
+
+
 def check(slug):
     """Asset slug follows proper naming conventions (lowercase, allowed characters only)"""
     result = "SUCCESS"
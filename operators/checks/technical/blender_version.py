@@ -1,32 +1,32 @@
 import bpy
-import requests
 import logging
+from ....utils import latest_blender_version
 
 log = logging.getLogger(__name__)
 
+# Depends on the state of this Blender session rather than the asset, so results must never be reused
+CACHEABLE = False
+
 
 def check(slug):
     """Blender version is the latest official release"""
     result = "SUCCESS"
     messages = []
 
-    admin_blend_version_url = "https://admin.polyhaven.com/api/public/blenderVersion"
+    server_version, error = latest_blender_version.get()
 
-    try:
-        response = requests.get(admin_blend_version_url)
-        response.raise_for_status()
-        data = response.json()
-        server_version = data.get("version", "unknown")
-    except requests.RequestException as e:
+    if server_version is None:
         result = "WARNING"
-        messages.append("Failed to retrieve Blender version from PH Admin server: " + str(e))
-        log.error("Error fetching Blender version: %s", e)
+        if error:
+            messages.append("Failed to retrieve Blender version from PH Admin server: " + error)
+        else:
+            messages.append("Still fetching the latest Blender version from PH Admin server, check again shortly")
         return result, messages
 
     if server_version == "unknown":
         result = "WARNING"
         messages.append("Unknown Blender version from PH Admin server, please tell Greg :(")
-        log.error("Unknown Blender version from PH Admin server; data: %s", data)
+        log.error("Unknown Blender version from PH Admin server")
         return result, messages
 
     current_version = bpy.app.version_string
@@ -0,0 +1,50 @@
+import bpy
+import os
+from ....utils import image_headers
+from ....utils.filename_utils import classify_texture
+
+
+def check(slug):
+    """Texture maps have the expected bit depth and number of channels"""
+    result = "SUCCESS"
+    messages = []
+
+    high_bit_depth_types = [
+        "disp",
+    ]
+    rgb_types = [
+        "diff",
+        "nor_gl",
+        "nor_dx",
+        "arm",
+        "emission",
+    ]
+    float_formats = [
+        "OPEN_EXR",
+        "HDR",
+    ]
+
+    strict = bpy.context.scene.hat_props.asset_type == "texture"
+
+    for path, header in image_headers.texture_headers().items():
+        if header is None:
+            continue
+        fn = os.path.basename(path)
+        map_name = classify_texture(fn, slug, strict).map_type
+
+        if header.format not in float_formats:
+            if header.bit_depth > 8 and map_name not in high_bit_depth_types:
+                result = "WARNING" if result != "ERROR" else result
+                messages.append(f"{fn} is {header.bit_depth}-bit, 8-bit expected")
+            elif header.bit_depth <= 8 and map_name in high_bit_depth_types:
+                result = "WARNING" if result != "ERROR" else result
+                messages.append(f"{fn} is {header.bit_depth}-bit, 16-bit expected to avoid stepping")
+
+        if map_name in rgb_types and header.channels < 3:
+            result = "ERROR"
+            messages.append(f"{fn} has {header.channels} channel(s), RGB expected")
+        elif map_name != "diff" and header.channels in (2, 4):
+            result = "WARNING" if result != "ERROR" else result
+            messages.append(f"{fn} has an alpha channel, which isn't used")
+
+    return result, messages
@@ -0,0 +1,21 @@
+import bpy
+import os
+from ....utils import image_headers
+from ....utils.hash_index import group_duplicates, hashes_or_pending
+
+
+def check(slug):
+    """No two texture files of the asset should be identical"""
+    result = "SUCCESS"
+    messages = []
+
+    hashes = hashes_or_pending(image_headers.texture_headers().keys(), wait=bpy.app.background)
+    if hashes is None:
+        # Never cache or pass a result that isn't complete yet
+        return "PENDING", ["Hashing textures to compare them, check again to see the results"]
+
+    for _size, paths in group_duplicates(hashes):
+        result = "WARNING"
+        messages.append(f"Identical files: {', '.join(os.path.basename(p) for p in paths)}")
+
+    return result, messages
@@ -1,8 +1,10 @@
 import bpy
 from ....utils.fetch_textures import fetch_textures
-from ....utils.filename_utils import get_map_name
+from ....utils.filename_utils import classify_texture
 from ....utils.standard_map_names import names as standard_map_names
 
+ID_TYPES = {"IMAGE", "MATERIAL", "NODETREE"}
+
 
 def check(slug):
     """Texture map names follow standardized naming conventions"""
@@ -13,7 +15,7 @@ def check(slug):
 
     textures = fetch_textures()
     for image in textures:
-        map_name = get_map_name(image.filepath, slug, strict=strict)
+        map_name = classify_texture(image.filepath, slug, strict).map_name
         if map_name not in standard_map_names:
             fn = bpy.path.basename(image.filepath)
             result = "WARNING" if strict else "QUESTION"
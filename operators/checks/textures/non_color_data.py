@@ -1,5 +1,7 @@
 import bpy
-from ....utils import filename_utils
+from ....utils import filename_utils, scene_index
+
+ID_TYPES = {"IMAGE"}
 
 
 def check(slug):
@@ -16,27 +18,9 @@ def check(slug):
     sRGB_types = [
         "diff",
     ]
-    aliases = {
-        "roughness": "rough",
-        "metallic": "metal",
-        "nor": "nor_gl",
-        "norm": "nor_gl",
-        "normal": "nor_gl",
-        "normals": "nor_gl",
-        "height": "disp",
-        "displacement": "disp",
-        "color": "diff",
-        "col": "diff",
-        "diffuse": "diff",
-        "diffuse_color": "diff",
-        "albedo": "diff",
-    }
-
-    for img in bpy.data.images:
+    for img in scene_index.get().images:
         if img.filepath:
-            map_name = filename_utils.get_map_name(img.filepath, slug)
-            if map_name in aliases:
-                map_name = aliases[map_name]
+            map_name = filename_utils.classify_texture(img.filepath, slug).map_type
 
             if map_name in linear_types:
                 if img.colorspace_settings.name != "Non-Color":
@@ -0,0 +1,54 @@
+import bpy
+import os
+from ....utils import image_headers, normal_maps
+from ....utils.filename_utils import classify_texture
+
+
+def check(slug):
+    """Normal maps contain unit length vectors pointing out of the surface, in the convention their name says"""
+    result = "SUCCESS"
+    messages = []
+
+    conventions = {
+        "nor_gl": "GL",
+        "nor_dx": "DX",
+    }
+    convention_names = {
+        "GL": "OpenGL",
+        "DX": "DirectX",
+    }
+
+    strict = bpy.context.scene.hat_props.asset_type == "texture"
+
+    pending = 0
+    for path, header in image_headers.texture_headers().items():
+        fn = os.path.basename(path)
+        map_name = classify_texture(fn, slug, strict).map_type
+        if header is None or map_name not in conventions:
+            continue
+
+        analysis = normal_maps.analysis(path)
+        if analysis is None:
+            pending += 1
+            continue
+        if "error" in analysis:
+            result = "WARNING" if result != "ERROR" else result
+            messages.append(f"{fn} could not be analyzed: {analysis['error']}")
+            continue
+
+        if analysis["negative_blue"] > 0.01:
+            result = "ERROR"
+            messages.append(f"{fn} has normals pointing into the surface, is it a tangent space normal map?")
+        elif analysis["unit_error"] > 0.1:
+            result = "ERROR"
+            messages.append(f"{fn} doesn't contain unit length normals, is it a normal map?")
+        detected = analysis["convention"]
+        if detected and detected != conventions[map_name]:
+            result = "ERROR"
+            messages.append(f"{fn} looks like a {convention_names[detected]} normal map")
+
+    if pending:
+        result = "PENDING"  # Never cache or pass a result that isn't complete yet
+        messages.append(f"Analyzing {pending} normal map(s), check again to see the results")
+
+    return result, messages
@@ -1,14 +1,18 @@
-import bpy
+from ....utils import scene_index
+
+ID_TYPES = {"IMAGE"}
 
 
 def check(slug):
     """No texture files should be packed into the blend file"""
     result = "SUCCESS"
     messages = []
+    targets = []
 
-    for image in bpy.data.images:
+    for image in scene_index.get().images:
         if image.packed_file:
             result = "ERROR"
             messages.append(image.name + " is packed")
+            targets.append(image)
 
-    return result, messages
+    return result, messages, targets
@@ -0,0 +1,20 @@
+import os
+from ....utils import image_headers
+from ....utils.filename_utils import classify_texture
+
+
+def check(slug):
+    """Resolution suffixes of texture files (e.g. _4k) match their actual size"""
+    result = "SUCCESS"
+    messages = []
+
+    for path, header in image_headers.texture_headers().items():
+        fn = os.path.basename(path)
+        num = classify_texture(fn, slug).resolution
+        if header is None or num is None:
+            continue
+        if max(header.width, header.height) != num * 1024:
+            result = "ERROR"
+            messages.append(f"{fn} is {header.width}x{header.height}, which doesn't match its {num}k suffix")
+
+    return result, messages
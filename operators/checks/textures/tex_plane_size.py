@@ -1,6 +1,9 @@
 import bpy
 from mathutils import Vector
 
+ID_TYPES = {"OBJECT", "MESH"}
+ASSET_TYPES = ("texture",)
+
 
 def check(slug):
     """Texture preview plane has non-default dimensions"""
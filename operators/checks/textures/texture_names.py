@@ -1,5 +1,8 @@
 import bpy
 from ....utils.fetch_textures import fetch_textures
+from ....utils.filename_utils import classify_texture
+
+ID_TYPES = {"IMAGE", "MATERIAL", "NODETREE"}
 
 
 def check(slug):
@@ -12,7 +15,7 @@ def check(slug):
     textures = fetch_textures()
     for image in textures:
         fn = bpy.path.basename(image.filepath)
-        if not fn.startswith(slug):
+        if classify_texture(image.filepath, slug).slug != slug:
             result = "WARNING"
             messages.append(fn + " does not start with slug")
         if fn.lower() != fn:
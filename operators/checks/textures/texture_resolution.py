@@ -0,0 +1,32 @@
+import os
+from ....utils import image_headers
+from ....utils.filename_utils import classify_texture
+
+
+def is_power_of_two(n):
+    return n > 0 and n & (n - 1) == 0
+
+
+def check(slug):
+    """Texture maps of the same resolution have matching, power of two dimensions"""
+    result = "SUCCESS"
+    messages = []
+
+    groups = {}  # {resolution suffix: {(width, height): [file names]}}
+    for path, header in image_headers.texture_headers().items():
+        if header is None:
+            continue
+        fn = os.path.basename(path)
+        if not is_power_of_two(header.width) or not is_power_of_two(header.height):
+            result = "WARNING"
+            messages.append(f"{fn} is not a power of two ({header.width}x{header.height})")
+        resolution = classify_texture(fn, slug).resolution
+        groups.setdefault(resolution, {}).setdefault((header.width, header.height), []).append(fn)
+
+    for sizes in groups.values():
+        if len(sizes) > 1:
+            result = "ERROR"
+            sizes = ", ".join(f"{w}x{h} ({', '.join(files)})" for (w, h), files in sizes.items())
+            messages.append(f"Texture maps have different resolutions: {sizes}")
+
+    return result, messages
@@ -1,4 +1,5 @@
 import bpy
+from ..utils import id_collections
 
 
 class HAT_OT_clear_assets(bpy.types.Operator):
@@ -8,10 +9,7 @@ class HAT_OT_clear_assets(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
-        for attr in dir(bpy.data):
-            collection = getattr(bpy.data, attr)
-            if hasattr(collection, "__iter__"):
-                for block in collection:
-                    if hasattr(block, "asset_data") and block.asset_data:
-                        block.asset_clear()
+        for _attr, block in id_collections.iter_datablocks():
+            if block.asset_data:
+                block.asset_clear()
         return {"FINISHED"}
@@ -0,0 +1,13 @@
+import bpy
+from ..utils import folder_watch
+
+
+class HAT_OT_refresh_folder_structure(bpy.types.Operator):
+    bl_idname = "hat.refresh_folder_structure"
+    bl_label = "Refresh Folder Structure"
+    bl_description = "List the asset folder again. Changes are also picked up automatically after a few seconds"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        folder_watch.invalidate("folder_structure")
+        return {"FINISHED"}
@@ -1,4 +1,5 @@
 import bpy
+from ..utils import id_collections
 
 
 class HAT_OT_scrub_datablocks(bpy.types.Operator):
@@ -11,13 +12,9 @@ class HAT_OT_scrub_datablocks(bpy.types.Operator):
         return context.window_manager.invoke_confirm(self, event)
 
     def execute(self, context):
-        for data_type in dir(bpy.data):
-            if hasattr(getattr(bpy.data, data_type), '__iter__'):
-                l = list(getattr(bpy.data, data_type))
-                for item in l:
-                    if hasattr(item, 'use_fake_user'):
-                        if item.use_fake_user:
-                            item.use_fake_user = False
+        for _data_type, item in id_collections.iter_datablocks():
+            if item.use_fake_user:
+                item.use_fake_user = False
         purge_result = bpy.ops.outliner.orphans_purge(
             'INVOKE_DEFAULT', do_recursive=True)
         self.report({'INFO'},
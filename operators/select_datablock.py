@@ -0,0 +1,52 @@
+import bpy
+from ..utils.results import resolve_ref
+
+
+def find_user_objects(datablock):
+    """Find the objects that use a datablock, directly or through other datablocks (e.g. image > material > object)"""
+    user_map = bpy.data.user_map()
+    objects = set()
+    seen = {datablock}
+    queue = [datablock]
+    while queue:
+        for user in user_map.get(queue.pop(), ()):
+            if user in seen:
+                continue
+            seen.add(user)
+            if isinstance(user, bpy.types.Object):
+                objects.add(user)
+            else:
+                queue.append(user)
+    return objects
+
+
+class HAT_OT_select_datablock(bpy.types.Operator):
+    bl_idname = "hat.select_datablock"
+    bl_label = "Select"
+    bl_description = "Select the object this message is about, or the objects using the datablock"
+    bl_options = {"REGISTER", "UNDO"}
+
+    id_collection: bpy.props.StringProperty()
+    id_name: bpy.props.StringProperty()
+
+    def execute(self, context):
+        datablock = resolve_ref([self.id_collection, self.id_name])
+        if datablock is None:
+            self.report({"WARNING"}, f"{self.id_name} no longer exists")
+            return {"CANCELLED"}
+
+        if isinstance(datablock, bpy.types.Object):
+            objects = {datablock}
+        else:
+            objects = find_user_objects(datablock)
+        objects = [o for o in objects if o.name in context.view_layer.objects]
+        if not objects:
+            self.report({"INFO"}, f"{self.id_name} is not used by any object in this view layer")
+            return {"CANCELLED"}
+
+        for obj in context.view_layer.objects:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = objects[0]
+        return {"FINISHED"}
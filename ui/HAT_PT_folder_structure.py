@@ -1,11 +1,43 @@
 import bpy
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from ..utils.filename_utils import get_slug, remove_num, get_map_name
+from ..utils import folder_watch, fs_snapshot
+from ..utils.filename_utils import classify_texture, get_slug, remove_num
 from ..utils.standard_map_names import names as standard_map_names
 from .. import icons
 
 
+@lru_cache(maxsize=None)
+def _compile(pattern):
+    """Compile a case insensitive fnmatch pattern once"""
+    return re.compile(fnmatch.translate(pattern.lower())).match
+
+
+def matches(name, pattern):
+    return _compile(pattern)(name.lower()) is not None
+
+
+def strip_resolution(item_name):
+    """slug_diff_4k.png -> slug_diff.png"""
+    basename, ext = os.path.splitext(item_name)
+    return remove_num(basename) + ext
+
+
+# Rows of the last drawn folder structure, so redraws don't touch the disk. Rebuilt once folder_watch notices a change.
+_cache = {"key": None, "rows": None}
+
+
+def invalidate():
+    _cache["rows"] = None
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "PROPERTIES":
+                area.tag_redraw()
+
+
 class HAT_PT_folder_structure(bpy.types.Panel):
     bl_label = "Folder Structure"
     bl_space_type = "PROPERTIES"
@@ -17,43 +49,36 @@ class HAT_PT_folder_structure(bpy.types.Panel):
     def poll(cls, context):
         return bool(bpy.data.filepath)
 
-    def draw_folder(self, layout, slug, folder_path, depth, required, valid, ignored):
+    def draw_header_preset(self, context):
+        self.layout.operator("hat.refresh_folder_structure", text="", icon="FILE_REFRESH", emboss=False)
+
+    def build_rows(self, rows, folders, snapshot, slug, folder_path, depth, required, valid, ignored):
         """
-        Recursively draw folder structure with file/folder validation
+        Recursively list folder structure with file/folder validation.
+
+        Appends (depth, text, icon, status) tuples to rows, with status one of "required", "valid", "invalid",
+        "unknown" or "missing", and every folder that was listed to folders.
         """
         if depth >= 6:  # Limit recursion depth
             return
 
         folder_path = Path(folder_path)
-        if folder_path.is_file():
-            folder_path = folder_path.parent
-
-        if not folder_path.exists():
-            return
+        folders.append(str(folder_path))
 
         # Get current folder name for pattern matching
         current_folder = "/" if depth == 0 else folder_path.name
 
-        # Get icons
-        i = icons.get_icons()
-
-        # Get items in current folder
-        try:
-            items = list(folder_path.iterdir())
-        except (PermissionError, OSError):
-            return
+        # Get items in current folder, listed once and reused for every is_dir()/is_file() below
+        items = snapshot.listdir(folder_path)
 
         # Separate files and folders, sort alphabetically (case-insensitive)
-        folders = [item for item in items if item.is_dir()]
+        folder_items = [item for item in items if item.is_dir()]
         files = [item for item in items if item.is_file()]
-        folders.sort(key=lambda x: x.name.lower())
+        folder_items.sort(key=lambda x: x.name.lower())
         files.sort(key=lambda x: x.name.lower())
 
         # Process all items (folders first, then files)
-        all_items = folders + files
-
-        # Track which required items we've found
-        found_required = set()
+        all_items = folder_items + files
 
         for item in all_items:
             item_name = item.name
@@ -62,42 +87,16 @@ class HAT_PT_folder_structure(bpy.types.Panel):
             if self._should_ignore(item_name, ignored):
                 continue
 
-            # Add indentation based on depth
-            row = layout.row(align=True)
-            for _ in range(depth):
-                row.label(text="", icon="BLANK1")
-
             # Determine item status
             is_folder = item.is_dir()
             status = self._get_item_status(item_name, current_folder, required, valid, slug, is_folder)
 
-            # Track found required items
-            if status == "required":
-                found_required.add(self._normalize_pattern(item_name, slug))
-
-            # Draw the item
             if is_folder:
-                row.label(text=item_name, icon="FILE_FOLDER")
-                if status == "required":
-                    row.label(text="", icon="CHECKMARK")
-                elif status == "valid":
-                    row.label(text="", icon="CHECKMARK")
-                elif status == "invalid":
-                    row.label(text="", icon_value=i["exclamation-triangle"].icon_id)
-
-                # Recursively draw folder contents
-                self.draw_folder(layout, slug, item, depth + 1, required, valid, ignored)
+                rows.append((depth, item_name, "FILE_FOLDER", status))
+                # Recursively list folder contents
+                self.build_rows(rows, folders, snapshot, slug, item.path, depth + 1, required, valid, ignored)
             else:
-                file_icon = self._get_file_icon(item_name)
-                row.label(text=item_name, icon=file_icon)
-                if status == "required":
-                    row.label(text="", icon="CHECKMARK")
-                elif status == "valid":
-                    row.label(text="", icon="CHECKMARK")
-                elif status == "invalid":
-                    row.label(text="", icon_value=i["exclamation-triangle"].icon_id)
-                elif status == "unknown":
-                    row.label(text="", icon_value=i["question"].icon_id)
+                rows.append((depth, item_name, self._get_file_icon(item_name), status))
 
         # Check for missing required items (files)
         if current_folder in required:
@@ -112,18 +111,13 @@ class HAT_PT_folder_structure(bpy.types.Panel):
                     if not self._should_ignore(item.name, ignored):
                         item_name = item.name
                         if current_folder == "textures":
-                            basename, ext = Path(item_name).stem, Path(item_name).suffix
-                            item_name = remove_num(basename) + ext
-                        if fnmatch.fnmatch(item_name.lower(), actual_pattern.lower()):
+                            item_name = strip_resolution(item_name)
+                        if matches(item_name, actual_pattern):
                             pattern_found = True
                             break
 
                 if not pattern_found:
-                    # Show missing required item
-                    row = layout.row()
-                    for _ in range(depth):
-                        row.label(text="", icon="BLANK1")
-                    row.label(text=f"Missing: {actual_pattern}", icon_value=i["exclamation-triangle"].icon_id)
+                    rows.append((depth, f"Missing: {actual_pattern}", None, "missing"))
 
         # Check for missing required folders (only at root level)
         if depth == 0:
@@ -131,8 +125,25 @@ class HAT_PT_folder_structure(bpy.types.Panel):
                 if folder_name != "/":  # Skip root folder
                     folder_exists = any(item.is_dir() and item.name == folder_name for item in all_items)
                     if not folder_exists:
-                        row = layout.row()
-                        row.label(text=f"Missing: {folder_name} folder", icon_value=i["exclamation-triangle"].icon_id)
+                        rows.append((0, f"Missing: {folder_name} folder", None, "missing"))
+
+    def draw_rows(self, layout, rows):
+        i = icons.get_icons()
+        for depth, text, icon, status in rows:
+            row = layout.row(align=True)
+            # Add indentation based on depth
+            for _ in range(depth):
+                row.label(text="", icon="BLANK1")
+            if status == "missing":
+                row.label(text=text, icon_value=i["exclamation-triangle"].icon_id)
+                continue
+            row.label(text=text, icon=icon)
+            if status in ("required", "valid"):
+                row.label(text="", icon="CHECKMARK")
+            elif status == "invalid":
+                row.label(text="", icon_value=i["exclamation-triangle"].icon_id)
+            elif status == "unknown":
+                row.label(text="", icon_value=i["question"].icon_id)
 
     def _get_file_icon(self, filename):
         """Get appropriate icon based on file extension"""
@@ -155,10 +166,7 @@ class HAT_PT_folder_structure(bpy.types.Panel):
 
     def _should_ignore(self, item_name, ignored_patterns):
         """Check if an item should be ignored based on patterns"""
-        for pattern in ignored_patterns:
-            if fnmatch.fnmatch(item_name.lower(), pattern.lower()):
-                return True
-        return False
+        return any(matches(item_name, pattern) for pattern in ignored_patterns)
 
     def _get_item_status(self, item_name, current_folder, required, valid, slug, is_folder=False):
         """Determine if an item is required, valid, or invalid"""
@@ -179,17 +187,17 @@ class HAT_PT_folder_structure(bpy.types.Panel):
         # For files, check patterns in the current folder
         # Check required patterns for current folder
         if current_folder in required:
+            if current_folder == "textures":
+                item_name = strip_resolution(item_name)
             for pattern in required[current_folder]:
                 actual_pattern = pattern.replace("slug", slug)
-                if current_folder == "textures":
-                    basename, ext = Path(item_name).stem, Path(item_name).suffix
-                    item_name = remove_num(basename) + ext
-                if fnmatch.fnmatch(item_name.lower(), actual_pattern.lower()):
+                if matches(item_name, actual_pattern):
                     return "required"
 
         # Flag unknown map types
         if current_folder == "textures":
-            map_name = get_map_name(item_name, slug, strict=bpy.context.scene.hat_props.asset_type == "texture")
+            strict = bpy.context.scene.hat_props.asset_type == "texture"
+            map_name = classify_texture(item_name, slug, strict).map_name
             if map_name not in standard_map_names:
                 return "unknown"
 
@@ -197,7 +205,7 @@ class HAT_PT_folder_structure(bpy.types.Panel):
         if current_folder in valid:
             for pattern in valid[current_folder]:
                 actual_pattern = pattern.replace("slug", slug)
-                if fnmatch.fnmatch(item_name.lower(), actual_pattern.lower()):
+                if matches(item_name, actual_pattern):
                     return "valid"
 
         return "invalid"
@@ -287,20 +295,32 @@ class HAT_PT_folder_structure(bpy.types.Panel):
         }
         ignored = [  # These are hidden
             "_upload",
+            "_variants",
             "*.blend1",
             "*.blend2",
             "nosubsurf.blend",
+            "*.hat-cache.json",
             "desktop.ini",
             ".DS_Store",
             "Thumbs.db",
         ]
 
-        self.draw_folder(
-            self.layout.column(align=True),
-            slug,
-            bpy.data.filepath,
-            0,
-            required[props.asset_type],
-            valid[props.asset_type],
-            ignored,
-        )
+        root = os.path.dirname(bpy.data.filepath)
+        key = (root, slug, props.asset_type)
+        if _cache["rows"] is None or _cache["key"] != key:
+            rows, folders = [], []
+            self.build_rows(
+                rows,
+                folders,
+                fs_snapshot.FsSnapshot(root),
+                slug,
+                root,
+                0,
+                required[props.asset_type],
+                valid[props.asset_type],
+                ignored,
+            )
+            _cache["key"], _cache["rows"] = key, rows
+            folder_watch.watch("folder_structure", folders, invalidate)
+
+        self.draw_rows(self.layout.column(align=True), _cache["rows"])
@@ -1,5 +1,5 @@
 import bpy
-import json
+from ..utils import results
 from ..utils.draw_message_label import draw_message_label
 
 
@@ -15,14 +15,14 @@ class HAT_PT_results(bpy.types.Panel):
         return context.scene.hat_props.latest_tests != ""
 
     def draw(self, context):
-        props = context.scene.hat_props
         col = self.layout.column()
-        if props.latest_tests:
-            try:
-                tests = json.loads(props.latest_tests)
-                for status, messages in tests:
-                    for message in messages:
-                        if message != "File contains unsaved changes":
-                            draw_message_label(col, message, status)
-            except json.JSONDecodeError:
-                col.label(text="Failed to decode latest tests JSON.", icon="ERROR")
+        store = results.get_store(context.scene)
+        if store is None:
+            col.label(text="Failed to decode latest tests JSON.", icon="ERROR")
+            return
+        if store.running:
+            done, total = store.progress
+            col.label(text=f"Checking... ({done}/{total})", icon="SORTTIME")
+        for record in store.messages():
+            if record.message != "File contains unsaved changes":
+                draw_message_label(col, record.message, record.status, record.target)
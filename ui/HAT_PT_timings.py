@@ -0,0 +1,51 @@
+import bpy
+from ..utils import results
+
+
+class HAT_PT_timings(bpy.types.Panel):
+    bl_label = "Timings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_parent_id = "HAT_PT_results"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        props = context.scene.hat_props
+        store = results.get_store(context.scene)
+        if store is None:
+            return
+
+        timings = list(store.timings)
+        if not timings:
+            self.layout.label(text="No timings recorded, run the checks again.")
+            return
+
+        if props.timings_sort == "TIME":
+            timings.sort(key=lambda t: -1 if t[1] is None else t[1], reverse=True)
+        else:
+            timings.sort(key=lambda t: t[0])
+
+        row = self.layout.row()
+        row.prop(props, "timings_sort", expand=True)
+
+        col = self.layout.column(align=True)
+        for name, seconds in timings:
+            row = col.row()
+            row.label(text=name)
+            sub = row.row()
+            sub.alignment = "RIGHT"
+            if seconds is None:
+                sub.enabled = False
+                sub.label(text="cached")
+            else:
+                sub.label(text=f"{seconds * 1000:.1f} ms")
+
+        total_time = store.total_time
+        if total_time is not None and not store.running:
+            col.separator()
+            row = col.row()
+            row.label(text="Total")
+            sub = row.row()
+            sub.alignment = "RIGHT"
+            sub.label(text=f"{total_time * 1000:.1f} ms")
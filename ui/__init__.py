@@ -1,6 +1,7 @@
 if "bpy" not in locals():
     from . import HAT_PT_main
     from . import HAT_PT_results
+    from . import HAT_PT_timings
     from . import HAT_PT_info
     from . import HAT_PT_folder_structure
     from . import HAT_PT_tools
@@ -9,6 +10,7 @@ else:
 
     importlib.reload(HAT_PT_main)
     importlib.reload(HAT_PT_results)
+    importlib.reload(HAT_PT_timings)
     importlib.reload(HAT_PT_info)
     importlib.reload(HAT_PT_folder_structure)
     importlib.reload(HAT_PT_tools)
@@ -16,6 +18,7 @@ else:
 classes = [
     HAT_PT_main.HAT_PT_main,
     HAT_PT_results.HAT_PT_results,
+    HAT_PT_timings.HAT_PT_timings,
     HAT_PT_info.HAT_PT_info,
     HAT_PT_folder_structure.HAT_PT_folder_structure,
     HAT_PT_tools.HAT_PT_tools,
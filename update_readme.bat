@@ -1,5 +1,6 @@
 @echo off
-echo Updating README.md with latest checks...
+echo Updating README.md and check registry with latest checks...
 python build_readme_checklist.py
+python build_check_registry.py
 echo Done!
 pause
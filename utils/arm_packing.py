@@ -0,0 +1,191 @@
+"""
+Pack ambient occlusion, roughness and metalness maps into the slug_arm.png that glTF files use (R: AO, G: roughness,
+B: metalness).
+
+Packing runs in a background Blender worker (see utils/blender_pool.py), so 8k maps are never loaded into the user's
+session. It's skipped altogether when the source maps haven't changed since the last pack, as recorded in the
+"derived" section of the asset's sidecar cache (utils/sidecar.py).
+"""
+
+import bpy
+import logging
+import numpy as np
+import os
+from . import sidecar
+from .filename_utils import classify_texture
+from .node_graph import MaterialGraph
+from .result_cache import file_hash
+
+log = logging.getLogger(__name__)
+
+CHANNELS = ("ao", "rough", "metal")  # R, G, B
+DEFAULTS = {"ao": 1.0, "metal": 0.0}  # Used when the asset has no such map
+
+
+def source_maps(material, slug):
+    """Return {map type: absolute path} of the AO, roughness and metalness images used by a material"""
+    sources = {}
+    for node in MaterialGraph(material).nodes_of_type("TEX_IMAGE"):
+        if node.image and node.image.filepath:
+            map_type = classify_texture(node.image.filepath, slug, strict=False).map_type
+            if map_type in CHANNELS and map_type not in sources:
+                sources[map_type] = os.path.normpath(bpy.path.abspath(node.image.filepath))
+    return sources
+
+
+def _stat(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def fingerprint(sources, previous=None):
+    """
+    Identify the contents of the source maps. Files are only hashed when their size or mtime differ from `previous`.
+
+    Returns:
+        dict: {map type: {"path", "size", "mtime_ns", "sha1"}}
+    """
+    previous = previous or {}
+    result = {}
+    for map_type, path in sorted(sources.items()):
+        entry = {"path": path, **_stat(path)}
+        old = previous.get(map_type, {})
+        if all(old.get(k) == entry[k] for k in ("path", "size", "mtime_ns")):
+            entry["sha1"] = old.get("sha1")
+        else:
+            entry["sha1"] = file_hash(path)
+        result[map_type] = entry
+    return result
+
+
+def _same_contents(a, b):
+    def contents(fp):
+        return {map_type: (entry.get("path"), entry.get("sha1")) for map_type, entry in (fp or {}).items()}
+
+    return contents(a) == contents(b)
+
+
+def pack(sources, output):
+    """Write the packed ARM image, at the size of the roughness map. Runs in a worker, see utils/worker_tasks.py."""
+    images = {map_type: bpy.data.images.load(path, check_existing=False) for map_type, path in sources.items()}
+    packed_image = None
+    try:
+        width, height = images["rough"].size
+        packed = np.empty((width * height, 4), dtype=np.float32)
+        packed[:, 3] = 1
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        for i, map_type in enumerate(CHANNELS):
+            image = images.get(map_type)
+            if image is None:
+                packed[:, i] = DEFAULTS[map_type]
+                continue
+            image.colorspace_settings.name = "Non-Color"
+            if tuple(image.size) != (width, height):
+                image.scale(width, height)
+            image.pixels.foreach_get(pixels)
+            packed[:, i] = pixels[0::4]  # Grayscale maps, the red channel is as good as any
+
+        packed_image = bpy.data.images.new("arm", width, height, alpha=False)
+        packed_image.colorspace_settings.name = "Non-Color"
+        packed_image.pixels.foreach_set(packed.ravel())
+        packed_image.file_format = "PNG"
+        packed_image.filepath_raw = output + ".tmp"
+        packed_image.save()
+        os.replace(output + ".tmp", output)
+    finally:
+        for image in images.values():
+            bpy.data.images.remove(image)
+        if packed_image is not None:
+            bpy.data.images.remove(packed_image)
+    return {"width": width, "height": height}
+
+
+def arm_path(rough_path, slug):
+    """textures/slug_rough.png -> textures/slug_arm.png, textures/slug_part_roughness.png -> slug_part_arm.png"""
+    name_slug = classify_texture(rough_path, slug, strict=False).slug or slug
+    return os.path.join(os.path.dirname(rough_path), f"{name_slug}_arm.png")
+
+
+def ensure_arms(blend_file, materials, slug):
+    """
+    Make sure each material's ARM image is packed from its current AO, roughness and metalness maps. Outdated images
+    are packed in parallel in background workers.
+
+    Returns:
+        dict: {material name: path of its ARM image} for the materials that have a roughness map
+    Raises:
+        blender_pool.WorkerError: If packing failed
+    """
+    derived = sidecar.load(blend_file).get("derived", {})
+    packed = derived.get("arm", {})  # {ARM file name: {"sources": fingerprint, "output": stat}}
+    arm_files = {}
+    jobs = {}  # {output: sources}
+    changed = False
+
+    for material in materials:
+        sources = source_maps(material, slug)
+        if "rough" not in sources:
+            continue
+        output = arm_path(sources["rough"], slug)
+        arm_files[material.name] = output
+        if output in jobs:
+            continue
+
+        previous = packed.get(os.path.basename(output), {})
+        sources_fingerprint = fingerprint(sources, previous.get("sources"))
+        try:
+            output_stat = _stat(output)
+        except OSError:
+            output_stat = None
+        if output_stat is not None and output_stat == previous.get("output"):
+            if _same_contents(sources_fingerprint, previous.get("sources")):
+                log.debug(f"{output} is up to date")
+                if sources_fingerprint != previous.get("sources"):
+                    previous["sources"] = sources_fingerprint  # Touched but not changed
+                    changed = True
+                continue
+        jobs[output] = sources
+        packed[os.path.basename(output)] = {"sources": sources_fingerprint}
+
+    if jobs:
+        log.info(f"Packing {len(jobs)} ARM textures")
+        if bpy.app.background:
+            for output, sources in jobs.items():
+                pack(sources, output)
+        else:
+            from .blender_pool import BlenderPool
+
+            with BlenderPool(workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+                futures = [pool.submit("pack_arm", sources=sources, output=output) for output, sources in jobs.items()]
+                for future in futures:
+                    future.result()
+        for output in jobs:
+            packed[os.path.basename(output)]["output"] = _stat(output)
+
+    if jobs or changed:
+        derived["arm"] = packed
+        sidecar.update(blend_file, "derived", derived)
+    return arm_files
+
+
+def use_arm_textures(gltf_data, arm_files, gltf_dir):
+    """Point the metallic/roughness texture of each material in a glTF file at the material's ARM image"""
+    image_uris = {}  # {image index: uri} assigned so far
+    for material in gltf_data.get("materials", []):
+        arm_file = arm_files.get(material.get("name"))
+        texture_info = material.get("pbrMetallicRoughness", {}).get("metallicRoughnessTexture")
+        if arm_file is None or texture_info is None:
+            continue
+        uri = os.path.relpath(arm_file, gltf_dir).replace(os.sep, "/")
+        texture = gltf_data["textures"][texture_info["index"]]
+        image_index = texture["source"]
+        if image_uris.setdefault(image_index, uri) != uri:
+            # Image shared with a material that has a different ARM, give this one its own image and texture
+            gltf_data["images"].append({"uri": uri})
+            gltf_data["textures"].append({**texture, "source": len(gltf_data["images"]) - 1})
+            texture_info["index"] = len(gltf_data["textures"]) - 1
+            continue
+        image = gltf_data["images"][image_index]
+        image.pop("bufferView", None)
+        image.pop("mimeType", None)
+        image["uri"] = uri
@@ -0,0 +1,118 @@
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+log = logging.getLogger(__name__)
+
+# Worker processes print other things to stdout too (Blender's own logging), results are the lines with this prefix
+RESULT_PREFIX = "HAT_RESULT:"
+
+HAT_BATCH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hat_batch.py")
+
+
+class WorkerError(Exception):
+    pass
+
+
+class BlenderPool:
+    """
+    A pool of background Blender processes running tasks from utils/worker_tasks.py.
+
+    Each worker is a long-lived `blender -b --factory-startup --python hat_batch.py -- --worker` process that reads
+    one JSON request per line on stdin and answers with one RESULT_PREFIX line on stdout, so Blender's startup cost is
+    only paid once per worker rather than once per task.
+    """
+
+    def __init__(self, workers=None, blender=None):
+        if blender is None:
+            import bpy
+
+            blender = bpy.app.binary_path
+        self.blender = blender
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self._idle = queue.Queue()
+        self._processes = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hat_worker")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _start_process(self):
+        log.debug(f"Starting Blender worker: {self.blender}")
+        process = subprocess.Popen(
+            [self.blender, "-b", "--factory-startup", "--python", HAT_BATCH, "--", "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        with self._lock:
+            self._processes.append(process)
+        return process
+
+    def _run(self, task, kwargs):
+        try:
+            process = self._idle.get_nowait()
+        except queue.Empty:
+            process = self._start_process()
+
+        try:
+            process.stdin.write(json.dumps({"task": task, "args": kwargs}) + "\n")
+            process.stdin.flush()
+            for line in process.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    response = json.loads(line[len(RESULT_PREFIX) :])
+                    break
+            else:
+                raise WorkerError(f"Blender worker exited with code {process.wait()} during task '{task}'")
+        except (OSError, WorkerError) as e:
+            # The worker is gone or in an unknown state, the next task starts a fresh one
+            process.kill()
+            process.wait()
+            with self._lock:
+                self._processes.remove(process)
+            if isinstance(e, OSError):
+                raise WorkerError(f"Blender worker failed during task '{task}': {e}") from e
+            raise
+
+        self._idle.put(process)
+        if "error" in response:
+            raise WorkerError(response["error"])
+        return response["result"]
+
+    def submit(self, task, **kwargs):
+        """Run a task on the next free worker, returns a concurrent.futures.Future"""
+        return self._executor.submit(self._run, task, kwargs)
+
+    def map(self, task, kwargs_list):
+        """
+        Run a task once per kwargs dict, yielding (kwargs, result or exception) in order of completion. A task failing,
+        or its worker dying or failing to start, doesn't stop the others.
+        """
+        futures = {self.submit(task, **kwargs): kwargs for kwargs in kwargs_list}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except (OSError, WorkerError) as e:
+                yield futures[future], e
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for process in self._processes:
+                if process.poll() is None:
+                    process.stdin.close()
+                    try:
+                        process.wait(timeout=10)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+            self._processes = []
@@ -0,0 +1,109 @@
+import bpy
+import logging
+from bpy.app.handlers import persistent
+
+log = logging.getLogger(__name__)
+
+# ID type of each bpy.data collection, used to attribute added, removed and renamed datablocks (which the depsgraph
+# doesn't report) to the checks that depend on them.
+COLLECTION_ID_TYPES = {
+    "actions": "ACTION",
+    "armatures": "ARMATURE",
+    "brushes": "BRUSH",
+    "cache_files": "CACHEFILE",
+    "cameras": "CAMERA",
+    "collections": "COLLECTION",
+    "curves": "CURVE",
+    "fonts": "FONT",
+    "grease_pencils": "GREASEPENCIL",
+    "hair_curves": "CURVES",
+    "images": "IMAGE",
+    "lattices": "LATTICE",
+    "libraries": "LIBRARY",
+    "lightprobes": "LIGHT_PROBE",
+    "lights": "LIGHT",
+    "linestyles": "LINESTYLE",
+    "masks": "MASK",
+    "materials": "MATERIAL",
+    "meshes": "MESH",
+    "metaballs": "META",
+    "movieclips": "MOVIECLIP",
+    "node_groups": "NODETREE",
+    "objects": "OBJECT",
+    "paint_curves": "PAINTCURVE",
+    "palettes": "PALETTE",
+    "particles": "PARTICLE",
+    "pointclouds": "POINTCLOUD",
+    "scenes": "SCENE",
+    "shape_keys": "KEY",
+    "sounds": "SOUND",
+    "speakers": "SPEAKER",
+    "texts": "TEXT",
+    "textures": "TEXTURE",
+    "volumes": "VOLUME",
+    "worlds": "WORLD",
+}
+
+changed_id_types = set()  # ID types reported by the depsgraph since the last check run
+generation = 0  # Incremented whenever datablocks other than the scene itself are updated
+everything_changed = True  # Set until the first run after loading a file, when there is nothing to compare against
+_fingerprints = {}  # {"materials": hash of datablock names} as of the last check run
+
+
+def _collection_fingerprints():
+    fingerprints = {}
+    for attr in COLLECTION_ID_TYPES:
+        collection = getattr(bpy.data, attr, None)
+        if collection is not None:
+            fingerprints[attr] = hash(tuple(collection.keys()))
+    return fingerprints
+
+
+def pop_changes():
+    """
+    Return the set of ID types that changed since the last call, and start tracking afresh.
+
+    Returns None if everything must be considered changed, e.g. right after a file was loaded.
+    """
+    global everything_changed, _fingerprints
+
+    fingerprints = _collection_fingerprints()
+    changed = set(changed_id_types)
+    for attr, fingerprint in fingerprints.items():
+        if _fingerprints.get(attr) != fingerprint:
+            changed.add(COLLECTION_ID_TYPES[attr])
+
+    if everything_changed:
+        changed = None
+    log.debug(f"ID types changed since last run: {changed}")
+
+    changed_id_types.clear()
+    everything_changed = False
+    _fingerprints = fingerprints
+    return changed
+
+
+def needs_rerun(check, changed):
+    """Whether a check (operators.check.CheckInfo) has to run again given the changed ID types from pop_changes()"""
+    if changed is None:
+        return True
+    if check.id_types is None:
+        return True  # Check doesn't declare its dependencies, always run it
+    return not changed.isdisjoint(check.id_types)
+
+
+@persistent
+def depsgraph_update_handler(scene, depsgraph):
+    global generation
+    for update in depsgraph.updates:
+        id_type = update.id.id_type
+        changed_id_types.add(id_type)
+        if id_type != "SCENE":
+            generation += 1
+
+
+@persistent
+def load_post_handler(dummy):
+    global everything_changed
+    everything_changed = True
+    changed_id_types.clear()
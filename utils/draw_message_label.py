@@ -1,14 +1,15 @@
 from .. import icons
 
 
-def draw_message_label(layout, message, status):
+def draw_message_label(layout, message, status, target=None):
     """
     Draw a message label with appropriate icon based on status.
 
     Args:
         layout: Blender UI layout object
         message: Text message to display
-        status: Status type ("ERROR", "WARNING", "QUESTION", "SUCCESS")
+        status: Status type ("ERROR", "WARNING", "QUESTION", "SUCCESS", "PENDING")
+        target: Optional [collection, name] reference to the datablock the message is about, see utils/results.py
     """
     i = icons.get_icons()
     status_icon_custom = {
@@ -18,6 +19,7 @@ def draw_message_label(layout, message, status):
     }
     status_icon = {
         "SUCCESS": "CHECKMARK",
+        "PENDING": "SORTTIME",
     }
 
     fix_buttons = {
@@ -25,7 +27,7 @@ def draw_message_label(layout, message, status):
         "Other asset datablocks found.": "HAT_OT_clear_assets",
     }
 
-    if message in fix_buttons:
+    if message in fix_buttons or target:
         layout = layout.row()
         layout.alignment = "LEFT"
 
@@ -36,3 +38,6 @@ def draw_message_label(layout, message, status):
 
     if message in fix_buttons:
         layout.operator(fix_buttons[message], text="Fix")
+    if target:
+        op = layout.operator("hat.select_datablock", text="", icon="RESTRICT_SELECT_OFF", emboss=False)
+        op.id_collection, op.id_name = target
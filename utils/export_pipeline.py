@@ -0,0 +1,167 @@
+"""
+Export an asset to every upload format (glTF, FBX) in one go, skipping the formats that are already up to date.
+
+What each output was exported from is kept in the "exports" section of the asset's sidecar cache (utils/sidecar.py):
+the blend file's hash, a hash of the textures folder's contents and the add-on version. A format is only exported
+again when one of them changed, or when any of its output files (e.g. a glTF's .bin and the ARM images it uses) was
+changed or removed since. Checking this doesn't load the blend file, so hat_batch.py can re-export a whole library and
+only open the assets that actually changed.
+"""
+
+import bpy
+import hashlib
+import json
+import logging
+import os
+from urllib.parse import unquote
+from . import hash_index, sidecar
+from .result_cache import addon_version, blend_fingerprint
+
+log = logging.getLogger(__name__)
+
+FORMATS = {"gltf": ".gltf", "fbx": ".fbx"}
+OPERATORS = {"gltf": "export_gltf", "fbx": "export_fbx"}  # bpy.ops.hat.*
+MODEL_ONLY = {"fbx"}
+
+
+def output_path(blend_file, export_format):
+    """slug/slug.blend -> slug/slug.gltf"""
+    name = os.path.splitext(os.path.basename(blend_file))[0]
+    if name.endswith(".export"):
+        name = name[: -len(".export")]
+    return os.path.join(os.path.dirname(blend_file), name + FORMATS[export_format])
+
+
+def _stat(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def output_files(blend_file, export_format):
+    """
+    The files that make up an export: the output itself and, for glTF, the .bin buffers and images it points at. This
+    includes the ARM images HAT packs, even those outside the textures folder that textures_hash() doesn't cover.
+    """
+    path = output_path(blend_file, export_format)
+    files = [path]
+    if export_format == "gltf":
+        with open(path, "r", encoding="utf-8") as f:
+            gltf_data = json.load(f)
+        for item in gltf_data.get("buffers", []) + gltf_data.get("images", []):
+            uri = item.get("uri")
+            if uri and not uri.startswith("data:"):
+                files.append(os.path.normpath(os.path.join(os.path.dirname(path), unquote(uri))))
+    return files
+
+
+def outputs_stat(blend_file, export_format):
+    """{file name relative to the blend file: size and mtime} of output_files(). Raises OSError if any is missing."""
+    blend_dir = os.path.dirname(blend_file)
+    return {
+        os.path.relpath(path, blend_dir).replace(os.sep, "/"): _stat(path)
+        for path in output_files(blend_file, export_format)
+    }
+
+
+def textures_hash(blend_file):
+    """Hash of the names and contents of every image in the asset's textures folder, see utils/hash_index.py"""
+    textures_dir = os.path.join(os.path.dirname(blend_file), "textures")
+    with hash_index.HashIndex() as index:
+        hashes = index.hashes(hash_index.find_textures(textures_dir))
+    h = hashlib.sha1()
+    for path in sorted(hashes):
+        h.update(os.path.relpath(path, textures_dir).replace(os.sep, "/").encode("utf-8"))
+        h.update(hashes[path][1].encode("ascii"))
+    return h.hexdigest()
+
+
+def inputs_fingerprint(blend_file, previous=None):
+    """Identify everything an export depends on. The blend file is only hashed when its size or mtime changed."""
+    return {
+        "addon_version": addon_version(),
+        "blend": blend_fingerprint(blend_file, (previous or {}).get("blend")),
+        "textures": textures_hash(blend_file),
+    }
+
+
+def _same_inputs(a, b):
+    def contents(fp):
+        fp = fp or {}
+        return fp.get("addon_version"), fp.get("blend", {}).get("sha1"), fp.get("textures")
+
+    return contents(a) == contents(b)
+
+
+def outdated(blend_file, formats):
+    """Return the formats that need to be exported again, without loading the blend file"""
+    manifest = sidecar.load(blend_file).get("exports", {})
+    inputs = None
+    result = []
+    for export_format in formats:
+        entry = manifest.get(export_format)
+        if not entry:
+            result.append(export_format)
+            continue
+        if not entry.get("skipped"):
+            try:
+                if outputs_stat(blend_file, export_format) != entry.get("outputs"):
+                    result.append(export_format)
+                    continue
+            except (OSError, ValueError):
+                result.append(export_format)
+                continue
+        if inputs is None:
+            inputs = inputs_fingerprint(blend_file, entry.get("inputs"))
+        if not _same_inputs(inputs, entry.get("inputs")):
+            result.append(export_format)
+    return result
+
+
+def export(blend_file, formats=tuple(FORMATS), force=False):
+    """
+    Open a blend file and export it to the given formats, unless they're up to date. Runs in a worker, see
+    utils/worker_tasks.py.
+
+    Returns:
+        dict: {format: "exported", "unchanged", "skipped" (doesn't apply to this asset type) or "failed: reason"}
+    """
+    todo = list(formats) if force else outdated(blend_file, formats)
+    results = {export_format: "unchanged" for export_format in formats if export_format not in todo}
+    if not todo:
+        return results
+
+    bpy.ops.wm.open_mainfile(filepath=blend_file, load_ui=False)
+    asset_type = bpy.context.scene.hat_props.asset_type
+    done = []
+    for export_format in todo:
+        if export_format in MODEL_ONLY and asset_type != "model":
+            results[export_format] = "skipped"
+            done.append(export_format)
+            continue
+        log.info(f"Exporting {output_path(blend_file, export_format)}")
+        try:
+            status = getattr(bpy.ops.hat, OPERATORS[export_format])()
+        except RuntimeError as e:
+            results[export_format] = f"failed: {e}"
+            continue
+        if "FINISHED" in status:
+            results[export_format] = "exported"
+            done.append(export_format)
+        else:
+            results[export_format] = "failed: cancelled"
+
+    if done:
+        # Fingerprinted after exporting, so that derived textures written by the export (ARM maps) count as inputs
+        manifest = sidecar.load(blend_file).get("exports", {})
+        inputs = inputs_fingerprint(blend_file)
+        for export_format in done:
+            if results[export_format] == "skipped":
+                manifest[export_format] = {"inputs": inputs, "skipped": True}
+                continue
+            try:
+                manifest[export_format] = {"inputs": inputs, "outputs": outputs_stat(blend_file, export_format)}
+            except (OSError, ValueError) as e:
+                results[export_format] = f"failed: {e}"  # E.g. an image the glTF points at doesn't exist
+                manifest.pop(export_format, None)
+        sidecar.update(blend_file, "exports", manifest)
+    return results
@@ -1,5 +1,12 @@
 import bpy
 import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+from .standard_map_names import aliases
+
+_RESOLUTION_SUFFIX = re.compile(r"^(?P<stem>.*[^_])_(?P<num>\d+)k$")
+_NORMAL_SUFFIX = re.compile(r"_(?P<map>nor_(gl|dx))$")
 
 
 def remove_extension(s):
@@ -7,27 +14,47 @@ def remove_extension(s):
 
 
 def remove_num(s):
-    if s[-1] == "k":
-        *parts, num = s[:-1].split("_")
-        if num.isdigit():
-            return "_".join(parts)
-    return s
+    match = _RESOLUTION_SUFFIX.match(s)
+    return match.group("stem") if match else s
 
 
-def get_map_name(fp, slug, removeNum=True, strict=True):
-    s = remove_extension(bpy.path.basename(fp))
-    s = remove_num(s) if removeNum else s
+# Parts of a texture file name, e.g. slug_normal_4k.png: slug "slug", map_name "normal" as written, map_type "nor_gl"
+# (the standard map name it's an alias of, see standard_map_names.py), resolution 4 (or None) and extension ".png"
+TextureName = namedtuple("TextureName", ["slug", "map_name", "map_type", "resolution", "extension"])
+
+
+@lru_cache(maxsize=4096)
+def classify_texture(fp, slug, strict=True, strip_resolution=True):
+    """
+    Split a texture file path into its parts, see TextureName. Results are memoized, as every check asks about the
+    same handful of files.
 
-    if strict and s.startswith(slug):
-        # strict assumes slug_map.ext, otherwise slug_part_map.ext
-        return s[len(slug) + 1 :].lower()
+    Args:
+        fp (str): File path or name of the texture
+        slug (str): The asset slug
+        strict (bool): Assume slug_map.ext, otherwise slug_part_map.ext is allowed too
+        strip_resolution (bool): Whether a _Nk suffix is split off or considered part of the map name
+    """
+    stem, extension = os.path.splitext(bpy.path.basename(fp))
+    resolution = None
+    match = _RESOLUTION_SUFFIX.match(stem) if strip_resolution else None
+    if match:
+        stem, resolution = match.group("stem"), int(match.group("num"))
 
-    if s.endswith("_nor_gl"):
-        return "nor_gl"
-    if s.endswith("_nor_dx"):
-        return "nor_dx"
+    if strict and stem.startswith(slug):
+        map_name = stem[len(slug) + 1 :].lower()
+        name_slug = slug
+    else:
+        match = _NORMAL_SUFFIX.search(stem)
+        map_name = match.group("map") if match else stem.split("_")[-1]
+        name_slug = stem[: -len(map_name)].rstrip("_") if len(stem) > len(map_name) else ""
 
-    return s.split("_")[-1]
+    map_type = aliases.get(map_name.lower(), map_name.lower())
+    return TextureName(name_slug, map_name, map_type, resolution, extension.lower())
+
+
+def get_map_name(fp, slug, removeNum=True, strict=True):
+    return classify_texture(fp, slug, strict, removeNum).map_name
 
 
 def get_slug():
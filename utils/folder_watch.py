@@ -0,0 +1,59 @@
+"""
+Notice when files are added to, removed from or renamed in a set of folders, by polling the folders' modification
+times on a timer. That's one stat per folder, however many files they contain.
+"""
+
+import bpy
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL = 2.0  # Seconds
+
+_watches = {}  # {name: (FolderWatch, callback)}
+
+
+def _mtime(folder):
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+class FolderWatch:
+    """Modification times of a set of folders as of when it was created"""
+
+    def __init__(self, folders):
+        self.mtimes = {folder: _mtime(folder) for folder in folders}
+
+    def changed(self):
+        return any(_mtime(folder) != mtime for folder, mtime in self.mtimes.items())
+
+
+def _poll():
+    for name, (folder_watch, callback) in list(_watches.items()):
+        if folder_watch.changed():
+            log.debug(f"Folders watched by '{name}' changed")
+            invalidate(name)
+    return POLL_INTERVAL if _watches else None
+
+
+def watch(name, folders, callback):
+    """Call `callback` once, as soon as any of the folders changes. Replaces any previous watch of the same name."""
+    _watches[name] = (FolderWatch(folders), callback)
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL, persistent=True)
+
+
+def invalidate(name):
+    """Stop watching and call the callback now, e.g. when the user asks for a refresh"""
+    folder_watch, callback = _watches.pop(name, (None, None))
+    if callback is not None:
+        callback()
+
+
+def stop():
+    _watches.clear()
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
@@ -0,0 +1,129 @@
+import bpy
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# Folders of the asset that are listed up front, relative to the folder of the blend file
+SCAN_DIRS = ("", "textures")
+MAX_WORKERS = 16
+
+
+def normalize(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class FsSnapshot:
+    """
+    What the asset folder looks like on disk, read with as few round trips as possible.
+
+    The asset folder and its textures folder are each listed with a single os.scandir, and any other paths (e.g. images
+    referenced from elsewhere) are stat'ed concurrently. Checks then answer exists/size questions from memory, which
+    matters on network drives where every stat is a round trip.
+    """
+
+    def __init__(self, root, paths=()):
+        self.root = root
+        self._listings = {}  # {normalized dir: [DirEntry, ...]}
+        self._names = {}  # {normalized dir: {normalized name: DirEntry}}
+        self._stats = {}  # {normalized path: os.stat_result or None if missing}
+        self.image_headers = None  # Headers of the textures folder, filled by utils/image_headers.py
+
+        if root:
+            for rel_dir in SCAN_DIRS:
+                self.listdir(os.path.join(root, rel_dir))
+        self.prefetch(paths)
+
+    def listdir(self, directory):
+        """Return the DirEntry objects of a folder, or an empty list if it can't be read"""
+        key = normalize(directory)
+        if key not in self._listings:
+            try:
+                with os.scandir(directory) as it:
+                    self._listings[key] = list(it)
+            except OSError:
+                self._listings[key] = []
+            self._names[key] = {os.path.normcase(entry.name): entry for entry in self._listings[key]}
+        return self._listings[key]
+
+    def _entry(self, path):
+        """Find a path in the listings of the folders scanned so far"""
+        key = normalize(path)
+        names = self._names.get(os.path.dirname(key))
+        if names is None:
+            return None, False
+        return names.get(os.path.basename(key)), True
+
+    def prefetch(self, paths):
+        """Stat all paths that aren't covered by a listing yet, in parallel"""
+        todo = {}
+        for path in paths:
+            key = normalize(path)
+            if key not in self._stats and not self._entry(path)[1]:
+                todo[key] = path
+        if not todo:
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(todo))) as pool:
+            for key, result in zip(todo, pool.map(_stat, todo.values())):
+                self._stats[key] = result
+        log.debug(f"Prefetched {len(todo)} paths")
+
+    def stat(self, path):
+        """Return the os.stat_result of a path, or None if it doesn't exist"""
+        key = normalize(path)
+        if key in self._stats:
+            return self._stats[key]
+        entry, listed = self._entry(path)
+        if listed:
+            result = None
+            if entry is not None:
+                try:
+                    result = entry.stat()
+                except OSError:
+                    pass
+        else:
+            result = _stat(path)
+        self._stats[key] = result
+        return result
+
+    def exists(self, path):
+        entry, listed = self._entry(path)
+        if listed:
+            return entry is not None  # No need to stat, the listing already tells us
+        return self.stat(path) is not None
+
+    def getsize(self, path):
+        """Size of a file in bytes, or None if it doesn't exist"""
+        result = self.stat(path)
+        return result.st_size if result is not None else None
+
+
+_current = None
+
+
+def build(paths=()):
+    """Snapshot the folder of the open blend file for a new check run, prefetching `paths` too"""
+    global _current
+    root = os.path.dirname(bpy.data.filepath) if bpy.data.filepath else None
+    _current = FsSnapshot(root, paths)
+    return _current
+
+
+def get():
+    """Return the snapshot of the current check run, or a fresh one when called outside of a run"""
+    if _current is None:
+        return FsSnapshot(os.path.dirname(bpy.data.filepath) if bpy.data.filepath else None)
+    return _current
+
+
+def clear():
+    global _current
+    _current = None
@@ -0,0 +1,199 @@
+"""
+Persistent index of texture file hashes, used to find identical files within an asset or across a whole library.
+
+Hashes are stored in an SQLite database in the user cache folder, keyed by path, size and modification time, so a file
+is only read again once it changes. Checks use hashes_or_pending(), which hashes new files in a background thread so a
+first run over gigabytes of maps doesn't stall the UI.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import user_cache
+from .image_headers import IMAGE_EXTENSIONS
+from .result_cache import file_hash
+
+log = logging.getLogger(__name__)
+
+DB_NAME = "texture_hashes.sqlite"
+MAX_WORKERS = 8
+
+_pending = set()  # Paths being hashed in the background
+_attempted = {}  # {path: (size, mtime_ns)} of files that were hashed in the background, successfully or not
+_lock = threading.Lock()
+_executor = None
+
+# Folders inside a library that never contain asset textures
+SKIP_DIRS = {"_upload", "_variants", "__pycache__", ".git"}
+
+
+def find_textures(root):
+    """Find every image file under a folder"""
+    paths = []
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for filename in sorted(files):
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
+                paths.append(os.path.join(folder, filename))
+    return paths
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _hash(path):
+    try:
+        return file_hash(path)
+    except OSError as e:
+        log.warning(f"Can't hash {path}: {e}")
+        return None
+
+
+class HashIndex:
+    """
+    Connection to the hash database. Use as a context manager:
+
+        with HashIndex() as index:
+            hashes = index.hashes(paths)
+    """
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or os.path.join(user_cache.cache_dir(), DB_NAME)
+        self.db = sqlite3.connect(self.db_file)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS files_hash ON files (hash)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _lookup(self, paths, stats):
+        """Split the files into those whose stored hash is current, {path: (size, hash)}, and [those to hash]"""
+        known = {}
+        cursor = self.db.cursor()
+        for i in range(0, len(paths), 500):
+            chunk = paths[i : i + 500]
+            query = f"SELECT path, size, mtime_ns, hash FROM files WHERE path IN ({','.join('?' * len(chunk))})"
+            for path, size, mtime_ns, digest in cursor.execute(query, chunk):
+                known[path] = (size, mtime_ns, digest)
+
+        results = {}
+        to_hash = []
+        for path, stat in stats.items():
+            if stat is None:
+                continue
+            row = known.get(path)
+            if row and row[:2] == (stat.st_size, stat.st_mtime_ns):
+                results[path] = (stat.st_size, row[2])
+            else:
+                to_hash.append(path)
+        return results, to_hash
+
+    def hashes(self, paths):
+        """
+        Return the content hash of every file, hashing (in parallel) only those that are new or changed.
+
+        Returns:
+            dict: {path: (size, hash)} for the files that exist
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            stats = dict(zip(paths, pool.map(_stat, paths)))
+            results, to_hash = self._lookup(paths, stats)
+
+            log.debug(f"Hashing {len(to_hash)} of {len(paths)} files")
+            rows = []
+            for path, digest in zip(to_hash, pool.map(_hash, to_hash)):
+                if digest is not None:
+                    stat = stats[path]
+                    results[path] = (stat.st_size, digest)
+                    rows.append((path, stat.st_size, stat.st_mtime_ns, digest))
+
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+        return results
+
+
+def _hash_in_background(paths):
+    try:
+        with HashIndex() as index:
+            index.hashes(paths)
+    except (OSError, sqlite3.Error) as e:
+        log.error(f"Failed to hash textures: {e}")
+    finally:
+        attempted = {path: (st.st_size, st.st_mtime_ns) for path, st in zip(paths, map(_stat, paths)) if st}
+        with _lock:
+            _attempted.update(attempted)
+            _pending.difference_update(paths)
+
+
+def hashes_or_pending(paths, wait=False):
+    """
+    Like HashIndex.hashes(), but files that are new or changed are hashed in a background thread, and None is returned
+    until they have been. Files that can't be read are left out, as HashIndex.hashes() does.
+
+    Args:
+        wait (bool): Hash right away instead, e.g. in background mode where there's no UI to keep responsive
+    """
+    global _executor
+    paths = [os.path.abspath(p) for p in paths]
+    with HashIndex() as index:
+        if wait:
+            return index.hashes(paths)
+        stats = {path: _stat(path) for path in paths}
+        results, to_hash = index._lookup(paths, stats)
+
+    with _lock:
+        to_hash = [p for p in to_hash if _attempted.get(p) != (stats[p].st_size, stats[p].st_mtime_ns)]
+        if not to_hash:
+            return results
+        todo = [p for p in to_hash if p not in _pending]
+        _pending.update(todo)
+        if todo:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hat_hash_index")
+            _executor.submit(_hash_in_background, todo)
+    return None
+
+
+def shutdown():
+    """Stop background hashing, files that are being hashed right now are finished"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    with _lock:
+        _pending.clear()
+
+
+def group_duplicates(hashes):
+    """
+    Group files with identical content.
+
+    Args:
+        hashes (dict): {path: (size, hash)} as returned by HashIndex.hashes()
+
+    Returns:
+        list: [(size, [paths]), ...] for each set of two or more identical files, largest files first
+    """
+    groups = {}
+    for path, (size, digest) in hashes.items():
+        groups.setdefault((size, digest), []).append(path)
+    duplicates = [(size, sorted(paths)) for (size, _digest), paths in groups.items() if len(paths) > 1]
+    duplicates.sort(key=lambda d: d[0], reverse=True)
+    return duplicates
@@ -0,0 +1,78 @@
+"""
+The collections of ID datablocks in bpy.data (objects, materials, images...).
+
+Found through RNA rather than dir(bpy.data), which also lists functions and non-ID properties like filepath. The list
+only depends on the Blender version, so it's looked up once per session.
+"""
+
+import bpy
+
+_names = None
+
+
+def _is_id_struct(struct):
+    while struct is not None:
+        if struct.identifier == "ID":
+            return True
+        struct = struct.base
+    return False
+
+
+def collection_names():
+    """Return the names of the bpy.data attributes that are ID collections, e.g. ("actions", "armatures", ...)"""
+    global _names
+    if _names is None:
+        _names = tuple(
+            prop.identifier
+            for prop in bpy.types.BlendData.bl_rna.properties
+            if prop.type == "COLLECTION" and _is_id_struct(prop.fixed_type)
+        )
+    return _names
+
+
+def iter_collections():
+    """Yield (attr, collection) for every ID collection in bpy.data"""
+    for attr in collection_names():
+        yield attr, getattr(bpy.data, attr)
+
+
+def iter_datablocks():
+    """Yield (attr, datablock) for every datablock in bpy.data"""
+    for attr, collection in iter_collections():
+        for block in collection:
+            yield attr, block
+
+
+def find_orphans(id_collections, user_map):
+    """
+    Find datablocks that are unused, including those only used by other unused datablocks (which a recursive purge
+    would remove as well).
+
+    Args:
+        id_collections (dict): {attr: [datablock, ...]}, e.g. SceneIndex.id_collections
+        user_map (dict): bpy.data.user_map()
+
+    Returns:
+        list: [(attr, datablock), ...] in the order of id_collections
+    """
+    attrs = {}
+    uses = {}  # The inverse of user_map: {datablock: [datablocks it uses]}
+    for attr, blocks in id_collections.items():
+        for block in blocks:
+            attrs[block] = attr
+    for block, users in user_map.items():
+        for user in users:
+            uses.setdefault(user, []).append(block)
+
+    orphans = {block for block in attrs if block.users == 0}
+    queue = list(orphans)
+    while queue:
+        for block in uses.get(queue.pop(), ()):
+            if block in orphans or block.use_fake_user or block not in attrs:
+                continue
+            users = user_map.get(block)
+            if users and users <= orphans:
+                orphans.add(block)
+                queue.append(block)
+
+    return [(attr, block) for attr, blocks in id_collections.items() for block in blocks if block in orphans]
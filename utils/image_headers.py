@@ -0,0 +1,216 @@
+"""
+Read the size, bit depth and channel count of image files from their headers, without decoding any pixels.
+
+Supports PNG, JPEG, OpenEXR, TIFF and Radiance HDR. Only the few bytes that hold this information are read, so
+inspecting every texture of an asset takes a handful of small reads per file, done in parallel.
+"""
+
+import logging
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from . import fs_snapshot
+
+log = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".exr", ".tif", ".tiff", ".hdr"}
+MAX_WORKERS = 16
+HEADER_SIZE = 64 * 1024  # EXR and HDR headers are parsed from this many bytes at the start of the file
+
+_cache = {}  # {path: (size, mtime_ns, ImageHeader or None)}
+
+
+class ImageHeader:
+    """What an image file's header says about it"""
+
+    __slots__ = ("format", "width", "height", "bit_depth", "channels")
+
+    def __init__(self, format, width, height, bit_depth, channels):
+        self.format = format
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth  # Per channel
+        self.channels = channels
+
+    def __repr__(self):
+        return f"<{self.format} {self.width}x{self.height} {self.channels}x{self.bit_depth}bit>"
+
+
+def _png(f):
+    data = f.read(26)
+    if len(data) < 26 or data[12:16] != b"IHDR":
+        return None
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", data[16:26])
+    channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(color_type)
+    if channels is None:
+        return None  # Not a color type the PNG spec defines, the file is corrupt
+    if color_type == 3:
+        bit_depth = 8  # Palette indices, the colors themselves are 8 bit
+    return ImageHeader("PNG", width, height, bit_depth, channels)
+
+
+def _jpeg(f):
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        kind = marker[1]
+        if kind == 0xFF:
+            f.seek(-1, os.SEEK_CUR)  # Fill byte
+            continue
+        if kind in (0x01, *range(0xD0, 0xD9)):
+            continue  # Markers without a segment
+        (length,) = struct.unpack(">H", f.read(2))
+        if 0xC0 <= kind <= 0xCF and kind not in (0xC4, 0xC8, 0xCC):
+            precision, height, width, channels = struct.unpack(">BHHB", f.read(6))
+            return ImageHeader("JPEG", width, height, precision, channels)
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _exr(f):
+    data = f.read(HEADER_SIZE)
+    pos = 8  # Magic number and version
+    width = height = None
+    bit_depth = channels = 0
+    while pos < len(data):
+        end = data.index(b"\0", pos)
+        name = data[pos:end]
+        if not name:
+            break  # End of the header
+        type_end = data.index(b"\0", end + 1)
+        (size,) = struct.unpack("<i", data[type_end + 1 : type_end + 5])
+        value = data[type_end + 5 : type_end + 5 + size]
+        pos = type_end + 5 + size
+        if name == b"dataWindow":
+            xmin, ymin, xmax, ymax = struct.unpack("<iiii", value)
+            width, height = xmax - xmin + 1, ymax - ymin + 1
+        elif name == b"channels":
+            i = 0
+            while i < len(value) and value[i] != 0:
+                i = value.index(b"\0", i) + 1
+                (pixel_type,) = struct.unpack("<i", value[i : i + 4])
+                bit_depth = max(bit_depth, 16 if pixel_type == 1 else 32)
+                channels += 1
+                i += 16  # pixel type, pLinear + reserved, x and y sampling
+    if width is None:
+        return None
+    return ImageHeader("OPEN_EXR", width, height, bit_depth, channels)
+
+
+def _tiff(f):
+    head = f.read(8)
+    byte_order = {b"II": "<", b"MM": ">"}.get(head[:2])
+    if byte_order is None:
+        return None
+    magic, offset = struct.unpack(byte_order + "HI", head[2:8])
+    if magic != 42:
+        return None  # BigTIFF isn't used for textures
+    f.seek(offset)
+    (count,) = struct.unpack(byte_order + "H", f.read(2))
+    entries = f.read(count * 12)
+    tags = {}
+    for i in range(count):
+        tag, value_type, value_count, value = struct.unpack(byte_order + "HHI4s", entries[i * 12 : i * 12 + 12])
+        tags[tag] = (value_type, value_count, value)
+
+    def first_value(tag, default=None):
+        if tag not in tags:
+            return default
+        value_type, value_count, value = tags[tag]
+        size, fmt = {3: (2, "H"), 4: (4, "I")}.get(value_type, (None, None))
+        if size is None:
+            return default
+        if value_count * size > 4:
+            # Doesn't fit in the entry, which holds an offset to the values instead
+            f.seek(struct.unpack(byte_order + "I", value)[0])
+            value = f.read(size)
+        return struct.unpack(byte_order + fmt, value[:size])[0]
+
+    width, height = first_value(256), first_value(257)
+    if width is None or height is None:
+        return None
+    return ImageHeader("TIFF", width, height, first_value(258, 1), first_value(277, 1))
+
+
+def _hdr(f):
+    lines = f.read(HEADER_SIZE).split(b"\n")
+    for i, line in enumerate(lines):
+        if not line.strip():
+            parts = lines[i + 1].split() if i + 1 < len(lines) else []
+            if len(parts) != 4:
+                return None
+            sizes = {parts[0][1:]: int(parts[1]), parts[2][1:]: int(parts[3])}
+            return ImageHeader("HDR", sizes[b"X"], sizes[b"Y"], 32, 3)
+    return None
+
+
+SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", _png),
+    (b"\xff\xd8", _jpeg),
+    (b"\x76\x2f\x31\x01", _exr),
+    (b"II*\0", _tiff),
+    (b"MM\0*", _tiff),
+    (b"#?", _hdr),
+]
+
+
+def read_header(path):
+    """Return the ImageHeader of an image file, or None if it can't be read or the format isn't supported"""
+    try:
+        with open(path, "rb") as f:
+            magic = f.read(8)
+            for signature, parse in SIGNATURES:
+                if magic.startswith(signature):
+                    f.seek(0)
+                    return parse(f)
+    except (OSError, ValueError, struct.error, KeyError, IndexError) as e:
+        log.debug(f"Failed to read image header of {path}: {e}")
+    return None
+
+
+def _read_cached(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = _cache.get(path)
+    if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+    header = read_header(path)
+    _cache[path] = (stat.st_size, stat.st_mtime_ns, header)
+    return header
+
+
+def read_headers(paths):
+    """
+    Read the headers of many files in parallel. Headers are remembered for the session and only read again once a file
+    changes.
+
+    Returns:
+        dict: {path: ImageHeader or None}
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as pool:
+        return dict(zip(paths, pool.map(_read_cached, paths)))
+
+
+def texture_headers():
+    """
+    Return the headers of every image file in the asset's textures folder, read once per check run.
+
+    Returns:
+        dict: {path: ImageHeader or None}, sorted by path
+    """
+    snapshot = fs_snapshot.get()
+    if snapshot.image_headers is None:
+        textures_dir = os.path.join(snapshot.root, "textures") if snapshot.root else None
+        paths = sorted(
+            entry.path
+            for entry in (snapshot.listdir(textures_dir) if textures_dir else [])
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+        )
+        snapshot.image_headers = read_headers(paths)
+    return snapshot.image_headers
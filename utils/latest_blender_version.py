@@ -0,0 +1,116 @@
+"""
+The latest official Blender version according to the PH Admin server.
+
+The lookup runs in a background thread with a short timeout and the answer is cached on disk, so reading it never
+blocks. It only happens when a check asks for the version, never in background mode (batch runs, workers) and only if
+the user allows Blender online access. Set the HAT_BLENDER_VERSION_URL environment variable to use a different
+endpoint, e.g. a local stand-in when working offline.
+"""
+
+import bpy
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from . import user_cache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_URL = "https://admin.polyhaven.com/api/public/blenderVersion"
+URL_ENV_VAR = "HAT_BLENDER_VERSION_URL"
+TIMEOUT = 5  # Seconds
+MAX_AGE = 6 * 60 * 60  # Seconds before a cached answer is looked up again
+RETRY_DELAY = 60  # Seconds to wait before retrying after a failed lookup
+
+_lock = threading.Lock()
+_thread = None
+_cached = None  # {"url": str, "version": str, "fetched_at": float}, as also stored on disk
+_error = None  # Error of the last failed lookup
+_failed_at = 0
+
+
+def endpoint():
+    return os.environ.get(URL_ENV_VAR) or DEFAULT_URL
+
+
+def _cache_file():
+    return os.path.join(user_cache.cache_dir(), "blender_version.json")
+
+
+def _load_cache():
+    global _cached
+    try:
+        with open(_cache_file(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get("url") == endpoint():
+            _cached = data
+    except (OSError, ValueError):
+        pass
+
+
+def _fetch(url):
+    global _cached, _error, _failed_at
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as response:
+            data = json.loads(response.read().decode("utf-8"))
+        entry = {"url": url, "version": data.get("version", "unknown"), "fetched_at": time.time()}
+    except Exception as e:
+        log.error("Error fetching Blender version: %s", e)
+        with _lock:
+            _error = str(e)
+            _failed_at = time.time()
+        return
+
+    with _lock:
+        _cached = entry
+        _error = None
+    try:
+        with open(_cache_file(), "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+    except OSError as e:
+        log.warning(f"Failed to cache Blender version: {e}")
+
+
+def disabled_reason():
+    """Why the version can't be looked up online in this session, or None if it can"""
+    if bpy.app.background:
+        return "Not looked up in background mode"
+    if not bpy.app.online_access:
+        return "Online access is disabled in Blender's preferences"
+    return None
+
+
+def refresh():
+    """Look up the latest version in the background, unless the cached answer is recent enough"""
+    global _thread
+    if disabled_reason():
+        return
+    with _lock:
+        if _cached is None:
+            _load_cache()
+        if _thread is not None and _thread.is_alive():
+            return
+        if _cached is not None and time.time() - _cached.get("fetched_at", 0) < MAX_AGE:
+            return
+        if time.time() - _failed_at < RETRY_DELAY:
+            return
+        _thread = threading.Thread(target=_fetch, args=(endpoint(),), name="hat_blender_version", daemon=True)
+        _thread.start()
+
+
+def get():
+    """
+    Return the latest known version without blocking, starting a lookup if needed.
+
+    Returns:
+        tuple: (version string or None if not known yet, error message of the last failed lookup or None)
+    """
+    refresh()
+    with _lock:
+        if _cached is None:
+            _load_cache()  # A recent enough answer may still be on disk while lookups are disabled
+        if _cached is None:
+            return None, _error or disabled_reason()
+        return _cached.get("version", "unknown"), _error
@@ -0,0 +1,94 @@
+import numpy as np
+from functools import cached_property
+
+# Vertices closer than this (in meters) count as duplicates, like Blender's default Merge by Distance
+MERGE_DISTANCE = 1e-5
+# Faces smaller than this (in square meters) count as zero area
+MIN_FACE_AREA = 1e-10
+
+
+def _read(collection, prop, dtype, size=1):
+    values = np.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(prop, values)
+    return values.reshape(-1, size) if size > 1 else values
+
+
+class MeshArrays:
+    """
+    Vertex, edge, loop and polygon data of a mesh as NumPy arrays.
+
+    Each array is read with a single foreach_get the first time it's needed, and the topology checks below work on
+    whole arrays at once so they stay fast on meshes with millions of faces. Get these from SceneIndex.mesh_arrays(),
+    which shares them between all checks of a run.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    @cached_property
+    def co(self):
+        return _read(self.mesh.vertices, "co", np.float32, 3)
+
+    @cached_property
+    def edge_verts(self):
+        return _read(self.mesh.edges, "vertices", np.int32, 2)
+
+    @cached_property
+    def loop_verts(self):
+        return _read(self.mesh.loops, "vertex_index", np.int32)
+
+    @cached_property
+    def loop_edges(self):
+        return _read(self.mesh.loops, "edge_index", np.int32)
+
+    @cached_property
+    def poly_area(self):
+        return _read(self.mesh.polygons, "area", np.float32)
+
+    @cached_property
+    def edge_face_count(self):
+        """Number of faces using each edge"""
+        return np.bincount(self.loop_edges, minlength=len(self.edge_verts))
+
+    def non_manifold_edges(self):
+        """Number of edges shared by more than two faces"""
+        return int(np.count_nonzero(self.edge_face_count > 2))
+
+    def wire_edges(self):
+        """Number of edges that aren't part of any face"""
+        return int(np.count_nonzero(self.edge_face_count == 0))
+
+    def zero_area_faces(self):
+        return int(np.count_nonzero(self.poly_area < MIN_FACE_AREA))
+
+    def loose_verts(self):
+        """Number of vertices not used by any edge"""
+        used = np.zeros(len(self.co), dtype=bool)
+        used[self.edge_verts.ravel()] = True
+        return int(np.count_nonzero(~used))
+
+    def duplicate_verts(self):
+        """
+        Number of vertices that would be removed by merging vertices within MERGE_DISTANCE.
+
+        Positions are snapped to a grid of that size, so a pair straddling a grid line is missed. That's a fair trade
+        for not having to compare every vertex with its neighbours.
+        """
+        if len(self.co) == 0:
+            return 0
+        grid = np.round(self.co / MERGE_DISTANCE).astype(np.int64)
+        return len(grid) - len(np.unique(grid, axis=0))
+
+    def inconsistent_normals(self):
+        """
+        Number of manifold edges whose two faces wind in the same direction, i.e. where one of the faces is flipped.
+
+        With consistent normals the two faces walk a shared edge in opposite directions, so the loops using that edge
+        start from different vertices.
+        """
+        shared = self.edge_face_count[self.loop_edges] == 2
+        edges = self.loop_edges[shared]
+        verts = self.loop_verts[shared]
+        order = np.argsort(edges, kind="stable")
+        pairs = verts[order].reshape(-1, 2)
+        return int(np.count_nonzero(pairs[:, 0] == pairs[:, 1]))
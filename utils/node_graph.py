@@ -0,0 +1,128 @@
+"""
+Model of a material's shader nodes as one graph, with node groups flattened into it.
+
+Links are read once per node tree and shared between the materials using it. Walking upstream from the active output
+through group boundaries tells which nodes actually contribute to the material, so chains that lead nowhere and nodes
+hidden inside groups are checked like any other node.
+"""
+
+import logging
+
+log = logging.getLogger(__name__)
+
+
+def _links_by_node(tree, cache):
+    """Return {node name: [(input identifier, from node, from socket), ...]} of a node tree, read once per run"""
+    key = tree.as_pointer()
+    if key not in cache:
+        links = {}
+        for link in tree.links:
+            if link.is_muted or not link.is_valid:
+                continue
+            upstream = (link.to_socket.identifier, link.from_node, link.from_socket)
+            links.setdefault(link.to_node.name, []).append(upstream)
+        cache[key] = links
+    return cache[key]
+
+
+def _active_output(tree, output_type):
+    for node in tree.nodes:
+        if node.type == output_type and node.is_active_output:
+            return node
+    return None
+
+
+class MaterialGraph:
+    """
+    A material's nodes, including those inside (nested) node groups, and which of them are reachable from the active
+    material output.
+
+    Nodes are listed once even if their group is used several times in the material. A node inside a group counts as
+    used if any instance of the group uses it.
+    """
+
+    def __init__(self, material, link_cache=None):
+        self.material = material
+        self.nodes = []  # Every node, group contents following their group node
+        self.output = None  # Active material output node
+        self._groups = {}  # {node pointer: (group node, ...)}, the group nodes a node is nested in
+        self._reachable = set()  # Node pointers
+        self._link_cache = {} if link_cache is None else link_cache
+
+        tree = material.node_tree
+        self._flatten(tree, (), set())
+        self.output = _active_output(tree, "OUTPUT_MATERIAL")
+        if self.output is not None:
+            self._walk(tree)
+
+    def _flatten(self, tree, groups, seen_trees):
+        for node in tree.nodes:
+            key = node.as_pointer()
+            if key in self._groups:
+                continue
+            self.nodes.append(node)
+            self._groups[key] = groups
+            if node.type == "GROUP" and node.node_tree and node.node_tree.as_pointer() not in seen_trees:
+                self._flatten(node.node_tree, groups + (node,), seen_trees | {node.node_tree.as_pointer()})
+
+    def _walk(self, tree):
+        # Each entry: (node, group nodes leading to it, only follow this input or None for all of them)
+        stack = [(self.output, (), None)]
+        seen = set()
+        while stack:
+            node, group_nodes, only_input = stack.pop()
+            key = (tuple(g.as_pointer() for g in group_nodes), node.as_pointer(), only_input)
+            if key in seen:
+                continue
+            seen.add(key)
+            self._reachable.add(node.as_pointer())
+
+            node_tree = group_nodes[-1].node_tree if group_nodes else tree
+            for input_id, from_node, from_socket in _links_by_node(node_tree, self._link_cache).get(node.name, ()):
+                if only_input is not None and input_id != only_input:
+                    continue
+                if from_node.type == "GROUP" and from_node.node_tree:
+                    # Into the group, continuing from whatever feeds the group output socket
+                    self._reachable.add(from_node.as_pointer())
+                    if any(g.node_tree == from_node.node_tree for g in group_nodes):
+                        continue  # Recursive group, Blender refuses to evaluate these anyway
+                    group_output = _active_output(from_node.node_tree, "GROUP_OUTPUT")
+                    if group_output is not None:
+                        stack.append((group_output, group_nodes + (from_node,), from_socket.identifier))
+                elif from_node.type == "GROUP_INPUT" and group_nodes:
+                    # Out of the group, continuing from whatever feeds the group node's input socket
+                    self._reachable.add(from_node.as_pointer())
+                    stack.append((group_nodes[-1], group_nodes[:-1], from_socket.identifier))
+                else:
+                    stack.append((from_node, group_nodes, None))
+
+    def nodes_of_type(self, *node_types):
+        return [node for node in self.nodes if node.type in node_types]
+
+    def in_group(self, node):
+        return bool(self._groups.get(node.as_pointer()))
+
+    def is_used(self, node):
+        """Whether the node contributes to the active material output"""
+        return node.as_pointer() in self._reachable
+
+    def unused(self):
+        """
+        Nodes with outputs that don't contribute to the material, directly or through other nodes. The contents of
+        unused groups aren't listed, only the group node itself.
+        """
+        if self.output is None:
+            return []  # Nothing is used, which is a problem of its own
+        unused = []
+        for node in self.nodes:
+            if not node.outputs or node.type == "GROUP_INPUT" or self.is_used(node):
+                continue
+            groups = self._groups.get(node.as_pointer(), ())
+            if groups and not self.is_used(groups[-1]):
+                continue
+            unused.append(node)
+        return unused
+
+    def name(self, node):
+        """The node's name, prefixed with the groups it's in, e.g. 'Group > Math'"""
+        return " > ".join([group.name for group in self._groups.get(node.as_pointer(), ())] + [node.name])
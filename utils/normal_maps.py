@@ -0,0 +1,199 @@
+"""
+Validate normal maps by looking at their pixels rather than trusting their file names.
+
+Maps are analyzed in background Blender workers (see utils/blender_pool.py), so even 8k maps don't stall the UI. While
+a map is being analyzed, analysis() returns None and the check reports it as pending. Vector lengths are measured on a
+grid of full resolution pixels and the green channel convention on a small box filtered proxy. With OpenImageIO
+available both are taken from a stream of scanline strips, so memory stays bounded even for 16k maps. Otherwise
+Blender loads the whole image.
+"""
+
+import bpy
+import logging
+import numpy as np
+import os
+import threading
+
+log = logging.getLogger(__name__)
+
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+
+PROXY_SIZE = 512  # Longest side of the downsampled copy that is analyzed
+STRIP_PIXELS = 4 * 1024 * 1024  # Roughly how many source pixels are held in memory at once
+# Below this ratio between the curl of the two conventions' height gradients, the convention is considered detected
+CONVENTION_RATIO = 0.8
+
+_results = {}  # {path: (size, mtime_ns, analysis)}
+_pending = set()
+_lock = threading.Lock()
+_pool = None
+
+
+def analyze(pixels, width, height, samples=None):
+    """
+    Compute statistics of a normal map.
+
+    The green channel convention is found by reconstructing the height gradient from the normals both ways: only
+    with the right convention is it the gradient of an actual surface, i.e. curl free.
+
+    Args:
+        pixels (np.ndarray): Flat RGBA floats in 0-1, bottom row first like Blender's Image.pixels
+        width (int): Width of the image
+        height (int): Height of the image
+        samples (np.ndarray): Optional (N, 4) full resolution pixels to measure vector lengths and directions on.
+            Downsampled pixels average neighbouring normals into shorter vectors, so only the curl uses `pixels` then.
+
+    Returns:
+        dict: {"unit_error": median deviation from unit length, "negative_blue": fraction of pixels pointing into the
+               surface, "convention": "GL", "DX" or None if undetermined, "curl_gl": float, "curl_dx": float}
+    """
+    normals = pixels.reshape(height, width, 4)[:, :, :3].astype(np.float32) * 2 - 1
+    sampled = normals.reshape(-1, 3) if samples is None else samples[:, :3].astype(np.float32) * 2 - 1
+    length = np.linalg.norm(sampled, axis=1)
+    z = np.maximum(normals[:, :, 2], 1e-3)
+    grad_u = -normals[:, :, 0] / z
+    grad_v = -normals[:, :, 1] / z  # OpenGL convention, green pointing up the image
+
+    # d(grad_u)/dv and d(grad_v)/du, rows go up the image (v) and columns to the right (u)
+    du_dv = np.diff(grad_u, axis=0)[:, :-1]
+    dv_du = np.diff(grad_v, axis=1)[:-1, :]
+    curl_gl = float(np.mean(np.abs(du_dv - dv_du))) if du_dv.size else 0.0
+    curl_dx = float(np.mean(np.abs(du_dv + dv_du))) if du_dv.size else 0.0
+
+    convention = None
+    if curl_gl < curl_dx * CONVENTION_RATIO:
+        convention = "GL"
+    elif curl_dx < curl_gl * CONVENTION_RATIO:
+        convention = "DX"
+
+    return {
+        "unit_error": float(np.median(np.abs(length - 1))),
+        "negative_blue": float(np.mean(sampled[:, 2] < 0)),
+        "convention": convention,
+        "curl_gl": curl_gl,
+        "curl_dx": curl_dx,
+    }
+
+
+def _rgba(pixels):
+    """Expand (rows, width, channels) pixels to RGBA like Blender does, grayscale to RGB and missing alpha to 1"""
+    channels = pixels.shape[2]
+    if channels == 4:
+        return pixels
+    rgba = np.ones(pixels.shape[:2] + (4,), dtype=np.float32)
+    rgba[..., :3] = pixels[..., :3] if channels >= 3 else pixels[..., :1]
+    return rgba
+
+
+def _reduce(block, step, proxy_width):
+    """Return (every step-th pixel, the box filtered proxy rows) of a block of rows starting at a multiple of step"""
+    samples = block[::step, ::step].reshape(-1, 4)
+    rows = block.shape[0] // step
+    proxy = block[: rows * step, : proxy_width * step].reshape(rows, step, proxy_width, step, 4).mean(axis=(1, 3))
+    return samples, proxy
+
+
+def _analyze_oiio(path, proxy_size):
+    image_input = oiio.ImageInput.open(path)
+    if image_input is None:
+        raise OSError(f"Can't read {path}: {oiio.geterror()}")
+    try:
+        spec = image_input.spec()
+        width, height, channels = spec.width, spec.height, spec.nchannels
+        step = max(1, -(-max(width, height) // proxy_size))  # Ceiling division
+        strip_rows = max(step, STRIP_PIXELS // width // step * step)
+        samples, proxy = [], []
+        for y in range(0, height, strip_rows):
+            strip = image_input.read_scanlines(0, 0, y, min(y + strip_rows, height), 0, 0, channels, "float")
+            strip_samples, strip_proxy = _reduce(_rgba(strip.reshape(-1, width, channels)), step, width // step)
+            samples.append(strip_samples)
+            proxy.append(strip_proxy)
+    finally:
+        image_input.close()
+    proxy = np.concatenate(proxy)[::-1]  # Bottom row first, like Blender's pixels
+    return analyze(proxy, proxy.shape[1], proxy.shape[0], np.concatenate(samples))
+
+
+def _analyze_bpy(path, proxy_size):
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        image.colorspace_settings.name = "Non-Color"
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(image)
+
+    step = max(1, -(-max(width, height) // proxy_size))  # Ceiling division
+    samples, proxy = _reduce(pixels.reshape(height, width, 4), step, width // step)
+    return analyze(proxy, proxy.shape[1], proxy.shape[0], samples)
+
+
+def analyze_file(path, proxy_size=PROXY_SIZE):
+    """
+    Load an image and analyze() it: vector lengths on every Nth full resolution pixel, the convention on a box filtered
+    proxy of about proxy_size. Runs in a worker, see utils/worker_tasks.py.
+    """
+    if oiio is not None:
+        return _analyze_oiio(path, proxy_size)
+    return _analyze_bpy(path, proxy_size)
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        from .blender_pool import BlenderPool
+
+        _pool = BlenderPool(workers=2)
+    return _pool
+
+
+def _store(path, stat, future):
+    with _lock:
+        _pending.discard(path)
+        try:
+            _results[path] = (stat.st_size, stat.st_mtime_ns, future.result())
+        except Exception as e:
+            log.error(f"Failed to analyze normal map {path}: {e}")
+            _results[path] = (stat.st_size, stat.st_mtime_ns, {"error": str(e)})
+
+
+def analysis(path):
+    """
+    Return the analysis of a normal map file, or None if it's still being computed.
+
+    The first call for a file (or after it changed) starts analyzing it in a background worker. In background mode,
+    e.g. in hat_batch.py workers, the file is analyzed right away instead.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return {"error": str(e)}
+    with _lock:
+        cached = _results.get(path)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        if path in _pending:
+            return None
+
+    if bpy.app.background:
+        result = analyze_file(path)
+        with _lock:
+            _results[path] = (stat.st_size, stat.st_mtime_ns, result)
+        return result
+
+    with _lock:
+        _pending.add(path)
+    future = _get_pool().submit("analyze_normal_map", path=path)
+    future.add_done_callback(lambda f: _store(path, stat, f))
+    return None
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
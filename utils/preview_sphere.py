@@ -0,0 +1,122 @@
+"""
+Build the displaced sphere that texture assets are previewed on in their glTF file.
+
+The mesh, its UVs and its displacement are computed with NumPy and written with foreach_set, at the density the
+exported sphere needs, instead of being modelled with operators, modifiers and edit mode.
+"""
+
+import bpy
+import logging
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+SEGMENTS = 256
+RINGS = 128
+DISP_PROXY_SIZE = 1024  # Longest side the displacement map is downsampled to before sampling it
+
+
+def sphere_mesh(segments=SEGMENTS, rings=RINGS):
+    """
+    Unit UV sphere with one vertex per pole. UVs are per face corner, U running from 0 to 2 around the sphere and V
+    from 0 to 1 from pole to pole, so square texels stay square.
+
+    Returns:
+        tuple: (vertex coordinates (N, 3), vertex UVs for sampling (N, 2), corner vertex indices, corner UVs (L, 2),
+                face loop starts)
+    """
+    theta = np.pi * np.arange(1, rings) / rings
+    phi = 2 * np.pi * np.arange(segments) / segments
+    rho = np.sin(theta)[:, None]
+    ring_co = np.stack(
+        [rho * np.cos(phi), rho * np.sin(phi), np.broadcast_to(-np.cos(theta)[:, None], (rings - 1, segments))],
+        axis=-1,
+    ).reshape(-1, 3)
+    co = np.concatenate([[[0, 0, -1], [0, 0, 1]], ring_co])
+
+    ring_i, ring_j = np.meshgrid(np.arange(1, rings), np.arange(segments), indexing="ij")
+    ring_uv = np.stack([2 * ring_j / segments, ring_i / rings], axis=-1).reshape(-1, 2)
+    vert_uv = np.concatenate([[[0, 0], [0, 1]], ring_uv])
+
+    # Face corners as (ring, segment) grid coordinates, faces counter-clockwise seen from outside
+    j = np.arange(segments)
+    quad_i, quad_j = (a.ravel() for a in np.meshgrid(np.arange(1, rings - 1), j, indexing="ij"))
+    bottom = [(j * 0, j), (j * 0 + 1, j + 1), (j * 0 + 1, j)]
+    quads = [(quad_i, quad_j), (quad_i, quad_j + 1), (quad_i + 1, quad_j + 1), (quad_i + 1, quad_j)]
+    top = [(j * 0 + rings - 1, j), (j * 0 + rings - 1, j + 1), (j * 0 + rings, j)]
+
+    corner_i = np.concatenate([np.stack([c[0] for c in part], axis=1).ravel() for part in (bottom, quads, top)])
+    corner_j = np.concatenate([np.stack([c[1] for c in part], axis=1).ravel() for part in (bottom, quads, top)])
+
+    vertex_index = np.where(
+        corner_i == 0, 0, np.where(corner_i == rings, 1, 2 + (corner_i - 1) * segments + corner_j % segments)
+    )
+    # Pole corners get the U of the middle of their triangle
+    pole_offset = np.where((corner_i == 0) | (corner_i == rings), 0.5, 0)
+    corner_uv = np.stack([2 * (corner_j + pole_offset) / segments, corner_i / rings], axis=-1)
+
+    loop_start = np.concatenate(
+        [3 * j, 3 * segments + 4 * np.arange(len(quad_i)), 3 * segments + 4 * len(quad_i) + 3 * j]
+    )
+    return co, vert_uv, vertex_index, corner_uv, loop_start
+
+
+def load_pixels(image, max_size=DISP_PROXY_SIZE):
+    """Return a downsampled copy of an image's pixels as a (height, width, 4) float array"""
+    proxy = image.copy()
+    try:
+        width, height = proxy.size
+        scale = max_size / max(width, height, 1)
+        if scale < 1:
+            width, height = max(1, round(width * scale)), max(1, round(height * scale))
+            proxy.scale(width, height)
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        proxy.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(proxy)
+    return pixels.reshape(height, width, 4)
+
+
+def sample(pixels, uv, repeat=(1, 1)):
+    """Bilinearly sample the RGB intensity of a tiling image at UV coordinates (N, 2)"""
+    height, width = pixels.shape[:2]
+    intensity = pixels[:, :, :3].mean(axis=2)
+    x = (uv[:, 0] * repeat[0] % 1) * width - 0.5
+    y = (uv[:, 1] * repeat[1] % 1) * height - 0.5
+    x0, y0 = np.floor(x), np.floor(y)
+    fx, fy = x - x0, y - y0
+    x0, y0 = x0.astype(int) % width, y0.astype(int) % height
+    x1, y1 = (x0 + 1) % width, (y0 + 1) % height
+    top = intensity[y0, x0] * (1 - fx) + intensity[y0, x1] * fx
+    bottom = intensity[y1, x0] * (1 - fx) + intensity[y1, x1] * fx
+    return top * (1 - fy) + bottom * fy
+
+
+def create(name, diameter, material, disp_image, strength, mid_level, repeat=(1, 1)):
+    """
+    Create a sphere object displaced like a Displace modifier would with this image, strength and midlevel.
+    The object isn't linked to any collection.
+    """
+    co, vert_uv, vertex_index, corner_uv, loop_start = sphere_mesh()
+
+    displacement = (sample(load_pixels(disp_image), vert_uv, repeat) - mid_level) * strength
+    # Pole vertices take the average displacement of the ring around them
+    displacement[:2] = [displacement[2 : 2 + SEGMENTS].mean(), displacement[-SEGMENTS:].mean()]
+    co = co * (diameter / 2 + displacement[:, None])
+    co = np.stack([co[:, 0], -co[:, 2], co[:, 1]], axis=1)  # Poles along Y, like earlier exports
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.add(len(vertex_index))
+    mesh.loops.foreach_set("vertex_index", vertex_index.astype(np.int32))
+    mesh.polygons.add(len(loop_start))
+    mesh.polygons.foreach_set("loop_start", loop_start.astype(np.int32))
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", corner_uv.astype(np.float32).ravel())
+    mesh.update(calc_edges=True)
+    mesh.shade_smooth()
+    mesh.materials.append(material)
+
+    log.debug(f"Created preview sphere with {len(co)} vertices and {len(loop_start)} faces")
+    return bpy.data.objects.new(name, mesh)
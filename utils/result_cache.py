@@ -0,0 +1,165 @@
+"""
+Persistent cache of check results, stored in the "checks" section of the asset's sidecar cache (utils/sidecar.py).
+
+Results are only reused when the blend file, its textures, the add-on version and the check's own source are
+unchanged since they were computed. Checks can opt out with `CACHEABLE = False`, e.g. when they depend on something
+other than the asset itself.
+
+Checks are passed around as operators.check.CheckInfo registry entries.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from . import fs_snapshot, sidecar
+
+log = logging.getLogger(__name__)
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_addon_version = None
+_check_versions = {}  # {check source file: source hash}
+_blend_hashes = {}  # {(path, size, mtime_ns): sha1} of blend files hashed during this session
+
+
+def addon_version():
+    global _addon_version
+    if _addon_version is None:
+        _addon_version = "unknown"
+        try:
+            with open(os.path.join(ADDON_DIR, "blender_manifest.toml"), "r", encoding="utf-8") as f:
+                match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.MULTILINE)
+            if match:
+                _addon_version = match.group(1)
+        except OSError as e:
+            log.error(f"Failed to read add-on version: {e}")
+    return _addon_version
+
+
+def check_version(check):
+    """Hash of the check module's source, so editing a check invalidates its cached results"""
+    path = check.path
+    if path not in _check_versions:
+        with open(path, "rb") as f:
+            _check_versions[path] = hashlib.sha1(f.read()).hexdigest()
+    return _check_versions[path]
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def blend_fingerprint(blend_file, previous=None):
+    """
+    Identify the blend file's contents. The file is only hashed when its size or mtime differ from `previous`, so
+    checking an unchanged file costs a single stat call.
+    """
+    st = os.stat(blend_file)
+    fingerprint = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    key = (blend_file, st.st_size, st.st_mtime_ns)
+    if previous and previous.get("size") == st.st_size and previous.get("mtime_ns") == st.st_mtime_ns:
+        fingerprint["sha1"] = previous.get("sha1")
+    elif key in _blend_hashes:
+        fingerprint["sha1"] = _blend_hashes[key]
+    else:
+        fingerprint["sha1"] = _blend_hashes[key] = file_hash(blend_file)
+    return fingerprint
+
+
+def textures_fingerprint(blend_file, image_paths, snapshot=None):
+    """
+    Size and mtime of every file in the textures folder and of each referenced image, so adding, removing or
+    overwriting any of them invalidates the results.
+
+    Args:
+        snapshot (fs_snapshot.FsSnapshot): Listing of the blend file's folder to read the stats from, if there is one
+    """
+    blend_dir = os.path.dirname(blend_file)
+    if snapshot is None:
+        snapshot = fs_snapshot.FsSnapshot(blend_dir, image_paths)
+    paths = set(image_paths)
+    paths.update(entry.path for entry in snapshot.listdir(os.path.join(blend_dir, "textures")) if entry.is_file())
+    files = {}
+    for path in sorted(paths):
+        st = snapshot.stat(path)
+        files[os.path.relpath(path, blend_dir).replace(os.sep, "/")] = [st.st_size, st.st_mtime_ns] if st else None
+    return files
+
+
+def lookup(blend_file, checks):
+    """
+    Return the cached results that are still valid for the given blend file.
+
+    Args:
+        blend_file (str): Path to the blend file
+        checks (dict): {check_name: CheckInfo}
+
+    Returns:
+        tuple: (asset_type or None, {check_name: (status, messages, targets)})
+    """
+    cache = sidecar.load(blend_file).get("checks")
+    if not cache or cache.get("addon_version") != addon_version():
+        return None, {}
+    try:
+        fingerprint = blend_fingerprint(blend_file, cache.get("blend"))
+    except OSError:
+        return None, {}
+    if fingerprint.get("sha1") != cache.get("blend", {}).get("sha1"):
+        return None, {}
+    # The blend file is unchanged, so it still references the images that were fingerprinted when storing
+    textures = cache.get("textures") or {}
+    image_paths = [os.path.join(os.path.dirname(blend_file), name) for name in textures]
+    if textures_fingerprint(blend_file, image_paths) != textures:
+        return None, {}
+
+    if fingerprint != cache.get("blend"):
+        # Touched but not changed, remember the new stat so we don't hash it again next time
+        cache["blend"] = fingerprint
+        sidecar.update(blend_file, "checks", cache)
+
+    results = {}
+    for check_name, entry in cache.get("results", {}).items():
+        check = checks.get(check_name)
+        if check and check.cacheable and entry.get("version") == check_version(check):
+            messages = entry["messages"]
+            targets = entry.get("targets") or [None] * len(messages)
+            results[check_name] = (entry["status"], messages, targets)
+    return cache.get("asset_type"), results
+
+
+def store(blend_file, asset_type, results, checks, image_paths, snapshot=None):
+    """
+    Save check results for the blend file as it currently is on disk, which references the images at image_paths. See
+    textures_fingerprint() for snapshot.
+    """
+    try:
+        fingerprint = blend_fingerprint(blend_file)
+    except OSError as e:
+        log.warning(f"Not caching results, can't read {blend_file}: {e}")
+        return
+    entries = {}
+    for check_name, (status, messages, targets) in results.items():
+        check = checks.get(check_name)
+        if check and check.cacheable and status != "PENDING":
+            entries[check_name] = {
+                "version": check_version(check),
+                "status": status,
+                "messages": messages,
+                "targets": targets,
+            }
+    sidecar.update(
+        blend_file,
+        "checks",
+        {
+            "addon_version": addon_version(),
+            "blend": fingerprint,
+            "textures": textures_fingerprint(blend_file, image_paths, snapshot),
+            "asset_type": asset_type,
+            "results": entries,
+        },
+    )
@@ -0,0 +1,172 @@
+"""
+In-memory model of check results.
+
+Results are stored in the scene's latest_tests property in a compact JSON form, so they are saved with the file, but
+are only decoded once per change: panels draw from the ResultStore that get_store() keeps for each scene.
+
+Checks may return (status, messages, targets), where targets holds the datablock each message is about (or None),
+in the same order as messages. Targets are kept as [collection, name] references, e.g. ["objects", "Cube"].
+"""
+
+import bpy
+import json
+from .change_tracker import COLLECTION_ID_TYPES
+
+FORMAT_VERSION = 2
+
+ID_TYPE_COLLECTIONS = {id_type: attr for attr, id_type in COLLECTION_ID_TYPES.items()}
+
+
+def id_ref(datablock):
+    """Turn a datablock into a JSON serializable [collection, name] reference"""
+    if datablock is None:
+        return None
+    attr = ID_TYPE_COLLECTIONS.get(datablock.id_type)
+    if attr is None:
+        return None
+    return [attr, datablock.name]
+
+
+def resolve_ref(ref):
+    """Find the datablock a [collection, name] reference points to, or None if it's gone"""
+    if not ref:
+        return None
+    collection = getattr(bpy.data, ref[0], None)
+    return collection.get(ref[1]) if collection is not None else None
+
+
+def normalize(result):
+    """
+    Turn what a check returns into (status, messages, targets), with targets as references.
+
+    Args:
+        result (tuple): (status, messages) or (status, messages, targets) where targets are datablocks or references
+
+    Returns:
+        tuple: (status, [messages], [reference or None, ...])
+    """
+    status, messages = result[0], list(result[1])
+    targets = list(result[2]) if len(result) > 2 else []
+    targets = [t if t is None or isinstance(t, (list, tuple)) else id_ref(t) for t in targets]
+    targets += [None] * (len(messages) - len(targets))
+    return status, messages, targets
+
+
+class CheckResult:
+    """A single message of a check"""
+
+    __slots__ = ("check", "status", "message", "target")
+
+    def __init__(self, check, status, message, target=None):
+        self.check = check
+        self.status = status
+        self.message = message
+        self.target = target
+
+
+class ResultStore:
+    """All results of one check run"""
+
+    __slots__ = ("records", "timings", "total_time", "running", "progress")
+
+    def __init__(self):
+        self.records = []  # [CheckResult, ...]
+        self.timings = []  # [(check_name, seconds or None if the result was reused), ...]
+        self.total_time = None
+        self.running = False
+        self.progress = (0, 0)
+
+    def add(self, check_name, result, seconds=None):
+        """Add the normalized result of a check, see normalize()"""
+        status, messages, targets = result
+        for message, target in zip(messages, targets):
+            self.records.append(CheckResult(check_name, status, message, target))
+        if not messages:
+            self.records.append(CheckResult(check_name, status, None))
+        if check_name:
+            self.timings.append((check_name, seconds))
+
+    def messages(self):
+        """Records that have a message, in order"""
+        return [r for r in self.records if r.message is not None]
+
+    def passed(self):
+        """Whether the only failure is the file having unsaved changes"""
+        return all(r.status == "SUCCESS" or r.message == "File contains unsaved changes" for r in self.records)
+
+    def encode(self):
+        checks = {}
+        for r in self.records:
+            checks.setdefault(r.check, [r.check, r.status, []])
+            if r.message is not None:
+                checks[r.check][2].append([r.message, r.target] if r.target else [r.message])
+        timings = dict(self.timings)
+        return json.dumps(
+            {
+                "v": FORMAT_VERSION,
+                "checks": [[name, status, timings.get(name), messages] for name, status, messages in checks.values()],
+                "total_time": self.total_time,
+                "running": self.running,
+                "progress": list(self.progress),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def decode(cls, serialized):
+        """Return the ResultStore encoded by encode(), or None if it's in a format this version doesn't know"""
+        store = cls()
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            # Stored by HAT 1.1 and older: [[status, [messages]], ...]
+            for status, messages in data:
+                store.add("", (status, messages, [None] * len(messages)))
+            return store
+        if data.get("v") != FORMAT_VERSION:
+            return None  # Stored by a newer HAT, treat it like having no results
+        for name, status, seconds, messages in data["checks"]:
+            store.add(
+                name,
+                (status, [m[0] for m in messages], [m[1] if len(m) > 1 else None for m in messages]),
+                seconds,
+            )
+        store.total_time = data.get("total_time")
+        store.running = data.get("running", False)
+        store.progress = tuple(data.get("progress", (len(store.timings), len(store.timings))))
+        return store
+
+
+_stores = {}  # {scene pointer: (revision, ResultStore)}
+
+
+def publish(scene, store):
+    """Save a store to the scene, and keep it so that drawing doesn't have to decode it again"""
+    props = scene.hat_props
+    props.latest_tests = store.encode()
+    props.latest_tests_revision += 1
+    _stores[scene.as_pointer()] = (props.latest_tests_revision, store)
+
+
+def get_store(scene):
+    """
+    Return the ResultStore of a scene's latest tests, decoding them only if they changed since the last call.
+
+    Returns None if there are no results or they can't be decoded.
+    """
+    props = scene.hat_props
+    key = scene.as_pointer()
+    cached = _stores.get(key)
+    if cached is not None and cached[0] == props.latest_tests_revision:
+        return cached[1]
+    store = None
+    if props.latest_tests:
+        try:
+            store = ResultStore.decode(props.latest_tests)
+        except (ValueError, KeyError, TypeError, IndexError):
+            store = None
+    _stores[key] = (props.latest_tests_revision, store)
+    return store
+
+
+def clear():
+    _stores.clear()
@@ -0,0 +1,125 @@
+import bpy
+import logging
+from . import id_collections
+from .mesh_arrays import MeshArrays
+from .node_graph import MaterialGraph
+from .transforms import ObjectTransforms
+
+log = logging.getLogger(__name__)
+
+
+class SceneIndex:
+    """
+    Single pass over bpy.data, grouping the datablocks that checks look at.
+
+    Built once at the start of a check run so that each check reads from these lists instead of walking bpy.data
+    itself. Total check time then grows with the size of the scene rather than with size * number of checks.
+    """
+
+    def __init__(self):
+        self.id_collections = {}  # {"materials": [Material, ...], ...} for every ID collection in bpy.data
+        self.objects = []
+        self.objects_by_type = {}  # {"MESH": [Object, ...], ...}
+        self.images = []
+        self.node_materials = []  # Materials that use nodes
+        self.material_graphs = {}  # {Material: MaterialGraph} for every node material, see utils/node_graph.py
+        self.material_nodes = []  # [(Material, Node), ...] for every node in every node material, including groups
+        self.material_nodes_by_type = {}  # {"MATH": [(Material, Node), ...], ...}
+        self.texture_images = []  # Images used by material image nodes, one per file path
+        self._transforms = None
+        self._user_map = None
+        self._mesh_arrays = {}  # {mesh pointer: MeshArrays}
+
+        self._build()
+
+    def _build(self):
+        for attr, collection in id_collections.iter_collections():
+            self.id_collections[attr] = list(collection)
+
+        self.objects = self.id_collections.get("objects", [])
+        for obj in self.objects:
+            self.objects_by_type.setdefault(obj.type, []).append(obj)
+
+        self.images = self.id_collections.get("images", [])
+
+        checked_files = set()
+        link_cache = {}  # Shared so each node group's links are read once
+        for mat in self.id_collections.get("materials", []):
+            if not mat.use_nodes or not mat.node_tree:
+                continue
+            self.node_materials.append(mat)
+            graph = self.material_graphs[mat] = MaterialGraph(mat, link_cache)
+            for node in graph.nodes:
+                self.material_nodes.append((mat, node))
+                self.material_nodes_by_type.setdefault(node.type, []).append((mat, node))
+                if node.type == "TEX_IMAGE" and node.image and node.image.filepath:
+                    if node.image.filepath not in checked_files:
+                        checked_files.add(node.image.filepath)
+                        self.texture_images.append(node.image)
+
+        log.debug(
+            f"Indexed {len(self.id_collections)} ID collections, {len(self.objects)} objects, "
+            f"{len(self.node_materials)} node materials, {len(self.material_nodes)} material nodes"
+        )
+
+    @property
+    def user_map(self):
+        """bpy.data.user_map(), computed on first use"""
+        if self._user_map is None:
+            self._user_map = bpy.data.user_map()
+        return self._user_map
+
+    @property
+    def transforms(self):
+        """Transforms of all objects as NumPy arrays, read on first use. See utils/transforms.py"""
+        if self._transforms is None:
+            self._transforms = ObjectTransforms(self.objects, [obj.type for obj in self.objects])
+        return self._transforms
+
+    def object_meshes(self):
+        """Meshes used by mesh objects, each once"""
+        meshes = {}
+        for obj in self.objects_by_type.get("MESH", []):
+            meshes.setdefault(obj.data.as_pointer(), obj.data)
+        return list(meshes.values())
+
+    def mesh_arrays(self, mesh):
+        """Vertex/edge/loop/polygon arrays of a mesh, read once per run. See utils/mesh_arrays.py"""
+        key = mesh.as_pointer()
+        if key not in self._mesh_arrays:
+            self._mesh_arrays[key] = MeshArrays(mesh)
+        return self._mesh_arrays[key]
+
+    def nodes_of_type(self, *node_types):
+        """Return [(Material, Node), ...] for all material nodes of the given types"""
+        if len(node_types) == 1:
+            return self.material_nodes_by_type.get(node_types[0], [])
+        return [(mat, node) for mat, node in self.material_nodes if node.type in node_types]
+
+    def objects_of_type(self, *object_types):
+        objects = []
+        for object_type in object_types:
+            objects += self.objects_by_type.get(object_type, [])
+        return objects
+
+
+_current = None
+
+
+def build():
+    """Build the index for a new check run. Checks calling get() will share it until clear() is called."""
+    global _current
+    _current = SceneIndex()
+    return _current
+
+
+def get():
+    """Return the index of the current check run, or a fresh one when called outside of a run"""
+    if _current is None:
+        return SceneIndex()
+    return _current
+
+
+def clear():
+    global _current
+    _current = None
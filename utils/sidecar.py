@@ -0,0 +1,39 @@
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".hat-cache.json"
+
+
+def sidecar_path(blend_file):
+    """slug/slug.blend -> slug/slug.hat-cache.json"""
+    return os.path.splitext(blend_file)[0] + SIDECAR_SUFFIX
+
+
+def load(blend_file):
+    """Return the contents of the blend file's sidecar cache, or an empty dict if there is none"""
+    try:
+        with open(sidecar_path(blend_file), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log.warning(f"Ignoring unreadable cache {sidecar_path(blend_file)}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def update(blend_file, section, value):
+    """Replace one top level section of the sidecar cache, leaving the others untouched"""
+    data = load(blend_file)
+    data[section] = value
+    path = sidecar_path(blend_file)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning(f"Failed to write cache {path}: {e}")
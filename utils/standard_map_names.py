@@ -15,6 +15,7 @@ names = {
 
 aliases = {
     "diffuse": "diff",
+    "diffuse_color": "diff",
     "dif": "diff",
     "alb": "diff",
     "albedo": "diff",
@@ -27,6 +28,7 @@ aliases = {
     "nor": "nor_gl",
     "norm": "nor_gl",
     "normal": "nor_gl",
+    "normals": "nor_gl",
     "height": "disp",
     "displacement": "disp",
     "transparent": "alpha",
@@ -0,0 +1,227 @@
+"""
+Write the lower resolution and web format variants of an asset's textures (slug_diff_2k.jpg...) into its _variants
+folder.
+
+Each map type is filtered the way its data needs: color maps are averaged in linear light, normal maps are averaged as
+vectors and renormalized, and displacement and other data maps are averaged as the plain values they are. With
+OpenImageIO available the source is streamed a strip of scanlines at a time, so memory stays bounded even for 16k maps.
+Otherwise Blender loads the whole image and scales it itself.
+
+Maps are processed in parallel by background Blender workers (see utils/blender_pool.py), and variants that are newer
+than their source are skipped.
+"""
+
+import bpy
+import logging
+import math
+import numpy as np
+import os
+from .filename_utils import classify_texture, remove_num
+from .image_headers import read_headers
+
+log = logging.getLogger(__name__)
+
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+
+VARIANTS_DIR = "_variants"
+RESOLUTIONS = (1, 2, 4, 8)  # k
+FORMATS = {"png": ".png", "jpg": ".jpg", "webp": ".webp"}
+SOURCE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tif", ".tiff"}
+QUALITY = 95  # JPEG and WebP
+STRIP_PIXELS = 4 * 1024 * 1024  # Roughly how many source pixels are held in memory at once
+
+COLOR_MAPS = {"diff", "emission"}
+NORMAL_MAPS = {"nor_gl", "nor_dx"}
+
+
+def filter_kind(map_type):
+    if map_type in COLOR_MAPS:
+        return "color"
+    if map_type in NORMAL_MAPS:
+        return "normal"
+    return "data"
+
+
+def srgb_to_linear(c):
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(c):
+    return np.where(c <= 0.0031308, c * 12.92, 1.055 * np.power(np.maximum(c, 0), 1 / 2.4) - 0.055)
+
+
+def renormalize(pixels):
+    """Make the RGB encoded vectors of a normal map unit length again"""
+    vectors = pixels[..., :3] * 2 - 1
+    length = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    pixels[..., :3] = vectors / np.maximum(length, 1e-6) * 0.5 + 0.5
+    return pixels
+
+
+def downscale(block, factor, kind):
+    """
+    Box filter a block of rows by an integer factor.
+
+    Args:
+        block (np.ndarray): (rows, width, channels) floats in 0-1, rows and width divisible by factor
+        factor (int): Downscaling factor
+        kind (str): "color", "normal" or "data", see filter_kind()
+    """
+    if factor == 1:
+        return block
+    rows, width, channels = block.shape
+    color_channels = min(channels, 3)
+    if kind == "color":
+        block = block.copy()
+        block[..., :color_channels] = srgb_to_linear(block[..., :color_channels])
+    reduced = block.reshape(rows // factor, factor, width // factor, factor, channels).mean(axis=(1, 3))
+    if kind == "color":
+        reduced[..., :color_channels] = linear_to_srgb(reduced[..., :color_channels])
+    elif kind == "normal" and channels >= 3:
+        renormalize(reduced)
+    return np.clip(reduced, 0, 1)
+
+
+def plan(asset_dir, resolutions=RESOLUTIONS, formats=("png", "jpg")):
+    """
+    Work out which variants of the textures in asset_dir/textures are missing or older than their source. Only
+    reads image headers.
+
+    Returns:
+        list: [{"source": path, "outputs": [[resolution, format, path], ...]}, ...]
+    """
+    textures_dir = os.path.join(asset_dir, "textures")
+    try:
+        names = sorted(os.listdir(textures_dir))
+    except OSError:
+        return []
+    sources = [
+        os.path.join(textures_dir, name) for name in names if os.path.splitext(name)[1].lower() in SOURCE_EXTENSIONS
+    ]
+    variants_dir = os.path.join(asset_dir, VARIANTS_DIR)
+
+    jobs = []
+    for source, header in read_headers(sources).items():
+        if header is None:
+            continue
+        long_side = max(header.width, header.height)
+        source_mtime = os.stat(source).st_mtime_ns
+        stem, source_ext = os.path.splitext(os.path.basename(source))
+        outputs = []
+        for resolution in resolutions:
+            factor, remainder = divmod(long_side, resolution * 1024)
+            if factor < 1 or remainder or header.width % factor or header.height % factor:
+                continue
+            for export_format in formats:
+                if factor == 1 and FORMATS[export_format] == source_ext.lower():
+                    continue  # That's the source itself
+                output = os.path.join(variants_dir, f"{remove_num(stem)}_{resolution}k{FORMATS[export_format]}")
+                try:
+                    if os.stat(output).st_mtime_ns >= source_mtime:
+                        continue
+                except OSError:
+                    pass
+                outputs.append([resolution, export_format, output])
+        if outputs:
+            jobs.append({"source": source, "outputs": outputs})
+    return jobs
+
+
+def _output_spec(width, height, channels, export_format, bit_depth):
+    if export_format != "png":
+        channels = min(channels, 3)  # No alpha in JPEG, and WebP variants are for opaque maps
+    spec = oiio.ImageSpec(width, height, channels, "uint16" if export_format == "png" and bit_depth > 8 else "uint8")
+    if export_format == "jpg":
+        spec.attribute("Compression", f"jpeg:{QUALITY}")
+    elif export_format == "webp":
+        spec.attribute("Compression", f"webp:{QUALITY}")
+    return spec
+
+
+def _generate_oiio(source, outputs, kind):
+    image_input = oiio.ImageInput.open(source)
+    if image_input is None:
+        raise OSError(f"Can't read {source}: {oiio.geterror()}")
+    targets = []
+    try:
+        spec = image_input.spec()
+        width, height, channels = spec.width, spec.height, spec.nchannels
+        bit_depth = 16 if spec.format.size() > 1 else 8
+        long_side = max(width, height)
+        for resolution, export_format, path in outputs:
+            factor = long_side // (resolution * 1024)
+            out_spec = _output_spec(width // factor, height // factor, channels, export_format, bit_depth)
+            image_output = oiio.ImageOutput.create(path)
+            if image_output is None or not image_output.open(path + ".tmp", out_spec):
+                raise OSError(f"Can't write {path}: {oiio.geterror()}")
+            targets.append((factor, out_spec.nchannels, image_output, path))
+
+        # Strips are a multiple of every factor tall, so each one downscales to whole rows
+        step = math.lcm(*(factor for factor, *_ in targets))
+        strip_rows = max(step, STRIP_PIXELS // width // step * step)
+        for y in range(0, height, strip_rows):
+            strip = image_input.read_scanlines(0, 0, y, min(y + strip_rows, height), 0, 0, channels, "float")
+            strip = strip.reshape(-1, width, channels)
+            for factor, out_channels, image_output, path in targets:
+                rows = downscale(strip, factor, kind)[..., :out_channels]
+                image_output.write_scanlines(y // factor, y // factor + rows.shape[0], 0, np.ascontiguousarray(rows))
+        while targets:
+            factor, out_channels, image_output, path = targets.pop()
+            image_output.close()
+            os.replace(path + ".tmp", path)
+    finally:
+        image_input.close()
+        # Only left over if something failed, don't leave half written files behind
+        for factor, out_channels, image_output, path in targets:
+            image_output.close()
+            try:
+                os.remove(path + ".tmp")
+            except OSError:
+                pass
+
+
+BPY_FORMATS = {"png": "PNG", "jpg": "JPEG", "webp": "WEBP"}
+
+
+def _generate_bpy(source, outputs, kind):
+    # Largest first, so each variant is scaled down from the previous one
+    outputs = sorted(outputs, key=lambda o: -o[0])
+    image = bpy.data.images.load(source, check_existing=False)
+    try:
+        image.colorspace_settings.name = "Non-Color"  # Write the values back exactly as they were read
+        width, height = image.size
+        long_side = max(width, height)
+        for resolution, export_format, path in outputs:
+            factor = long_side // (resolution * 1024)
+            if tuple(image.size) != (width // factor, height // factor):
+                image.scale(width // factor, height // factor)
+            if kind == "normal" and image.channels >= 3:
+                pixels = np.empty(len(image.pixels), dtype=np.float32)
+                image.pixels.foreach_get(pixels)
+                image.pixels.foreach_set(renormalize(pixels.reshape(-1, image.channels)).ravel())
+            image.file_format = BPY_FORMATS[export_format]
+            image.save(filepath=path + ".tmp", quality=QUALITY)
+            os.replace(path + ".tmp", path)
+    finally:
+        bpy.data.images.remove(image)
+
+
+def generate(source, outputs, slug=""):
+    """
+    Write the variants of one texture. Runs in a worker, see utils/worker_tasks.py.
+
+    Args:
+        source (str): Path of the source map
+        outputs (list): [[resolution, format, path], ...] as planned by plan()
+        slug (str): Asset slug, used to tell the map type from the file name
+    """
+    kind = filter_kind(classify_texture(source, slug, strict=bool(slug)).map_type)
+    os.makedirs(os.path.dirname(outputs[0][2]), exist_ok=True)
+    if oiio is not None:
+        _generate_oiio(source, outputs, kind)
+    else:
+        _generate_bpy(source, outputs, kind)
+    return [path for resolution, export_format, path in outputs]
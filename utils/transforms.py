@@ -0,0 +1,102 @@
+import bpy
+import numpy as np
+
+TOLERANCE = 1e-5
+
+# Number of floats per object of each property read with foreach_get
+SIZES = {
+    "location": 3,
+    "scale": 3,
+    "rotation_euler": 3,
+    "rotation_quaternion": 4,
+    "rotation_axis_angle": 4,
+    "matrix_basis": 16,
+    "matrix_parent_inverse": 16,
+    "delta_location": 3,
+    "delta_scale": 3,
+    "delta_rotation_euler": 3,
+    "delta_rotation_quaternion": 4,
+}
+
+
+class ObjectTransforms:
+    """
+    Object transforms as NumPy arrays, one row per object in the same order as `objects`.
+
+    Each property is read for all objects at once with a single foreach_get the first time it's needed. Checks find the
+    offending objects with array operations and only touch those objects through RNA, which keeps scatter assets with
+    tens of thousands of objects fast.
+    """
+
+    def __init__(self, objects, types):
+        self.objects = objects
+        self.types = np.array(types, dtype=str)
+        self._arrays = {}
+
+    def get(self, prop):
+        """Return an (objects, size) array of a transform property"""
+        if prop not in self._arrays:
+            count, size = len(self.objects), SIZES[prop]
+            values = np.empty(count * size, dtype=np.float32)
+            if count == len(bpy.data.objects):
+                bpy.data.objects.foreach_get(prop, values)
+            else:
+                # Not indexing all of bpy.data.objects, read one by one (matrices column major, like foreach_get)
+                for i, obj in enumerate(self.objects):
+                    values[i * size : (i + 1) * size] = np.array(getattr(obj, prop)).T.ravel()
+            self._arrays[prop] = values.reshape(count, size)
+        return self._arrays[prop]
+
+    def of_type(self, include=None, exclude=()):
+        """Boolean mask of objects whose type is in `include` (all if None) and not in `exclude`"""
+        mask = np.ones(len(self.objects), dtype=bool) if include is None else np.isin(self.types, list(include))
+        if exclude:
+            mask &= ~np.isin(self.types, list(exclude))
+        return mask
+
+    def select(self, mask):
+        """Turn a boolean mask back into the list of objects it selects"""
+        return [self.objects[i] for i in np.flatnonzero(mask)]
+
+    def unapplied_scale(self):
+        return np.any(np.abs(self.get("scale") - 1) > TOLERANCE, axis=1)
+
+    def off_origin(self):
+        return np.any(np.abs(self.get("location")) > TOLERANCE, axis=1)
+
+    def unapplied_rotation(self):
+        """Objects that have a rotation of their own. Delta rotation isn't counted, see delta_transforms()."""
+        # Only objects whose basis matrix with its (delta) scale divided out isn't identity are rotated at all
+        # Column major, so [:, i] is the i-th column: the i-th rotated axis times scale[i] * delta_scale[i]
+        rotation_scale = self.get("matrix_basis").reshape(-1, 4, 4)[:, :3, :3]
+        scale = self.get("scale") * self.get("delta_scale")
+        scale = np.where(np.abs(scale) > TOLERANCE, scale, 1)  # Zero scale says nothing about rotation
+        rotation = rotation_scale / scale[:, :, None]
+        rotated = np.any(np.abs(rotation - np.identity(3, dtype=np.float32)) > TOLERANCE, axis=(1, 2))
+
+        # Of those, which have a rotation in the properties their rotation mode uses
+        euler = np.any(np.abs(self.get("rotation_euler")) > TOLERANCE, axis=1)
+        quaternion = self.get("rotation_quaternion")
+        quaternion_length = np.maximum(np.linalg.norm(quaternion, axis=1), TOLERANCE)
+        quaternion = np.abs(quaternion[:, 0]) / quaternion_length < 1 - TOLERANCE
+        axis_angle = self.get("rotation_axis_angle")  # Angle, then axis
+        axis_angle = (np.abs(axis_angle[:, 0]) > TOLERANCE) & (np.linalg.norm(axis_angle[:, 1:], axis=1) > TOLERANCE)
+        by_mode = {"QUATERNION": quaternion, "AXIS_ANGLE": axis_angle}
+        result = np.zeros(len(self.objects), dtype=bool)
+        for i in np.flatnonzero(rotated):
+            result[i] = by_mode.get(self.objects[i].rotation_mode, euler)[i]
+        return result
+
+    def delta_transforms(self):
+        identity_quaternion = np.array([1, 0, 0, 0], dtype=np.float32)
+        return (
+            np.any(np.abs(self.get("delta_location")) > TOLERANCE, axis=1)
+            | np.any(np.abs(self.get("delta_scale") - 1) > TOLERANCE, axis=1)
+            | np.any(np.abs(self.get("delta_rotation_euler")) > TOLERANCE, axis=1)
+            | np.any(np.abs(self.get("delta_rotation_quaternion") - identity_quaternion) > TOLERANCE, axis=1)
+        )
+
+    def parent_inverse(self):
+        """Objects whose parent inverse matrix isn't identity. Whether they actually have a parent isn't checked."""
+        identity = np.identity(4, dtype=np.float32).ravel()
+        return np.any(np.abs(self.get("matrix_parent_inverse") - identity) > TOLERANCE, axis=1)
@@ -0,0 +1,20 @@
+import logging
+import os
+import tempfile
+
+log = logging.getLogger(__name__)
+
+ADDON_PACKAGE = __package__.rpartition(".")[0]
+
+
+def cache_dir():
+    """Per-user folder for HAT's caches, which survives add-on updates"""
+    try:
+        import bpy
+
+        return bpy.utils.extension_path_user(ADDON_PACKAGE, path="cache", create=True)
+    except (ImportError, ValueError, RuntimeError):
+        # Not installed as an extension, e.g. imported by hat_batch.py from a checkout
+        path = os.path.join(tempfile.gettempdir(), "polyhaven_hat", "cache")
+        os.makedirs(path, exist_ok=True)
+        return path
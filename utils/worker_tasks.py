@@ -0,0 +1,66 @@
+"""
+Tasks that can be run in background Blender workers, see utils/blender_pool.py and hat_batch.py.
+
+Task arguments and return values must be JSON serializable.
+"""
+
+import bpy
+import logging
+from . import arm_packing, export_pipeline, normal_maps, texture_variants
+from .filename_utils import get_slug
+
+log = logging.getLogger(__name__)
+
+TASKS = {}
+
+
+def task(fn):
+    TASKS[fn.__name__] = fn
+    return fn
+
+
+def check_file_result(blend_file, slug, asset_type, results):
+    return {
+        "file": blend_file,
+        "slug": slug,
+        "asset_type": asset_type,
+        "results": [
+            {"check": check_name, "status": status, "messages": messages, "targets": targets}
+            for check_name, (status, messages, targets) in results.items()
+        ],
+    }
+
+
+@task
+def check_file(blend_file, skip=("unsaved",)):
+    """Open a blend file and run all checks on it"""
+    from ..operators import check
+
+    bpy.ops.wm.open_mainfile(filepath=blend_file, load_ui=False)
+    slug = get_slug()
+    results = check.run_checks(slug, skip=skip, use_cache=True)
+    return check_file_result(blend_file, slug, bpy.context.scene.hat_props.asset_type, results)
+
+
+@task
+def analyze_normal_map(path):
+    """Analyze the pixels of a normal map, see utils/normal_maps.py"""
+    return normal_maps.analyze_file(path)
+
+
+@task
+def pack_arm(sources, output):
+    """Pack AO, roughness and metalness maps into an ARM image, see utils/arm_packing.py"""
+    return arm_packing.pack(sources, output)
+
+
+@task
+def export_file(blend_file, formats, force=False):
+    """Export a blend file to the given formats, see utils/export_pipeline.py"""
+    return export_pipeline.export(blend_file, formats, force=force)
+
+
+@task
+def make_texture_variants(source, outputs, slug=""):
+    """Write the resolution and format variants of a texture, see utils/texture_variants.py"""
+    return texture_variants.generate(source, outputs, slug)